@@ -1,20 +1,95 @@
 import os
 
 from dotenv import load_dotenv
-from pymongo import MongoClient
+from pymongo import AsyncMongoClient, MongoClient
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import NullPool
+
+from app.utils.metrics import register_metrics
+from app.utils.pool_statistics import PoolStatistics, get_pool_options
 
 load_dotenv()
 
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "mysql": "mysql+aiomysql",
+}
+
+
+def get_async_database_url(database_url: str) -> str:
+    """
+    Returns the asyncio driver version of a synchronous SQLAlchemy URL.
+    """
+    url = make_url(database_url)
+    drivername = ASYNC_DRIVERS.get(url.drivername, url.drivername)
+    return url.set(drivername=drivername).render_as_string(hide_password=False)
+
+
 # SQLalchemy
-engine = create_engine(os.environ.get("SQL_DATABASE_URL"))
+SQL_DATABASE_URL = os.environ.get("SQL_DATABASE_URL")
+ASYNC_SQL_DATABASE_URL = os.environ.get(
+    "ASYNC_SQL_DATABASE_URL"
+) or get_async_database_url(SQL_DATABASE_URL)
+
+pool_statistics = PoolStatistics()
+engine = create_engine(
+    SQL_DATABASE_URL, **get_pool_options(SQL_DATABASE_URL, pool_statistics)
+)
+pool_statistics.attach(engine)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
+async_pool_statistics = PoolStatistics()
+async_engine = create_async_engine(
+    ASYNC_SQL_DATABASE_URL,
+    **get_pool_options(ASYNC_SQL_DATABASE_URL, async_pool_statistics, is_async=True),
+)
+async_pool_statistics.attach(async_engine.sync_engine)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
+register_metrics("sql_pool", pool_statistics.snapshot)
+register_metrics("async_sql_pool", async_pool_statistics.snapshot)
+
 
 def get_session_local():
-    yield SessionLocal()
+    """
+    Yields a session for one request. It is rolled back if the request
+    fails and always closed, returning its connection to the pool.
+    """
+    session = SessionLocal()
+    try:
+        yield session
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+
+async def get_async_session():
+    """
+    Asyncio version of get_session_local.
+    """
+    async with AsyncSessionLocal() as session:
+        try:
+            yield session
+        except Exception:
+            await session.rollback()
+            raise
+
+
+def get_async_session_factory() -> async_sessionmaker:
+    """
+    Returns the asyncio session factory, for work that outlives the request
+    dependencies, such as streamed responses.
+    """
+    return AsyncSessionLocal
 
 
 # Testing DB
@@ -25,8 +100,17 @@ if IS_TEST:
     TestingSessionLocal = sessionmaker(
         autocommit=False, autoflush=False, bind=test_engine
     )
+    # Every TestClient request runs in its own event loop, so connections
+    # must not be pooled across requests.
+    test_async_engine = create_async_engine(
+        get_async_database_url(TEST_SQL_DATABASE_URL), poolclass=NullPool
+    )
+    TestingAsyncSessionLocal = async_sessionmaker(
+        bind=test_async_engine, autoflush=False, expire_on_commit=False
+    )
 
 # MongoDB
 MONGO_URI = os.getenv("MONGO_DATABASE_URL", "mongodb://localhost:27017")
 MONGO_DB_NAME = os.getenv("MONGO_DB_NAME", "mongo_database")
 mongo_client = MongoClient(f"{MONGO_URI}/{MONGO_DB_NAME}")
+async_mongo_client = AsyncMongoClient(f"{MONGO_URI}/{MONGO_DB_NAME}")
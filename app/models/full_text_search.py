@@ -0,0 +1,81 @@
+from typing import List, Sequence
+
+from sqlalchemy import DDL, Table, event, text
+from sqlalchemy.engine import Connection
+
+
+def fts_table_name(table: Table) -> str:
+    """
+    Returns the name of the FTS5 table that indexes the given table.
+    """
+    return f"{table.name}_fts"
+
+
+def fts_statements(table: Table, fields: Sequence[str]) -> List[str]:
+    """
+    Returns the statements that create an external-content FTS5 table over
+    the fields, and the triggers that keep it in sync with the table.
+    """
+    name = fts_table_name(table)
+    columns = ", ".join(fields)
+    new_values = ", ".join(f"new.{field}" for field in fields)
+    old_values = ", ".join(f"old.{field}" for field in fields)
+    insert_new = f"INSERT INTO {name}(rowid, {columns}) VALUES (new.id, {new_values});"
+    delete_old = (
+        f"INSERT INTO {name}({name}, rowid, {columns}) "
+        f"VALUES ('delete', old.id, {old_values});"
+    )
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {name} USING fts5("
+        f"{columns}, content='{table.name}', content_rowid='id')",
+        f"CREATE TRIGGER IF NOT EXISTS {name}_insert AFTER INSERT ON {table.name} "
+        f"BEGIN {insert_new} END",
+        f"CREATE TRIGGER IF NOT EXISTS {name}_delete AFTER DELETE ON {table.name} "
+        f"BEGIN {delete_old} END",
+        f"CREATE TRIGGER IF NOT EXISTS {name}_update AFTER UPDATE OF {columns} "
+        f"ON {table.name} BEGIN {delete_old} {insert_new} END",
+    ]
+
+
+def attach_full_text_search(table: Table, fields: Sequence[str]) -> None:
+    """
+    Creates the FTS5 table and its triggers along with the table on SQLite,
+    and drops the FTS5 table with it.
+    """
+    for statement in fts_statements(table, fields):
+        event.listen(table, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+    event.listen(
+        table,
+        "before_drop",
+        DDL(f"DROP TABLE IF EXISTS {fts_table_name(table)}").execute_if(
+            dialect="sqlite"
+        ),
+    )
+
+
+def full_text_search_exists(connection: Connection, table: Table) -> bool:
+    """
+    Returns True if the FTS5 table of the given table exists.
+    """
+    statement = text(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"
+    )
+    return (
+        connection.execute(statement, {"name": fts_table_name(table)}).first()
+        is not None
+    )
+
+
+def ensure_full_text_search(
+    connection: Connection, table: Table, fields: Sequence[str]
+) -> None:
+    """
+    Creates the FTS5 table of a table created before full-text search
+    existed, and indexes its current rows.
+    """
+    if full_text_search_exists(connection, table):
+        return
+    name = fts_table_name(table)
+    for statement in fts_statements(table, fields):
+        connection.execute(text(statement))
+    connection.execute(text(f"INSERT INTO {name}({name}) VALUES ('rebuild')"))
@@ -1,6 +1,7 @@
 import enum
 from datetime import datetime, timezone
 
+from pymongo import ASCENDING, TEXT, IndexModel
 from sqlalchemy import (
     Column,
     Integer,
@@ -10,10 +11,14 @@ from sqlalchemy import (
     Enum,
     Boolean,
     Float,
+    Index,
 )
 from sqlalchemy.orm import relationship
 
 from app.database_settings import Base
+from app.models.full_text_search import attach_full_text_search
+from app.models.movie_count import attach_movie_counts
+from app.models.movie_stat import attach_movie_stats
 
 
 class GenreEnum(enum.Enum):
@@ -54,4 +59,83 @@ class Movie(Base):
     )
     is_public = Column(Boolean, default=False)
     user_id = Column(Integer, ForeignKey("user.id"), nullable=True)
-    user = relationship("User", back_populates="movies", lazy="joined", uselist=False)
+    # Listings never need the owner, so it is only loaded when a query asks
+    # for it with Related("user").
+    user = relationship("User", back_populates="movies", lazy="noload", uselist=False)
+
+    __table_args__ = (
+        # Movies of a user, optionally filtered by visibility, in id order.
+        Index("ix_movie_user_id_is_public_id", "user_id", "is_public", "id"),
+        # Public listing only touches public rows, so index just those.
+        Index(
+            "ix_movie_public_id",
+            "id",
+            sqlite_where=is_public == True,
+            postgresql_where=is_public == True,
+        ),
+        # Sorted listings read these in either direction, ties in id order.
+        Index(
+            "ix_movie_public_rating_id",
+            "rating",
+            "id",
+            sqlite_where=is_public == True,
+            postgresql_where=is_public == True,
+        ),
+        Index(
+            "ix_movie_public_created_at_id",
+            "created_at",
+            "id",
+            sqlite_where=is_public == True,
+            postgresql_where=is_public == True,
+        ),
+        Index(
+            "ix_movie_public_title_id",
+            "title",
+            "id",
+            sqlite_where=is_public == True,
+            postgresql_where=is_public == True,
+        ),
+        Index("ix_movie_user_id_rating_id", "user_id", "rating", "id"),
+        Index("ix_movie_user_id_created_at_id", "user_id", "created_at", "id"),
+        Index("ix_movie_user_id_title_id", "user_id", "title", "id"),
+    )
+
+    # Fields indexed for /movie/search: an FTS5 table on SQLite.
+    __search_fields__ = ("title", "description")
+
+    # Same access paths for the MongoDB backend.
+    __mongo_indexes__ = [
+        IndexModel(
+            [("user_id", ASCENDING), ("is_public", ASCENDING), ("_id", ASCENDING)],
+            name="user_id_is_public_id",
+        ),
+        IndexModel(
+            [("is_public", ASCENDING), ("_id", ASCENDING)],
+            name="public_id",
+            partialFilterExpression={"is_public": True},
+        ),
+        *(
+            IndexModel(
+                [(field, ASCENDING), ("_id", ASCENDING)],
+                name=f"public_{field}_id",
+                partialFilterExpression={"is_public": True},
+            )
+            for field in ("rating", "created_at", "title")
+        ),
+        *(
+            IndexModel(
+                [("user_id", ASCENDING), (field, ASCENDING), ("_id", ASCENDING)],
+                name=f"user_id_{field}_id",
+            )
+            for field in ("rating", "created_at", "title")
+        ),
+        IndexModel(
+            [("title", TEXT), ("description", TEXT)],
+            name="title_description_text",
+        ),
+    ]
+
+
+attach_full_text_search(Movie.__table__, Movie.__search_fields__)
+attach_movie_counts(Movie.__table__)
+attach_movie_stats(Movie.__table__, {genre.name: genre.value for genre in GenreEnum})
@@ -0,0 +1,91 @@
+from typing import List
+
+from sqlalchemy import DDL, Column, Integer, String, Table, event, text
+from sqlalchemy.engine import Connection
+
+from app.database_settings import Base
+
+COUNT_TRIGGERS = ("insert", "delete", "update")
+
+
+class MovieCount(Base):
+    """
+    Number of movies in a listing scope: every public movie, every movie of
+    a user, and the public and private movies of a user.
+    """
+
+    __tablename__ = "movie_count"
+
+    scope = Column(String(64), primary_key=True)
+    total = Column(Integer, nullable=False, default=0)
+
+
+def count_trigger_name(table: Table, action: str) -> str:
+    """
+    Returns the name of the trigger counting the given action on the table.
+    """
+    return f"{table.name}_count_{action}"
+
+
+def scopes_select(row: str) -> str:
+    """
+    Returns a SELECT of the scopes the `new` or `old` row is counted in.
+    """
+    user_scope = f"'user:' || {row}.user_id"
+    visibility = f"CASE WHEN {row}.is_public THEN ':public' ELSE ':private' END"
+    return (
+        f"SELECT 'public' AS scope WHERE {row}.is_public "
+        f"UNION ALL SELECT {user_scope} WHERE {row}.user_id IS NOT NULL "
+        f"UNION ALL SELECT {user_scope} || {visibility} "
+        f"WHERE {row}.user_id IS NOT NULL AND {row}.is_public IS NOT NULL"
+    )
+
+
+def count_statement(row: str, delta: int) -> str:
+    """
+    Returns the upsert adding `delta` to the scopes of the `new` or `old` row.
+    """
+    # "WHERE true" keeps SQLite from reading ON CONFLICT as a join constraint.
+    return (
+        f"INSERT INTO {MovieCount.__tablename__}(scope, total) "
+        f"SELECT scope, {delta} FROM ({scopes_select(row)}) WHERE true "
+        "ON CONFLICT(scope) DO UPDATE SET total = total + excluded.total;"
+    )
+
+
+def count_trigger_statements(table: Table) -> List[str]:
+    """
+    Returns the statements that create the triggers keeping the movie counts
+    in step with the table, inside the transaction of every write.
+    """
+    insert, delete, update = (
+        count_trigger_name(table, action) for action in COUNT_TRIGGERS
+    )
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS {insert} AFTER INSERT ON {table.name} "
+        f"BEGIN {count_statement('new', 1)} END",
+        f"CREATE TRIGGER IF NOT EXISTS {delete} AFTER DELETE ON {table.name} "
+        f"BEGIN {count_statement('old', -1)} END",
+        f"CREATE TRIGGER IF NOT EXISTS {update} AFTER UPDATE OF is_public, user_id "
+        f"ON {table.name} BEGIN {count_statement('old', -1)} "
+        f"{count_statement('new', 1)} END",
+    ]
+
+
+def attach_movie_counts(table: Table) -> None:
+    """
+    Creates the counting triggers along with the table on SQLite.
+    """
+    for statement in count_trigger_statements(table):
+        event.listen(table, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+
+
+def movie_counts_exist(connection: Connection, table: Table) -> bool:
+    """
+    Returns True if every counting trigger of the table exists.
+    """
+    statement = text("SELECT name FROM sqlite_master WHERE type = 'trigger'")
+    triggers = set(connection.execute(statement).scalars())
+    return all(
+        count_trigger_name(table, action) in triggers for action in COUNT_TRIGGERS
+    )
@@ -0,0 +1,128 @@
+from typing import List
+
+from sqlalchemy import DDL, Column, Float, Integer, String, Table, event, text
+from sqlalchemy.engine import Connection
+
+from app.database_settings import Base
+
+STAT_TRIGGERS = ("insert", "delete", "update")
+# Columns whose changes move a movie between statistics buckets.
+STAT_FIELDS = ("is_public", "genre", "publication_year", "rating")
+
+
+class MovieStat(Base):
+    """
+    Aggregates of the public movies in one bucket of a dimension: every
+    public movie ("all"), a genre, a publication decade or a rating band.
+    """
+
+    __tablename__ = "movie_stat"
+
+    dimension = Column(String(16), primary_key=True)
+    bucket = Column(String(32), primary_key=True)
+    movies = Column(Integer, nullable=False, default=0)
+    rated = Column(Integer, nullable=False, default=0)
+    rating_sum = Column(Float, nullable=False, default=0.0)
+
+
+def stat_trigger_name(table: Table, action: str) -> str:
+    """
+    Returns the name of the trigger aggregating the given action on the table.
+    """
+    return f"{table.name}_stat_{action}"
+
+
+def stat_buckets_select(row: str, genres: dict, source: str = None) -> str:
+    """
+    Returns a SELECT of the buckets and rating of the public `row`: the
+    `new` or `old` row in a trigger, or every row of `source`. Genres are
+    stored by name in SQL and bucketed by value, as on MongoDB.
+    """
+    genre = " ".join(f"WHEN '{name}' THEN '{value}'" for name, value in genres.items())
+    year = f"{row}.publication_year"
+    rating = f"{row}.rating"
+    floor_rating = f"CAST({rating} AS INTEGER) - ({rating} < CAST({rating} AS INTEGER))"
+    buckets = [
+        ("all", "''", None),
+        ("genre", f"CASE {row}.genre {genre} END", None),
+        ("decade", f"CAST({year} - (({year} % 10) + 10) % 10 AS TEXT)", None),
+        ("rating", f"CAST({floor_rating} AS TEXT)", f"{rating} IS NOT NULL"),
+    ]
+    from_source = f" FROM {source}" if source else ""
+    return " UNION ALL ".join(
+        f"SELECT '{dimension}' AS dimension, {bucket} AS bucket, "
+        f"{rating} AS rating{from_source} WHERE {row}.is_public"
+        + (f" AND {condition}" if condition else "")
+        for dimension, bucket, condition in buckets
+    )
+
+
+def stat_statement(row: str, delta: int, genres: dict) -> str:
+    """
+    Returns the upsert adding the `new` or `old` row to its buckets, or
+    removing it with a negative delta.
+    """
+    # "WHERE true" keeps SQLite from reading ON CONFLICT as a join constraint.
+    return (
+        f"INSERT INTO {MovieStat.__tablename__}"
+        "(dimension, bucket, movies, rated, rating_sum) "
+        f"SELECT dimension, bucket, {delta}, {delta} * (rating IS NOT NULL), "
+        f"{delta} * COALESCE(rating, 0) FROM ({stat_buckets_select(row, genres)}) "
+        "WHERE true ON CONFLICT(dimension, bucket) DO UPDATE SET "
+        "movies = movies + excluded.movies, rated = rated + excluded.rated, "
+        "rating_sum = rating_sum + excluded.rating_sum;"
+    )
+
+
+def stat_trigger_statements(table: Table, genres: dict) -> List[str]:
+    """
+    Returns the statements that create the triggers keeping the statistics
+    in step with the table, inside the transaction of every write.
+    """
+    insert, delete, update = (
+        stat_trigger_name(table, action) for action in STAT_TRIGGERS
+    )
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS {insert} AFTER INSERT ON {table.name} "
+        f"BEGIN {stat_statement('new', 1, genres)} END",
+        f"CREATE TRIGGER IF NOT EXISTS {delete} AFTER DELETE ON {table.name} "
+        f"BEGIN {stat_statement('old', -1, genres)} END",
+        f"CREATE TRIGGER IF NOT EXISTS {update} AFTER UPDATE OF "
+        f"{', '.join(STAT_FIELDS)} ON {table.name} "
+        f"BEGIN {stat_statement('old', -1, genres)} "
+        f"{stat_statement('new', 1, genres)} END",
+    ]
+
+
+def stat_rebuild_statements(table: Table, genres: dict) -> List[str]:
+    """
+    Returns the statements that aggregate the statistics again from scratch.
+    """
+    return [
+        f"DELETE FROM {MovieStat.__tablename__}",
+        f"INSERT INTO {MovieStat.__tablename__}"
+        "(dimension, bucket, movies, rated, rating_sum) "
+        "SELECT dimension, bucket, COUNT(*), COUNT(rating), "
+        "COALESCE(SUM(rating), 0) "
+        f"FROM ({stat_buckets_select(table.name, genres, table.name)}) "
+        "GROUP BY dimension, bucket",
+    ]
+
+
+def attach_movie_stats(table: Table, genres: dict) -> None:
+    """
+    Creates the aggregating triggers along with the table on SQLite.
+    """
+    for statement in stat_trigger_statements(table, genres):
+        # DDL formats the statement, so its modulo operators are escaped.
+        ddl = DDL(statement.replace("%", "%%"))
+        event.listen(table, "after_create", ddl.execute_if(dialect="sqlite"))
+
+
+def movie_stats_exist(connection: Connection, table: Table) -> bool:
+    """
+    Returns True if every aggregating trigger of the table exists.
+    """
+    statement = text("SELECT name FROM sqlite_master WHERE type = 'trigger'")
+    triggers = set(connection.execute(statement).scalars())
+    return all(stat_trigger_name(table, action) in triggers for action in STAT_TRIGGERS)
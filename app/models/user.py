@@ -1,10 +1,12 @@
 from datetime import datetime, timezone
 
-from sqlalchemy import Column, Integer, String, DateTime
+from pymongo import ASCENDING, IndexModel
+from sqlalchemy import Column, Integer, String, DateTime, event, inspect
 from sqlalchemy.orm import relationship
 
 from app.database_settings import Base
 from app.models.movie import Movie
+from app.utils.user_cache import invalidate_user
 
 
 class User(Base):
@@ -13,8 +15,31 @@ class User(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     first_name = Column(String(50), nullable=False)
     last_name = Column(String(50), nullable=False)
-    email = Column(String(255), nullable=False, unique=True)
+    email = Column(String(255), nullable=False, unique=True, index=True)
     password = Column(String(255), nullable=False)
     movies = relationship("Movie", back_populates="user", cascade="all, delete-orphan")
     created_at = Column(DateTime, default=datetime.now(timezone.utc))
     updated_at = Column(DateTime, default=datetime.now(timezone.utc))
+
+    __mongo_indexes__ = [
+        IndexModel([("email", ASCENDING)], name="email_unique", unique=True),
+    ]
+
+
+@event.listens_for(User, "after_insert")
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def invalidate_cached_user(mapper, connection, target: User):
+    """
+    Keeps the authenticated-user cache in sync with every write through the ORM.
+
+    Core statements such as update(User), delete(User) or the executemany
+    inserts of the bulk loader do not fire these events, and neither do
+    MongoDB writes or writes from another process. Such writes must call
+    invalidate_user themselves, otherwise a changed or deleted user stays
+    cached until USER_CACHE_TTL_SECONDS. Only found users are cached, so
+    inserts never leave a stale entry.
+    """
+    invalidate_user(target.email)
+    for previous_email in inspect(target).attrs.email.history.deleted:
+        invalidate_user(previous_email)
@@ -0,0 +1,202 @@
+from bson import ObjectId
+from typing import AsyncIterator, List, Dict, Any, Optional, Sequence
+
+from pymongo import AsyncMongoClient, ReturnDocument
+from pymongo.asynchronous.collection import AsyncCollection
+from pymongo.errors import BulkWriteError
+
+from app.repositories.base_repository import (
+    AsyncBaseRepository,
+    BulkResult,
+    Related,
+    Sort,
+    quoted_terms,
+)
+from app.repositories.mongo_repository import MongoQueries
+from app.utils.enum_utils import serialize_enums
+
+
+class AsyncMongoDBRepository(MongoQueries, AsyncBaseRepository[Dict]):
+    def __init__(self, db_name: str, collection_name: str, client: AsyncMongoClient):
+        """
+        Initializes an asyncio MongoDB repository.
+        """
+        self.db = client[db_name]
+        self.collection: AsyncCollection = self.db[collection_name]
+
+    async def get_object(self, object_id: str) -> Optional[Dict]:
+        """
+        Get an object by id.
+        """
+        return await self.collection.find_one({"_id": ObjectId(object_id)})
+
+    async def get_all_objects(self) -> List[Dict]:
+        """
+        Return all objects in the collection.
+        """
+        return await self.collection.find().to_list()
+
+    async def get_objects_by_filters(
+        self,
+        filters: Dict[str, Any],
+        offset: int = 0,
+        limit: int = None,
+        after: str = None,
+        sort: Sort = None,
+        fields: Sequence[str] = None,
+        related: Sequence[Related] = (),
+    ) -> List[Dict]:
+        """
+        Retrieves objects that match the given filters with optional pagination.
+        Documents embed no relationships, so `related` has nothing to load.
+        """
+        query = self.collection.find(
+            self.build_filters_query(filters, after, sort), self.projection(fields)
+        )
+        query = query.sort(self.sort_keys(sort)).skip(offset)
+        if limit:
+            query = query.limit(limit)
+        return await query.to_list()
+
+    async def get_object_batches(
+        self, filters: Dict[str, Any], after: str = None, batch_size: int = 1000
+    ) -> AsyncIterator[List[Dict]]:
+        """
+        Yields the documents matching the filters in batches of a single cursor.
+        """
+        query = self.collection.find(self.build_filters_query(filters, after))
+        batch = []
+        async for document in query.sort("_id", 1).batch_size(batch_size):
+            batch.append(document)
+            if len(batch) == batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    async def search_objects(
+        self,
+        query: str,
+        any_filters: List[Dict[str, Any]] = None,
+        limit: int = None,
+        after: Dict[str, Any] = None,
+    ) -> List[tuple[Dict, float]]:
+        """
+        Returns the documents matching the full-text query, best match first.
+        """
+        if not quoted_terms(query):
+            return []
+        pipeline = self.search_pipeline(query, any_filters, limit, after)
+        documents = await (await self.collection.aggregate(pipeline)).to_list()
+        return [(document, document.pop("_score")) for document in documents]
+
+    async def create_object(self, object_data: Dict) -> Dict:
+        """
+        Creates a new object with the given data.
+        """
+        serialized_object = self.prepare_new_document(object_data)
+        result = await self.collection.insert_one(serialized_object)
+        serialized_object["id"] = str(result.inserted_id)
+        return serialized_object
+
+    async def update_object(self, object_id: str, object_data: Dict) -> Optional[Dict]:
+        """
+        Updates an object with the given id.
+        """
+        await self.collection.update_one(
+            {"_id": ObjectId(object_id)}, {"$set": object_data}
+        )
+        return await self.get_object(object_id)
+
+    async def delete_object(self, object_id: str) -> Optional[Dict]:
+        """
+        Deletes an object with the given id.
+        """
+        return await self.collection.find_one_and_delete({"_id": ObjectId(object_id)})
+
+    async def update_matching_object(
+        self, object_id: str, object_data: Dict, any_filters: List[Dict[str, Any]]
+    ) -> BulkResult:
+        """
+        Updates the document with one find_one_and_update whose filter holds
+        the filters.
+        """
+        previous = await self.collection.find_one_and_update(
+            self.matching_query(object_id, any_filters),
+            {"$set": serialize_enums(object_data)},
+            return_document=ReturnDocument.BEFORE,
+        )
+        return self.matching_update(previous, object_data)
+
+    async def delete_matching_object(
+        self, object_id: str, any_filters: List[Dict[str, Any]]
+    ) -> Optional[Dict]:
+        """
+        Deletes the document with one find_one_and_delete whose filter holds
+        the filters.
+        """
+        return await self.collection.find_one_and_delete(
+            self.matching_query(object_id, any_filters)
+        )
+
+    async def create_objects(self, objects_data: List[Dict]) -> BulkResult:
+        """
+        Inserts the documents with one unordered insert_many, so a failing
+        document does not stop the others.
+        """
+        documents = [self.prepare_new_document(dict(data)) for data in objects_data]
+        if not documents:
+            return BulkResult()
+        failed = {}
+        try:
+            await self.collection.insert_many(documents, ordered=False)
+        except BulkWriteError as e:
+            failed = self.write_errors(e)
+        return self.inserted_result(documents, failed)
+
+    async def update_objects(
+        self, objects_data: List[Dict], filters: Dict[str, Any] = None
+    ) -> BulkResult:
+        """
+        Updates the documents with one unordered bulk_write. The documents
+        read to find the existing ones are returned in `previous`.
+        """
+        object_ids = [object_data["id"] for object_data in objects_data]
+        query = self.ids_query(object_ids, filters)
+        previous = await self.collection.find(query).to_list()
+        existing = {document["_id"] for document in previous}
+        indexes, operations = self.update_operations(objects_data, existing, filters)
+
+        failed = {}
+        if operations:
+            try:
+                await self.collection.bulk_write(operations, ordered=False)
+            except BulkWriteError as e:
+                failed = self.write_errors(e, indexes)
+        documents = await self.collection.find(
+            {"_id": {"$in": list(existing)}}
+        ).to_list()
+        result = self.written_result(object_ids, documents, failed)
+        result.previous = previous
+        return result
+
+    async def delete_objects(
+        self, object_ids: List[str], filters: Dict[str, Any] = None
+    ) -> BulkResult:
+        """
+        Reads the matching documents with one find, then deletes them with one
+        unordered bulk_write. Documents whose delete fails are not returned.
+        Without a transaction, a document deleted by another request between
+        both calls is still returned.
+        """
+        query = self.ids_query(object_ids, filters)
+        documents = await self.collection.find(query).to_list()
+        failed = {}
+        if documents:
+            try:
+                await self.collection.bulk_write(
+                    self.delete_operations(documents, filters), ordered=False
+                )
+            except BulkWriteError as e:
+                failed = self.write_errors(e)
+        return self.deleted_result(object_ids, documents, failed)
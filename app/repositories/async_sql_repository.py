@@ -0,0 +1,210 @@
+from typing import AsyncIterator, Type, TypeVar, Generic, List, Dict, Any, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories.base_repository import (
+    AsyncBaseRepository,
+    BulkResult,
+    Related,
+    Sort,
+    not_found_error,
+    quoted_terms,
+    split_updates,
+)
+from app.repositories.sql_repository import SQLStatements
+
+T = TypeVar("T")
+
+
+class AsyncSQLRepository(SQLStatements[T], AsyncBaseRepository[T], Generic[T]):
+    """
+    Generic asyncio CRUD service for models.
+    """
+
+    def __init__(self, db: AsyncSession, model: Type[T]):
+        self.db = db
+        self.model = model
+
+    async def get_object(self, object_id: int) -> T:
+        """
+        Get an object by id.
+        """
+        result = await self.db.execute(self.select_by_id(object_id))
+        return result.scalars().first()
+
+    async def get_all_objects(self) -> List[T]:
+        """
+        Return all objects of a table in the database.
+        """
+        result = await self.db.execute(select(self.model))
+        return list(result.scalars().all())
+
+    async def get_objects_by_filters(
+        self,
+        filters: Dict[str, Any],
+        offset: int = 0,
+        limit: int = None,
+        after: Any = None,
+        sort: Sort = None,
+        fields: Sequence[str] = None,
+        related: Sequence[Related] = (),
+    ) -> List[T]:
+        """
+        Retrieves objects that match the given filters with optional pagination.
+        """
+        statement = self.select_by_filters(
+            filters, offset, limit, after, sort, fields, related
+        )
+        result = await self.db.execute(statement)
+        return list(result.scalars().all())
+
+    async def get_object_batches(
+        self, filters: Dict[str, Any], after: Any = None, batch_size: int = 1000
+    ) -> AsyncIterator[List[T]]:
+        """
+        Yields the objects matching the filters in batches, read with yield_per.
+        """
+        statement = self.select_batches(filters, after, batch_size)
+        result = await self.db.stream_scalars(statement)
+        async for batch in result.partitions():
+            yield list(batch)
+
+    async def search_objects(
+        self,
+        query: str,
+        any_filters: List[Dict[str, Any]] = None,
+        limit: int = None,
+        after: Dict[str, Any] = None,
+    ) -> List[tuple[T, float]]:
+        """
+        Returns the objects matching the full-text query, best match first.
+        """
+        if not quoted_terms(query):
+            return []
+        statement = self.select_search(query, any_filters, limit, after)
+        result = await self.db.execute(statement)
+        return [(obj, score) for obj, score in result]
+
+    async def create_object(self, object_data: dict) -> T:
+        """
+        Creates a new object with the given data.
+        """
+        new_object = self.model(**object_data)
+        self.db.add(new_object)
+        await self.db.commit()
+        await self.db.refresh(new_object)
+        return new_object
+
+    async def update_object(self, object_id: int, object_data: dict) -> T | None:
+        """
+        Updates an object with the given id.
+        """
+        obj = await self.get_object(object_id)
+        if not obj:
+            return None
+        for key, value in object_data.items():
+            setattr(obj, key, value)
+        await self.db.commit()
+        await self.db.refresh(obj)
+        return obj
+
+    async def delete_object(self, object_id: int) -> T | None:
+        """
+        Deletes an object with the given id.
+        """
+        obj = await self.get_object(object_id)
+        if not obj:
+            return None
+        await self.db.delete(obj)
+        await self.db.commit()
+        return obj
+
+    async def update_matching_object(
+        self, object_id: int, object_data: dict, any_filters: List[Dict[str, Any]]
+    ) -> BulkResult[T]:
+        """
+        Updates the object with a single UPDATE ... RETURNING whose WHERE
+        holds the filters.
+        """
+        statement = self.update_by_id(object_id, object_data, any_filters=any_filters)
+        obj = (await self.db.scalars(statement)).first()
+        await self.db.commit()
+        return BulkResult([obj] if obj is not None else [])
+
+    async def delete_matching_object(
+        self, object_id: int, any_filters: List[Dict[str, Any]]
+    ) -> T | None:
+        """
+        Deletes the object with a single DELETE ... RETURNING whose WHERE
+        holds the filters.
+        """
+        statement = self.delete_by_ids([object_id], any_filters=any_filters)
+        obj = (await self.db.scalars(statement)).first()
+        if obj is not None:
+            # A detached object keeps its loaded values after the commit.
+            self.db.expunge(obj)
+        await self.db.commit()
+        return obj
+
+    async def create_objects(self, objects_data: List[dict]) -> BulkResult[T]:
+        """
+        Inserts the rows in one batched statement. If the database refuses
+        the batch, every row is inserted in its own savepoint instead, so
+        valid rows are kept and the failing ones are reported.
+        """
+        if not objects_data:
+            return BulkResult()
+        try:
+            objects = list(await self.db.scalars(self.insert_returning(), objects_data))
+            await self.db.commit()
+            return BulkResult(objects)
+        except DBAPIError:
+            await self.db.rollback()
+
+        result = BulkResult()
+        for index, object_data in enumerate(objects_data):
+            try:
+                async with self.db.begin_nested():
+                    objects = await self.db.scalars(
+                        self.insert_returning(), [object_data]
+                    )
+                    result.objects.append(objects.one())
+            except DBAPIError as e:
+                result.errors.append(self.insert_error(index, e))
+        await self.db.commit()
+        return result
+
+    async def update_objects(
+        self, objects_data: List[dict], filters: Dict[str, Any] = None
+    ) -> BulkResult[T]:
+        """
+        Updates every row with an UPDATE ... RETURNING in a single transaction.
+        """
+        result = BulkResult()
+        for index, object_id, fields in split_updates(objects_data):
+            statement = self.update_by_id(object_id, fields, filters)
+            obj = (await self.db.scalars(statement)).first()
+            if obj is None:
+                result.errors.append(not_found_error(index))
+            else:
+                result.objects.append(obj)
+        await self.db.commit()
+        return result
+
+    async def delete_objects(
+        self, object_ids: List[Any], filters: Dict[str, Any] = None
+    ) -> BulkResult[T]:
+        """
+        Deletes the objects with a single DELETE ... RETURNING.
+        """
+        if not object_ids:
+            return BulkResult()
+        statement = self.delete_by_ids(object_ids, filters)
+        deleted = list(await self.db.scalars(statement))
+        for obj in deleted:
+            # Detached objects keep their loaded values after the commit.
+            self.db.expunge(obj)
+        await self.db.commit()
+        return self.deleted_result(object_ids, deleted)
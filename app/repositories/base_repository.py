@@ -1,9 +1,122 @@
+import re
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar, List, Dict, Any, Optional
+from dataclasses import dataclass, field
+from typing import (
+    AsyncIterator,
+    Generic,
+    Iterator,
+    TypeVar,
+    List,
+    Dict,
+    Any,
+    Literal,
+    Optional,
+    Sequence,
+)
 
 T = TypeVar("T")
 
 
+@dataclass
+class BulkError:
+    """
+    Error of one row of a batch operation, identified by its position.
+    """
+
+    index: int
+    code: str
+    message: str
+
+
+@dataclass
+class BulkResult(Generic[T]):
+    """
+    Objects written by a batch operation and the rows that failed. Updates
+    that read the objects before writing them also return those reads in
+    `previous`.
+    """
+
+    objects: List[T] = field(default_factory=list)
+    errors: List[BulkError] = field(default_factory=list)
+    previous: List[T] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class Range:
+    """
+    Filter value matching the values between `gte` and `lte`, both
+    inclusive and optional.
+    """
+
+    gte: Any = None
+    lte: Any = None
+
+
+@dataclass(frozen=True)
+class In:
+    """
+    Filter value matching any of the given values.
+    """
+
+    values: tuple
+
+
+@dataclass(frozen=True)
+class Sort:
+    """
+    Order of a listing. Ties are broken by id in the same direction, so it
+    can be paginated with a keyset of the sort value and the id, and read
+    from an index on (field, id) in either direction.
+    """
+
+    field: str
+    descending: bool = False
+
+
+@dataclass(frozen=True)
+class Related:
+    """
+    Relationship loaded along with the objects of a listing: "selectin"
+    loads it for every object with one more query, "joined" joins it into
+    the same query. Relationships are not loaded otherwise.
+    """
+
+    name: str
+    strategy: Literal["selectin", "joined"] = "selectin"
+
+
+def not_found_error(index: int) -> BulkError:
+    """
+    Returns the error of a row whose object does not exist.
+    """
+    return BulkError(index, "NOT_FOUND", "Object not found.")
+
+
+def split_updates(objects_data: List[dict]):
+    """
+    Yields the position, id and fields to set of every update row.
+    """
+    for index, object_data in enumerate(objects_data):
+        fields = dict(object_data)
+        yield index, fields.pop("id"), fields
+
+
+def search_terms(query: str) -> List[str]:
+    """
+    Returns the words of a search query. Backends search for objects that
+    contain every word, so query syntax in user input is never interpreted.
+    """
+    return re.findall(r"\w+", query)
+
+
+def quoted_terms(query: str) -> str:
+    """
+    Returns the words of a search query as quoted terms, the syntax both
+    FTS5 MATCH and MongoDB $text read as "all of these words".
+    """
+    return " ".join(f'"{term}"' for term in search_terms(query))
+
+
 class BaseRepository(Generic[T], ABC):
     @abstractmethod
     def get_object(self, object_id: Any) -> Optional[T]:
@@ -20,9 +133,50 @@ class BaseRepository(Generic[T], ABC):
         pass
 
     @abstractmethod
-    def get_objects_by_filters(self, filters: Dict[str, Any]) -> List[T]:
+    def get_objects_by_filters(
+        self,
+        filters: Dict[str, Any],
+        offset: int = 0,
+        limit: int = None,
+        after: Any = None,
+        sort: Sort = None,
+        fields: Sequence[str] = None,
+        related: Sequence[Related] = (),
+    ) -> List[T]:
         """
-        Retrieve objects that match specific filters.
+        Retrieve objects that match specific filters, ordered by id or by
+        `sort`. A filter value is matched for equality, or is a Range or In.
+        Supports offset pagination and keyset pagination through `after`:
+        the last id, or the last (sort value, id) when sorted. When `fields`
+        is given, only those fields and the id are read. The relationships
+        in `related` are loaded too; documents have none.
+        """
+        pass
+
+    @abstractmethod
+    def search_objects(
+        self,
+        query: str,
+        any_filters: List[Dict[str, Any]] = None,
+        limit: int = None,
+        after: Dict[str, Any] = None,
+    ) -> List[tuple[T, float]]:
+        """
+        Full-text search over the fields the model declares in __search_fields__.
+        Returns the objects containing every word of the query with their
+        score, best match first. Only objects matching one of `any_filters`
+        are returned. `after` is the score and id of the last object seen.
+        """
+        pass
+
+    @abstractmethod
+    def get_object_batches(
+        self, filters: Dict[str, Any], after: Any = None, batch_size: int = 1000
+    ) -> Iterator[List[T]]:
+        """
+        Yield every object matching the filters, ordered by id, in batches
+        read from a server-side cursor, so memory does not grow with the
+        number of objects.
         """
         pass
 
@@ -47,9 +201,233 @@ class BaseRepository(Generic[T], ABC):
         """
         pass
 
+    @abstractmethod
+    def update_matching_object(
+        self, object_id: Any, object_data: dict, any_filters: List[Dict[str, Any]]
+    ) -> BulkResult[T]:
+        """
+        Update an object by its ID in a single write, only if it matches one
+        of `any_filters`. The updated object is in `objects`, which is empty
+        when no object matched. Backends that return the object as it was
+        before the write also return it in `previous`.
+        """
+        pass
+
+    @abstractmethod
+    def delete_matching_object(
+        self, object_id: Any, any_filters: List[Dict[str, Any]]
+    ) -> Optional[T]:
+        """
+        Delete an object by its ID in a single write, only if it matches one
+        of `any_filters`. Returns the deleted object, or None when no object
+        matched.
+        """
+        pass
+
+    @abstractmethod
+    def create_objects(self, objects_data: List[dict]) -> BulkResult[T]:
+        """
+        Create several objects in one batch.
+        """
+        pass
+
+    @abstractmethod
+    def update_objects(
+        self, objects_data: List[dict], filters: Dict[str, Any] = None
+    ) -> BulkResult[T]:
+        """
+        Update several objects in one batch. Every row holds the object "id"
+        and the fields to set. Objects not matching the filters are not found.
+        """
+        pass
+
+    @abstractmethod
+    def delete_objects(
+        self, object_ids: List[Any], filters: Dict[str, Any] = None
+    ) -> BulkResult[T]:
+        """
+        Delete several objects in one batch. Objects not matching the filters
+        are not found.
+        """
+        pass
+
+    def ensure_indexes(self) -> None:
+        """
+        Create the indexes declared for the model. Override if needed.
+        """
+        pass
+
+    def missing_indexes(self) -> List[str]:
+        """
+        Return the names of declared indexes that do not exist. Override if needed.
+        """
+        return []
+
     @staticmethod
     def to_schema(data: Any, schema: Any) -> Any:
         """
         Default behavior: Return data as is. Override if needed.
         """
         return data
+
+    @staticmethod
+    def to_rows(data: List[Any], fields: Sequence[str]) -> List[Dict[str, Any]]:
+        """
+        Reads the given fields of the objects into plain dicts, without
+        validating them. Default behavior: read them as attributes.
+        """
+        return [{field: getattr(obj, field) for field in fields} for obj in data]
+
+
+class AsyncBaseRepository(Generic[T], ABC):
+    """
+    Asyncio version of BaseRepository, used by the request handlers.
+    """
+
+    @abstractmethod
+    async def get_object(self, object_id: Any) -> Optional[T]:
+        """
+        Retrieve a single object by its ID.
+        """
+        pass
+
+    @abstractmethod
+    async def get_all_objects(self) -> List[T]:
+        """
+        Retrieve all objects.
+        """
+        pass
+
+    @abstractmethod
+    async def get_objects_by_filters(
+        self,
+        filters: Dict[str, Any],
+        offset: int = 0,
+        limit: int = None,
+        after: Any = None,
+        sort: Sort = None,
+        fields: Sequence[str] = None,
+        related: Sequence[Related] = (),
+    ) -> List[T]:
+        """
+        Retrieve objects that match specific filters, ordered by id or by
+        `sort`. A filter value is matched for equality, or is a Range or In.
+        Supports offset pagination and keyset pagination through `after`:
+        the last id, or the last (sort value, id) when sorted. When `fields`
+        is given, only those fields and the id are read. The relationships
+        in `related` are loaded too; documents have none.
+        """
+        pass
+
+    @abstractmethod
+    async def search_objects(
+        self,
+        query: str,
+        any_filters: List[Dict[str, Any]] = None,
+        limit: int = None,
+        after: Dict[str, Any] = None,
+    ) -> List[tuple[T, float]]:
+        """
+        Full-text search over the fields the model declares in __search_fields__.
+        Returns the objects containing every word of the query with their
+        score, best match first. Only objects matching one of `any_filters`
+        are returned. `after` is the score and id of the last object seen.
+        """
+        pass
+
+    @abstractmethod
+    def get_object_batches(
+        self, filters: Dict[str, Any], after: Any = None, batch_size: int = 1000
+    ) -> AsyncIterator[List[T]]:
+        """
+        Yield every object matching the filters, ordered by id, in batches
+        read from a server-side cursor, so memory does not grow with the
+        number of objects.
+        """
+        pass
+
+    @abstractmethod
+    async def create_object(self, object_data: dict) -> T:
+        """
+        Create a new object with the given data.
+        """
+        pass
+
+    @abstractmethod
+    async def update_object(self, object_id: Any, object_data: dict) -> Optional[T]:
+        """
+        Update an existing object by its ID with new data.
+        """
+        pass
+
+    @abstractmethod
+    async def delete_object(self, object_id: Any) -> Optional[T]:
+        """
+        Delete an object by its ID.
+        """
+        pass
+
+    @abstractmethod
+    async def update_matching_object(
+        self, object_id: Any, object_data: dict, any_filters: List[Dict[str, Any]]
+    ) -> BulkResult[T]:
+        """
+        Update an object by its ID in a single write, only if it matches one
+        of `any_filters`. The updated object is in `objects`, which is empty
+        when no object matched. Backends that return the object as it was
+        before the write also return it in `previous`.
+        """
+        pass
+
+    @abstractmethod
+    async def delete_matching_object(
+        self, object_id: Any, any_filters: List[Dict[str, Any]]
+    ) -> Optional[T]:
+        """
+        Delete an object by its ID in a single write, only if it matches one
+        of `any_filters`. Returns the deleted object, or None when no object
+        matched.
+        """
+        pass
+
+    @abstractmethod
+    async def create_objects(self, objects_data: List[dict]) -> BulkResult[T]:
+        """
+        Create several objects in one batch.
+        """
+        pass
+
+    @abstractmethod
+    async def update_objects(
+        self, objects_data: List[dict], filters: Dict[str, Any] = None
+    ) -> BulkResult[T]:
+        """
+        Update several objects in one batch. Every row holds the object "id"
+        and the fields to set. Objects not matching the filters are not found.
+        """
+        pass
+
+    @abstractmethod
+    async def delete_objects(
+        self, object_ids: List[Any], filters: Dict[str, Any] = None
+    ) -> BulkResult[T]:
+        """
+        Delete several objects in one batch. Objects not matching the filters
+        are not found.
+        """
+        pass
+
+    @staticmethod
+    def to_schema(data: Any, schema: Any) -> Any:
+        """
+        Default behavior: Return data as is. Override if needed.
+        """
+        return data
+
+    @staticmethod
+    def to_rows(data: List[Any], fields: Sequence[str]) -> List[Dict[str, Any]]:
+        """
+        Reads the given fields of the objects into plain dicts, without
+        validating them. Default behavior: read them as attributes.
+        """
+        return [{field: getattr(obj, field) for field in fields} for obj in data]
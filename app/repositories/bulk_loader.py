@@ -0,0 +1,306 @@
+import csv
+import json
+import os
+import random
+import re
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from itertools import accumulate, islice
+from typing import Any, Iterable, Iterator, List
+
+from pydantic import BaseModel
+from pymongo import MongoClient
+from sqlalchemy import insert, select
+from sqlalchemy.engine import Engine
+
+from app.models.movie import GenreEnum, Movie
+from app.models.user import User
+from app.schemas.movie import MovieCreate
+from app.utils.enum_utils import serialize_enums
+
+SAMPLE_TITLES = [
+    "The Shawshank Redemption",
+    "The Godfather",
+    "The Dark Knight",
+    "Pulp Fiction",
+    "The Lord of the Rings: The Return of the King",
+    "Forrest Gump",
+    "Inception",
+    "Fight Club",
+    "The Matrix",
+    "Goodfellas",
+    "The Silence of the Lambs",
+    "Interstellar",
+    "Se7en",
+    "The Usual Suspects",
+    "The Lion King",
+]
+
+SAMPLE_DESCRIPTIONS = [
+    "A story of hope and friendship.",
+    "A powerful tale of family and crime.",
+    "A dark hero rises to save the city.",
+    "Non-linear storytelling at its best.",
+    "An epic journey to destroy the One Ring.",
+    "A man's journey through life and love.",
+    "A dream within a dream.",
+    "A story about rebellion and freedom.",
+    "A mind-bending sci-fi masterpiece.",
+    "The rise and fall of a gangster.",
+    "A psychological thriller of a lifetime.",
+    "Exploring the boundaries of space and time.",
+    "A gritty detective story.",
+    "A twisty tale of deception.",
+    "A heartwarming animated classic.",
+]
+
+
+class MovieLoadRow(MovieCreate):
+    """
+    Movie row read from a file. Rows exported by /movie/export are accepted;
+    their id is ignored so the target database assigns new ones.
+    """
+
+    user_id: str | int | None = None
+    created_at: datetime | None = None
+
+
+@dataclass
+class LoadReport:
+    """
+    Rows written for a model and the time it took.
+    """
+
+    model: str
+    rows: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.model}: {self.rows} rows in {self.seconds:.2f}s "
+            f"({self.rows_per_second:,.0f} rows/s)"
+        )
+
+
+class SQLBulkWriter:
+    """
+    Writes batches with Core executemany inserts, one transaction per batch.
+    """
+
+    def __init__(self, engine: Engine, model: Any):
+        self.engine = engine
+        self.table = model.__table__
+
+    def write(self, rows: List[dict]) -> int:
+        """
+        Inserts the rows in one transaction and returns how many were written.
+        """
+        with self.engine.begin() as connection:
+            connection.execute(insert(self.table), rows)
+        return len(rows)
+
+    def user_ids(self, email_prefix: str) -> List[int]:
+        """
+        Returns the ids of the users whose email starts with the prefix,
+        in insertion order.
+        """
+        statement = (
+            select(self.table.c.id)
+            .where(self.table.c.email.startswith(email_prefix, autoescape=True))
+            .order_by(self.table.c.id)
+        )
+        with self.engine.connect() as connection:
+            return list(connection.execute(statement).scalars())
+
+
+class MongoBulkWriter:
+    """
+    Writes batches with unordered insert_many calls.
+    """
+
+    def __init__(self, client: MongoClient, db_name: str, model: Any):
+        self.collection = client[db_name][model.__tablename__]
+
+    def write(self, rows: List[dict]) -> int:
+        """
+        Inserts the documents and returns how many were written.
+        """
+        self.collection.insert_many(
+            [serialize_enums(dict(row)) for row in rows], ordered=False
+        )
+        return len(rows)
+
+    def user_ids(self, email_prefix: str) -> List[str]:
+        """
+        Returns the ids of the users whose email starts with the prefix,
+        in insertion order.
+        """
+        query = {"email": {"$regex": f"^{re.escape(email_prefix)}"}}
+        users = self.collection.find(query, {"_id": 1}).sort("_id")
+        return [str(user["_id"]) for user in users]
+
+
+def get_bulk_writer(model: Any) -> SQLBulkWriter | MongoBulkWriter:
+    """
+    Returns the bulk writer of the configured backend.
+    """
+    from app.database_settings import MONGO_DB_NAME, engine, mongo_client
+
+    if os.getenv("REPOSITORY_TYPE", "sqlite") == "mongodb":
+        return MongoBulkWriter(mongo_client, MONGO_DB_NAME, model)
+    return SQLBulkWriter(engine, model)
+
+
+def batched(rows: Iterable[dict], batch_size: int) -> Iterator[List[dict]]:
+    """
+    Groups the rows in lists of at most batch_size rows.
+    """
+    iterator = iter(rows)
+    while batch := list(islice(iterator, batch_size)):
+        yield batch
+
+
+def load(
+    rows: Iterable[dict],
+    writer: SQLBulkWriter | MongoBulkWriter,
+    model_name: str,
+    batch_size: int = 5000,
+    workers: int = 1,
+) -> LoadReport:
+    """
+    Writes the rows in batches with the given number of parallel workers.
+    At most two batches per worker are pending, so memory stays flat
+    whatever the number of rows.
+    """
+    started_at = time.perf_counter()
+    written = 0
+    pending = set()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for batch in batched(rows, batch_size):
+            if len(pending) >= workers * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                written += sum(future.result() for future in done)
+            pending.add(executor.submit(writer.write, batch))
+        written += sum(future.result() for future in pending)
+    return LoadReport(model_name, written, time.perf_counter() - started_at)
+
+
+def synthetic_users(count: int, email_prefix: str, password_hash: str):
+    """
+    Generates users that share the same password hash, since hashing every
+    password with bcrypt would dominate the load time.
+    """
+    now = datetime.now(timezone.utc)
+    for i in range(count):
+        yield {
+            "first_name": "Load",
+            "last_name": f"User {i}",
+            "email": f"{email_prefix}{i}@example.com",
+            "password": password_hash,
+            "created_at": now,
+            "updated_at": now,
+        }
+
+
+def zipf_weights(count: int, exponent: float = 1.0) -> List[float]:
+    """
+    Returns cumulative Zipf weights: the item of rank r is chosen with a
+    probability proportional to 1 / r ** exponent.
+    """
+    return list(accumulate(1 / rank**exponent for rank in range(1, count + 1)))
+
+
+def synthetic_movies(
+    count: int, user_ids: List[Any], cum_weights: List[float] = None
+) -> Iterator[dict]:
+    """
+    Generates movies owned by random users, or public movies without owner
+    when there are no users. Owners are drawn uniformly unless cumulative
+    weights such as zipf_weights(len(user_ids)) are given.
+    """
+    genres = list(GenreEnum)
+    now = datetime.now(timezone.utc)
+    for _ in range(count):
+        user_id = None
+        if user_ids:
+            user_id = random.choices(user_ids, cum_weights=cum_weights)[0]
+        yield {
+            "title": random.choice(SAMPLE_TITLES),
+            "description": random.choice(SAMPLE_DESCRIPTIONS),
+            "publication_year": random.randint(1990, 2024),
+            "genre": random.choice(genres),
+            "rating": round(random.uniform(1.0, 10.0), 1),
+            "is_public": random.random() < 0.5 if user_ids else True,
+            "user_id": user_id,
+            "created_at": now,
+            "updated_at": now,
+        }
+
+
+def read_rows(path: str, file_format: str = None) -> Iterator[dict]:
+    """
+    Reads the raw rows of an NDJSON or CSV file, one at a time.
+    The format defaults to the file extension.
+    """
+    file_format = file_format or os.path.splitext(path)[1].lstrip(".").lower()
+    with open(path, newline="", encoding="utf-8") as file:
+        if file_format == "csv":
+            yield from csv.DictReader(file)
+        elif file_format in ("ndjson", "jsonl"):
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            raise ValueError(f"Unsupported file format '{file_format}'.")
+
+
+def read_movies(path: str, file_format: str = None) -> Iterator[dict]:
+    """
+    Reads and validates the movies of an NDJSON or CSV file.
+    """
+    now = datetime.now(timezone.utc)
+    for row in read_rows(path, file_format):
+        if row.get("user_id") == "":
+            row["user_id"] = None
+        movie = MovieLoadRow.model_validate(row).model_dump()
+        movie["created_at"] = movie["created_at"] or now
+        movie["updated_at"] = now
+        yield movie
+
+
+def load_synthetic_data(
+    users: int,
+    movies: int,
+    batch_size: int = 5000,
+    workers: int = 1,
+    email_prefix: str = None,
+    zipf_exponent: float = None,
+) -> List[LoadReport]:
+    """
+    Generates and writes the users first, then movies owned by them.
+    With a Zipf exponent, movie ownership is skewed towards the first users.
+    """
+    from app.utils.password_hasher import BcryptPasswordHasher
+
+    reports = []
+    user_ids = []
+    if users:
+        user_writer = get_bulk_writer(User)
+        email_prefix = email_prefix or f"load-{int(time.time())}-"
+        password_hash = BcryptPasswordHasher.hash_password("password")
+        rows = synthetic_users(users, email_prefix, password_hash)
+        reports.append(load(rows, user_writer, "user", batch_size, workers))
+        user_ids = user_writer.user_ids(email_prefix)
+    if movies:
+        cum_weights = None
+        if user_ids and zipf_exponent:
+            cum_weights = zipf_weights(len(user_ids), zipf_exponent)
+        rows = synthetic_movies(movies, user_ids, cum_weights)
+        reports.append(load(rows, get_bulk_writer(Movie), "movie", batch_size, workers))
+    return reports
@@ -1,21 +1,63 @@
 import os
+from typing import Any
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.database_settings import mongo_client, MONGO_DB_NAME
-from app.repositories.mongo_repository import MongoDBRepository
-from app.repositories.sql_repository import SQLRepository
+from app.database_settings import async_mongo_client, mongo_client, MONGO_DB_NAME
+from app.repositories.async_mongo_repository import AsyncMongoDBRepository
+from app.repositories.async_sql_repository import AsyncSQLRepository
+from app.repositories.mongo_repository import MongoDBRepository, MongoQueries
+from app.repositories.sql_repository import SQLRepository, SQLStatements
 
 
-def get_repository(db: Session, model: object) -> object:
+def get_repository(db: Session | AsyncSession, model: object) -> object:
+    """
+    Returns the repository of the configured backend. An AsyncSession selects
+    the asyncio repositories, anything else the synchronous ones.
+    """
     db_type = os.getenv("REPOSITORY_TYPE", "sqlite")
+    use_async = isinstance(db, AsyncSession)
 
     if db_type == "sqlite":
+        if use_async:
+            return AsyncSQLRepository(db=db, model=model)
         return SQLRepository(db=db, model=model)
     elif db_type == "mongodb":
         collection_name = model.__tablename__
+        if use_async:
+            return AsyncMongoDBRepository(
+                db_name=MONGO_DB_NAME,
+                collection_name=collection_name,
+                client=async_mongo_client,
+            )
         return MongoDBRepository(
-            db_name=MONGO_DB_NAME, collection_name=collection_name, client=mongo_client
+            db_name=MONGO_DB_NAME,
+            collection_name=collection_name,
+            client=mongo_client,
+            indexes=getattr(model, "__mongo_indexes__", None),
         )
     else:
         raise ValueError(f"Unsupported repository type")
+
+
+def is_valid_id(object_id: Any) -> bool:
+    """
+    Returns whether the value has the id type of the configured backend,
+    without opening a session.
+    """
+    if os.getenv("REPOSITORY_TYPE", "sqlite") == "mongodb":
+        return MongoQueries.is_valid_id(object_id)
+    return SQLStatements.is_valid_id(object_id)
+
+
+def parse_id(value: str) -> Any:
+    """
+    Returns the object id of the configured backend written in a query
+    parameter. Raises ValueError if it is not one.
+    """
+    if os.getenv("REPOSITORY_TYPE", "sqlite") == "mongodb":
+        if not MongoQueries.is_valid_id(value):
+            raise ValueError(f"Invalid object id: {value}")
+        return value
+    return int(value)
@@ -0,0 +1,61 @@
+import logging
+import sys
+from typing import List
+
+from sqlalchemy.orm import Session
+
+from app.models.movie import Movie
+from app.models.user import User
+from app.repositories.get_repository import get_repository
+
+logger = logging.getLogger(__name__)
+
+INDEXED_MODELS = (User, Movie)
+
+
+def ensure_indexes(db: Session) -> List[str]:
+    """
+    Creates the declared indexes of every model on the configured repository.
+    Returns the indexes that are still missing afterwards.
+    """
+    for model in INDEXED_MODELS:
+        repository = get_repository(db, model)
+        try:
+            repository.ensure_indexes()
+        except Exception as e:
+            logger.warning(
+                "Could not create indexes for '%s': %s", model.__tablename__, e
+            )
+    return check_indexes(db)
+
+
+def check_indexes(db: Session) -> List[str]:
+    """
+    Returns the declared indexes that do not exist, as 'collection.index_name'.
+    """
+    missing = []
+    for model in INDEXED_MODELS:
+        repository = get_repository(db, model)
+        missing.extend(
+            f"{model.__tablename__}.{name}" for name in repository.missing_indexes()
+        )
+    return missing
+
+
+if __name__ == "__main__":
+    from app.database_settings import SessionLocal
+
+    session = SessionLocal()
+    try:
+        if "--create" in sys.argv:
+            missing_indexes = ensure_indexes(session)
+        else:
+            missing_indexes = check_indexes(session)
+    finally:
+        session.close()
+
+    for index_name in missing_indexes:
+        print(f"Missing index: {index_name}")
+    if missing_indexes:
+        sys.exit(1)
+    print("All declared indexes exist.")
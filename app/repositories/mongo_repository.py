@@ -1,21 +1,368 @@
 from datetime import datetime, timezone
 from bson import ObjectId
-from typing import List, Dict, Any, Optional
+from typing import Iterator, List, Dict, Any, Optional, Sequence
 
-from pymongo import MongoClient
+from pymongo import (
+    ASCENDING,
+    DESCENDING,
+    DeleteOne,
+    IndexModel,
+    MongoClient,
+    ReturnDocument,
+    UpdateOne,
+)
 from pymongo.collection import Collection
+from pymongo.errors import BulkWriteError
 
-from app.repositories.base_repository import BaseRepository
-from app.utils.enum_utils import serialize_enums
+from app.repositories.base_repository import (
+    BaseRepository,
+    BulkError,
+    BulkResult,
+    In,
+    Range,
+    Related,
+    Sort,
+    not_found_error,
+    quoted_terms,
+    split_updates,
+)
+from app.utils.cursor import InvalidCursorError
+from app.utils.enum_utils import serialize_enums, serialize_value
 
 
-class MongoDBRepository(BaseRepository[Dict]):
-    def __init__(self, db_name: str, collection_name: str, client: MongoClient):
+class MongoQueries:
+    """
+    Query builders shared by the synchronous and asyncio MongoDB repositories.
+    """
+
+    @staticmethod
+    def is_valid_id(object_id: Any) -> bool:
+        """
+        Returns whether the value is an id of this backend: an ObjectId string.
+        """
+        return isinstance(object_id, str) and ObjectId.is_valid(object_id)
+
+    @staticmethod
+    def filter_value(value: Any) -> Any:
+        """
+        Returns the query document of one filter: equality, a Range or an In.
+        """
+        if isinstance(value, Range):
+            bounds = {"$gte": value.gte, "$lte": value.lte}
+            return {
+                operator: serialize_value(bound)
+                for operator, bound in bounds.items()
+                if bound is not None
+            }
+        if isinstance(value, In):
+            return {"$in": [serialize_value(item) for item in value.values]}
+        return serialize_value(value)
+
+    @staticmethod
+    def build_filters_query(
+        filters: Dict[str, Any], after: Any = None, sort: Sort = None
+    ) -> Dict:
+        """
+        Builds the find filter for the given filters. When `after` is given,
+        only objects past it in the listing order are matched (keyset
+        pagination), so deep pages cost the same as the first.
+        """
+        query = {
+            field: MongoQueries.filter_value(value) for field, value in filters.items()
+        }
+        if after is None:
+            return query
+        after_value, after_id = after if sort is not None else (None, after)
+        if not ObjectId.is_valid(after_id):
+            raise InvalidCursorError("Invalid pagination cursor.")
+        if sort is None:
+            return {**query, "_id": {"$gt": ObjectId(after_id)}}
+
+        after_value = serialize_value(after_value)
+        operator = "$lt" if sort.descending else "$gt"
+        same_value = {sort.field: after_value, "_id": {operator: ObjectId(after_id)}}
+        # null sorts before every value, so it is never matched by $gt/$lt.
+        if sort.descending:
+            if after_value is None:
+                return {"$and": [query, same_value]}
+            past_values = [{sort.field: {operator: after_value}}, {sort.field: None}]
+        elif after_value is None:
+            past_values = [{sort.field: {"$ne": None}}]
+        else:
+            past_values = [{sort.field: {operator: after_value}}]
+        keyset = {"$or": [*past_values, same_value]}
+        return {"$and": [query, keyset]}
+
+    @staticmethod
+    def projection(fields: Sequence[str] = None) -> Dict[str, int] | None:
+        """
+        Returns the projection reading only the given fields, and the _id.
+        """
+        if not fields:
+            return None
+        return {"_id": 1, **{field: 1 for field in fields if field != "id"}}
+
+    @staticmethod
+    def sort_keys(sort: Sort = None) -> List[tuple]:
+        """
+        Returns the sort specification of a listing, ties broken by _id in
+        the same direction.
+        """
+        if sort is None:
+            return [("_id", ASCENDING)]
+        direction = DESCENDING if sort.descending else ASCENDING
+        return [(sort.field, direction), ("_id", direction)]
+
+    @staticmethod
+    def search_pipeline(
+        query: str,
+        any_filters: List[Dict[str, Any]] = None,
+        limit: int = None,
+        after: Dict[str, Any] = None,
+    ) -> List[Dict]:
+        """
+        Builds the aggregation that ranks the documents matching a full-text
+        query by text score, then by _id. The score is added as `_score`,
+        since a find filter cannot compare it for keyset pagination.
+        """
+        match = {"$text": {"$search": quoted_terms(query)}}
+        if any_filters:
+            match["$or"] = any_filters
+        pipeline = [
+            {"$match": match},
+            {"$addFields": {"_score": {"$meta": "textScore"}}},
+        ]
+        if after is not None:
+            if not ObjectId.is_valid(after["id"]):
+                raise InvalidCursorError("Invalid pagination cursor.")
+            pipeline.append(
+                {
+                    "$match": {
+                        "$or": [
+                            {"_score": {"$lt": after["score"]}},
+                            {
+                                "_score": after["score"],
+                                "_id": {"$gt": ObjectId(after["id"])},
+                            },
+                        ]
+                    }
+                }
+            )
+        pipeline.append({"$sort": {"_score": -1, "_id": 1}})
+        if limit:
+            pipeline.append({"$limit": limit})
+        return pipeline
+
+    @staticmethod
+    def prepare_new_document(object_data: Dict) -> Dict:
+        """
+        Serializes enums and sets the timestamps of a document to be inserted.
+        """
+        serialized_object = serialize_enums(object_data)
+        if "created_at" not in object_data:
+            serialized_object["created_at"] = datetime.now(timezone.utc)
+            serialized_object["updated_at"] = datetime.now(timezone.utc)
+        return serialized_object
+
+    @staticmethod
+    def parse_object_ids(object_ids: List[Any]) -> Dict[int, ObjectId]:
+        """
+        Returns the ObjectId of every valid id, keyed by its position.
+        """
+        return {
+            index: ObjectId(object_id)
+            for index, object_id in enumerate(object_ids)
+            if ObjectId.is_valid(object_id)
+        }
+
+    @staticmethod
+    def ids_query(object_ids: List[Any], filters: Dict[str, Any] = None) -> Dict:
+        """
+        Builds the find filter matching the given ids and filters.
+        Invalid ids match nothing.
+        """
+        valid_ids = list(MongoQueries.parse_object_ids(object_ids).values())
+        return {**(filters or {}), "_id": {"$in": valid_ids}}
+
+    @staticmethod
+    def delete_operations(
+        documents: List[Dict], filters: Dict[str, Any] = None
+    ) -> List[DeleteOne]:
+        """
+        Builds one DeleteOne per document read, each holding the filters.
+        """
+        return [
+            DeleteOne({**(filters or {}), "_id": document["_id"]})
+            for document in documents
+        ]
+
+    @staticmethod
+    def matching_query(object_id: Any, any_filters: List[Dict[str, Any]]) -> Dict:
+        """
+        Builds the find filter matching the object with the given id only if
+        it matches one of the filters.
+        """
+        return {
+            "_id": ObjectId(object_id),
+            "$or": [
+                MongoQueries.build_filters_query(filters) for filters in any_filters
+            ],
+        }
+
+    @staticmethod
+    def matching_update(previous: Optional[Dict], object_data: Dict) -> BulkResult:
+        """
+        Returns the result of a conditional update read with the document as
+        it was before: $set only replaces top-level fields, so the updated
+        document is the previous one with the new fields.
+        """
+        if previous is None:
+            return BulkResult()
+        updated = {**previous, **serialize_enums(object_data)}
+        return BulkResult([updated], previous=[previous])
+
+    @staticmethod
+    def write_errors(
+        error: BulkWriteError, indexes: List[int] = None
+    ) -> Dict[int, str]:
+        """
+        Returns the message of every failed operation, keyed by its position,
+        or by the row position in `indexes` when operations were not sent for
+        every row.
+        """
+        return {
+            indexes[write_error["index"]] if indexes else write_error["index"]: (
+                write_error["errmsg"]
+            )
+            for write_error in error.details.get("writeErrors", [])
+        }
+
+    @staticmethod
+    def inserted_result(documents: List[Dict], failed: Dict[int, str]) -> BulkResult:
+        """
+        Returns the inserted documents and the rows that failed.
+        """
+        result = BulkResult()
+        for index, document in enumerate(documents):
+            if index in failed:
+                result.errors.append(BulkError(index, "INVALID_DATA", failed[index]))
+            else:
+                document["id"] = str(document["_id"])
+                result.objects.append(document)
+        return result
+
+    @staticmethod
+    def update_operations(
+        objects_data: List[dict], existing: set, filters: Dict[str, Any] = None
+    ) -> tuple[List[int], List[UpdateOne]]:
+        """
+        Returns the positions and update operations of the rows whose object exists.
+        """
+        object_ids = MongoQueries.parse_object_ids(
+            [object_data["id"] for object_data in objects_data]
+        )
+        indexes, operations = [], []
+        for index, _, fields in split_updates(objects_data):
+            if object_ids.get(index) in existing:
+                query = {**(filters or {}), "_id": object_ids[index]}
+                indexes.append(index)
+                operations.append(UpdateOne(query, {"$set": serialize_enums(fields)}))
+        return indexes, operations
+
+    @staticmethod
+    def deleted_result(
+        object_ids: List[Any], documents: List[Dict], failed: Dict[int, str] = None
+    ) -> BulkResult:
+        """
+        Returns the documents whose delete succeeded, once each. Ids without
+        a deleted document are reported as not found.
+        """
+        failed = failed or {}
+        deleted = [
+            document for index, document in enumerate(documents) if index not in failed
+        ]
+        deleted_ids = {str(document["_id"]) for document in deleted}
+        errors = [
+            not_found_error(index)
+            for index, object_id in enumerate(object_ids)
+            if str(object_id) not in deleted_ids
+        ]
+        return BulkResult(deleted, errors)
+
+    @staticmethod
+    def written_result(
+        object_ids: List[Any], documents: List[Dict], failed: Dict[int, str] = None
+    ) -> BulkResult:
+        """
+        Returns the written documents in the order of the given ids. Ids
+        without a document are reported as not found.
+        """
+        failed = failed or {}
+        documents_by_id = {str(document["_id"]): document for document in documents}
+        result = BulkResult()
+        for index, object_id in enumerate(object_ids):
+            if index in failed:
+                result.errors.append(BulkError(index, "INVALID_DATA", failed[index]))
+            elif str(object_id) in documents_by_id:
+                result.objects.append(documents_by_id[str(object_id)])
+            else:
+                result.errors.append(not_found_error(index))
+        return result
+
+    @staticmethod
+    def to_schema(data, schema):
+        """
+        Transform doc to schema.
+        """
+        if not data:
+            return None
+
+        if isinstance(data, list):
+            result = []
+            for doc in data:
+                if "_id" in doc:
+                    doc["id"] = str(doc.pop("_id"))
+                result.append(schema(**doc))
+            return result
+
+        elif "_id" in data:
+            data["id"] = str(data.pop("_id"))
+
+        return schema(**data)
+
+    @staticmethod
+    def to_rows(data: List[Dict], fields: Sequence[str]) -> List[Dict[str, Any]]:
+        """
+        Reads the given fields of the documents into plain dicts, with the
+        _id as a string "id", without validating them.
+        """
+        return [
+            {
+                field: (
+                    (str(doc["_id"]) if "_id" in doc else doc["id"])
+                    if field == "id"
+                    else doc.get(field)
+                )
+                for field in fields
+            }
+            for doc in data
+        ]
+
+
+class MongoDBRepository(MongoQueries, BaseRepository[Dict]):
+    def __init__(
+        self,
+        db_name: str,
+        collection_name: str,
+        client: MongoClient,
+        indexes: List[IndexModel] = None,
+    ):
         """
         Initializes a synchronous MongoDB repository.
         """
         self.db = client[db_name]
         self.collection: Collection = self.db[collection_name]
+        self.indexes = indexes or []
 
     def get_object(self, object_id: str) -> Optional[Dict]:
         """
@@ -30,25 +377,64 @@ class MongoDBRepository(BaseRepository[Dict]):
         return list(self.collection.find())
 
     def get_objects_by_filters(
-        self, filters: Dict[str, Any], offset: int = 0, limit: int = None
+        self,
+        filters: Dict[str, Any],
+        offset: int = 0,
+        limit: int = None,
+        after: str = None,
+        sort: Sort = None,
+        fields: Sequence[str] = None,
+        related: Sequence[Related] = (),
     ) -> List[Dict]:
         """
         Retrieves objects that match the given filters with optional pagination.
+        Documents embed no relationships, so `related` has nothing to load.
         """
-        query = self.collection.find(filters).skip(offset)
+        query = self.collection.find(
+            self.build_filters_query(filters, after, sort), self.projection(fields)
+        )
+        query = query.sort(self.sort_keys(sort)).skip(offset)
         if limit:
             query = query.limit(limit)
         return list(query)
 
+    def get_object_batches(
+        self, filters: Dict[str, Any], after: str = None, batch_size: int = 1000
+    ) -> Iterator[List[Dict]]:
+        """
+        Yields the documents matching the filters in batches of a single cursor.
+        """
+        query = self.collection.find(self.build_filters_query(filters, after))
+        batch = []
+        for document in query.sort("_id", 1).batch_size(batch_size):
+            batch.append(document)
+            if len(batch) == batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def search_objects(
+        self,
+        query: str,
+        any_filters: List[Dict[str, Any]] = None,
+        limit: int = None,
+        after: Dict[str, Any] = None,
+    ) -> List[tuple[Dict, float]]:
+        """
+        Returns the documents matching the full-text query, best match first.
+        """
+        if not quoted_terms(query):
+            return []
+        pipeline = self.search_pipeline(query, any_filters, limit, after)
+        documents = self.collection.aggregate(pipeline)
+        return [(document, document.pop("_score")) for document in documents]
+
     def create_object(self, object_data: Dict) -> Dict:
         """
         Creates a new object with the given data.
         """
-        serialized_object = serialize_enums(object_data)
-        if "created_at" not in object_data:
-            serialized_object["created_at"] = datetime.now(timezone.utc)
-            serialized_object["updated_at"] = datetime.now(timezone.utc)
-
+        serialized_object = self.prepare_new_document(object_data)
         result = self.collection.insert_one(serialized_object)
         serialized_object["id"] = str(result.inserted_id)
         return serialized_object
@@ -66,23 +452,103 @@ class MongoDBRepository(BaseRepository[Dict]):
         """
         return self.collection.find_one_and_delete({"_id": ObjectId(object_id)})
 
-    @staticmethod
-    def to_schema(data, schema):
+    def update_matching_object(
+        self, object_id: str, object_data: Dict, any_filters: List[Dict[str, Any]]
+    ) -> BulkResult:
         """
-        Transform doc to schema.
+        Updates the document with one find_one_and_update whose filter holds
+        the filters.
         """
-        if not data:
-            return None
+        previous = self.collection.find_one_and_update(
+            self.matching_query(object_id, any_filters),
+            {"$set": serialize_enums(object_data)},
+            return_document=ReturnDocument.BEFORE,
+        )
+        return self.matching_update(previous, object_data)
 
-        if isinstance(data, list):
-            result = []
-            for doc in data:
-                if "_id" in doc:
-                    doc["id"] = str(doc.pop("_id"))
-                result.append(schema(**doc))
-            return result
+    def delete_matching_object(
+        self, object_id: str, any_filters: List[Dict[str, Any]]
+    ) -> Optional[Dict]:
+        """
+        Deletes the document with one find_one_and_delete whose filter holds
+        the filters.
+        """
+        return self.collection.find_one_and_delete(
+            self.matching_query(object_id, any_filters)
+        )
 
-        elif "_id" in data:
-            data["id"] = str(data.pop("_id"))
+    def create_objects(self, objects_data: List[Dict]) -> BulkResult:
+        """
+        Inserts the documents with one unordered insert_many, so a failing
+        document does not stop the others.
+        """
+        documents = [self.prepare_new_document(dict(data)) for data in objects_data]
+        if not documents:
+            return BulkResult()
+        failed = {}
+        try:
+            self.collection.insert_many(documents, ordered=False)
+        except BulkWriteError as e:
+            failed = self.write_errors(e)
+        return self.inserted_result(documents, failed)
 
-        return schema(**data)
+    def update_objects(
+        self, objects_data: List[Dict], filters: Dict[str, Any] = None
+    ) -> BulkResult:
+        """
+        Updates the documents with one unordered bulk_write. The documents
+        read to find the existing ones are returned in `previous`.
+        """
+        object_ids = [object_data["id"] for object_data in objects_data]
+        previous = list(self.collection.find(self.ids_query(object_ids, filters)))
+        existing = {document["_id"] for document in previous}
+        indexes, operations = self.update_operations(objects_data, existing, filters)
+
+        failed = {}
+        if operations:
+            try:
+                self.collection.bulk_write(operations, ordered=False)
+            except BulkWriteError as e:
+                failed = self.write_errors(e, indexes)
+        documents = list(self.collection.find({"_id": {"$in": list(existing)}}))
+        result = self.written_result(object_ids, documents, failed)
+        result.previous = previous
+        return result
+
+    def delete_objects(
+        self, object_ids: List[str], filters: Dict[str, Any] = None
+    ) -> BulkResult:
+        """
+        Reads the matching documents with one find, then deletes them with one
+        unordered bulk_write. Documents whose delete fails are not returned.
+        Without a transaction, a document deleted by another request between
+        both calls is still returned.
+        """
+        documents = list(self.collection.find(self.ids_query(object_ids, filters)))
+        failed = {}
+        if documents:
+            try:
+                self.collection.bulk_write(
+                    self.delete_operations(documents, filters), ordered=False
+                )
+            except BulkWriteError as e:
+                failed = self.write_errors(e)
+        return self.deleted_result(object_ids, documents, failed)
+
+    def ensure_indexes(self) -> None:
+        """
+        Creates the indexes declared for the collection. Existing ones are kept.
+        """
+        if self.indexes:
+            self.collection.create_indexes(self.indexes)
+
+    def missing_indexes(self) -> List[str]:
+        """
+        Returns the names of the indexes declared for the collection that do not exist.
+        """
+        existing = self.collection.index_information()
+        return [
+            index.document["name"]
+            for index in self.indexes
+            if index.document["name"] not in existing
+        ]
@@ -1,13 +1,289 @@
-from typing import Type, TypeVar, Generic, List, Dict, Any
+from typing import Type, TypeVar, Generic, Iterator, List, Dict, Any, Sequence
 
-from sqlalchemy.orm import Session
+from sqlalchemy import (
+    Delete,
+    Insert,
+    Select,
+    Update,
+    and_,
+    column,
+    delete,
+    func,
+    insert,
+    inspect,
+    literal_column,
+    or_,
+    select,
+    table,
+    update,
+)
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session, joinedload, load_only, noload, selectinload
 
-from app.repositories.base_repository import BaseRepository
+from app.models.full_text_search import (
+    ensure_full_text_search,
+    fts_table_name,
+    full_text_search_exists,
+)
+from app.repositories.base_repository import (
+    BaseRepository,
+    BulkError,
+    BulkResult,
+    In,
+    Range,
+    Related,
+    Sort,
+    not_found_error,
+    quoted_terms,
+    split_updates,
+)
 
 T = TypeVar("T")
 
+RELATED_LOADERS = {"selectin": selectinload, "joined": joinedload}
 
-class SQLRepository(BaseRepository[T], Generic[T]):
+
+class SQLStatements(Generic[T]):
+    """
+    Statement builders shared by the synchronous and asyncio SQL repositories.
+    """
+
+    model: Type[T]
+
+    @staticmethod
+    def is_valid_id(object_id: Any) -> bool:
+        """
+        Returns whether the value is an id of this backend: an integer.
+        """
+        return isinstance(object_id, int) and not isinstance(object_id, bool)
+
+    def select_by_id(self, object_id: Any) -> Select:
+        """
+        Builds the statement that selects an object by id.
+        """
+        return select(self.model).where(self.model.id == object_id)
+
+    def select_by_filters(
+        self,
+        filters: Dict[str, Any],
+        offset: int = 0,
+        limit: int = None,
+        after: Any = None,
+        sort: Sort = None,
+        fields: Sequence[str] = None,
+        related: Sequence[Related] = (),
+    ) -> Select:
+        """
+        Builds the statement that selects objects matching the given filters.
+        When `after` is given, only objects past it in the listing order are
+        selected (keyset pagination), so deep pages cost the same as the first.
+        When `fields` is given, only those columns are loaded.
+        """
+        statement = self.where_filters(select(self.model), filters)
+        if fields:
+            columns = (getattr(self.model, field) for field in fields)
+            statement = statement.options(load_only(*columns))
+        for relationship in related:
+            loader = RELATED_LOADERS[relationship.strategy]
+            statement = statement.options(
+                loader(getattr(self.model, relationship.name))
+            )
+
+        if sort is None:
+            if after is not None:
+                statement = statement.where(self.model.id > after)
+            statement = statement.order_by(self.model.id)
+        else:
+            sort_column = getattr(self.model, sort.field)
+            if after is not None:
+                statement = statement.where(self.sorted_past_condition(sort, *after))
+            # NULLs first in ascending order and last in descending order, as
+            # SQLite and MongoDB sort them, whatever the dialect default is.
+            if sort.descending:
+                statement = statement.order_by(
+                    sort_column.desc().nulls_last(), self.model.id.desc()
+                )
+            else:
+                statement = statement.order_by(
+                    sort_column.asc().nulls_first(), self.model.id
+                )
+
+        if offset:
+            statement = statement.offset(offset)
+        if limit:
+            statement = statement.limit(limit)
+
+        return statement
+
+    def sorted_past_condition(self, sort: Sort, after_value: Any, after_id: Any):
+        """
+        Returns the condition of the objects past (after_value, after_id) in
+        a sorted listing. NULL values are compared with IS NULL, since they
+        sort before every value in ascending order and after them in
+        descending order.
+        """
+        sort_column = getattr(self.model, sort.field)
+        if sort.descending:
+            if after_value is None:
+                return and_(sort_column.is_(None), self.model.id < after_id)
+            return or_(
+                sort_column < after_value,
+                and_(sort_column == after_value, self.model.id < after_id),
+                sort_column.is_(None),
+            )
+        if after_value is None:
+            return or_(
+                and_(sort_column.is_(None), self.model.id > after_id),
+                sort_column.is_not(None),
+            )
+        return or_(
+            sort_column > after_value,
+            and_(sort_column == after_value, self.model.id > after_id),
+        )
+
+    def select_batches(
+        self, filters: Dict[str, Any], after: Any = None, batch_size: int = 1000
+    ) -> Select:
+        """
+        Builds the statement that streams the objects matching the filters in
+        batches of `batch_size` rows. Relationships are not loaded.
+        """
+        statement = self.select_by_filters(filters, after=after)
+        return statement.options(noload("*")).execution_options(yield_per=batch_size)
+
+    def select_search(
+        self,
+        query: str,
+        any_filters: List[Dict[str, Any]] = None,
+        limit: int = None,
+        after: Dict[str, Any] = None,
+    ) -> Select:
+        """
+        Builds the statement that ranks the objects matching a full-text
+        query with the FTS5 table of the model. The score is the negated
+        bm25 rank, so higher is better as on MongoDB; ties are in id order.
+        """
+        fts_name = fts_table_name(self.model.__table__)
+        fts_table = table(fts_name, column("rowid"))
+        score = -func.bm25(literal_column(fts_name))
+        statement = (
+            select(self.model, score.label("score"))
+            .join(fts_table, fts_table.c.rowid == self.model.id)
+            .where(literal_column(fts_name).op("MATCH")(quoted_terms(query)))
+        )
+        statement = self.where_any_filters(statement, any_filters)
+        if after is not None:
+            statement = statement.where(
+                or_(
+                    score < after["score"],
+                    and_(score == after["score"], self.model.id > after["id"]),
+                )
+            )
+        statement = statement.order_by(score.desc(), self.model.id)
+        if limit:
+            statement = statement.limit(limit)
+        return statement
+
+    def filter_condition(self, field: str, value: Any):
+        """
+        Returns the condition of one filter: equality, a Range or an In.
+        """
+        column_ = getattr(self.model, field)
+        if isinstance(value, Range):
+            conditions = []
+            if value.gte is not None:
+                conditions.append(column_ >= value.gte)
+            if value.lte is not None:
+                conditions.append(column_ <= value.lte)
+            return and_(True, *conditions)
+        if isinstance(value, In):
+            return column_.in_(value.values)
+        return column_ == value
+
+    def filters_condition(self, filters: Dict[str, Any]):
+        """
+        Returns the condition that every filter holds.
+        """
+        return and_(
+            *(self.filter_condition(field, value) for field, value in filters.items())
+        )
+
+    def where_filters(self, statement, filters: Dict[str, Any] = None):
+        """
+        Adds the condition of every filter to the statement.
+        """
+        for field, value in (filters or {}).items():
+            statement = statement.where(self.filter_condition(field, value))
+        return statement
+
+    def insert_returning(self) -> Insert:
+        """
+        Builds the statement that inserts objects and returns them in the
+        order of the given rows. Executed with a list of rows, it is sent as
+        a batched multi-row INSERT.
+        """
+        return insert(self.model).returning(self.model, sort_by_parameter_order=True)
+
+    def where_any_filters(self, statement, any_filters: List[Dict[str, Any]] = None):
+        """
+        Adds the condition that one of the filters holds to the statement.
+        """
+        if not any_filters:
+            return statement
+        return statement.where(
+            or_(*(self.filters_condition(filters) for filters in any_filters))
+        )
+
+    def update_by_id(
+        self,
+        object_id: Any,
+        object_data: dict,
+        filters: Dict[str, Any] = None,
+        any_filters: List[Dict[str, Any]] = None,
+    ) -> Update:
+        """
+        Builds the statement that updates an object by id and returns it.
+        """
+        statement = update(self.model).where(self.model.id == object_id)
+        statement = self.where_filters(statement, filters)
+        statement = self.where_any_filters(statement, any_filters)
+        return statement.values(**object_data).returning(self.model)
+
+    def delete_by_ids(
+        self,
+        object_ids: List[Any],
+        filters: Dict[str, Any] = None,
+        any_filters: List[Dict[str, Any]] = None,
+    ) -> Delete:
+        """
+        Builds the statement that deletes objects by id and returns them.
+        """
+        statement = delete(self.model).where(self.model.id.in_(object_ids))
+        statement = self.where_filters(statement, filters)
+        return self.where_any_filters(statement, any_filters).returning(self.model)
+
+    @staticmethod
+    def insert_error(index: int, error: DBAPIError) -> BulkError:
+        """
+        Returns the error of a row the database refused to insert.
+        """
+        return BulkError(index, "INVALID_DATA", str(error.orig))
+
+    @staticmethod
+    def deleted_result(object_ids: List[Any], deleted: List[T]) -> BulkResult[T]:
+        """
+        Reports the ids that were not deleted as not found.
+        """
+        deleted_ids = {obj.id for obj in deleted}
+        errors = [
+            not_found_error(index)
+            for index, object_id in enumerate(object_ids)
+            if object_id not in deleted_ids
+        ]
+        return BulkResult(deleted, errors)
+
+
+class SQLRepository(SQLStatements[T], BaseRepository[T], Generic[T]):
     """
     Generic CRUD service for models.
     """
@@ -20,7 +296,7 @@ class SQLRepository(BaseRepository[T], Generic[T]):
         """
         Get an object by id.
         """
-        return self.db.query(self.model).filter(self.model.id == object_id).first()
+        return self.db.execute(self.select_by_id(object_id)).scalars().first()
 
     def get_all_objects(self) -> List[T]:
         """
@@ -29,21 +305,47 @@ class SQLRepository(BaseRepository[T], Generic[T]):
         return self.db.query(self.model).all()
 
     def get_objects_by_filters(
-        self, filters: Dict[str, Any], offset: int = 0, limit: int = None
+        self,
+        filters: Dict[str, Any],
+        offset: int = 0,
+        limit: int = None,
+        after: Any = None,
+        sort: Sort = None,
+        fields: Sequence[str] = None,
+        related: Sequence[Related] = (),
     ) -> List[T]:
         """
         Retrieves objects that match the given filters with optional pagination.
         """
-        query = self.db.query(self.model)
-        for field, value in filters.items():
-            query = query.filter(getattr(self.model, field) == value)
+        statement = self.select_by_filters(
+            filters, offset, limit, after, sort, fields, related
+        )
+        return list(self.db.execute(statement).scalars().all())
 
-        if offset:
-            query = query.offset(offset)
-        if limit:
-            query = query.limit(limit)
+    def get_object_batches(
+        self, filters: Dict[str, Any], after: Any = None, batch_size: int = 1000
+    ) -> Iterator[List[T]]:
+        """
+        Yields the objects matching the filters in batches, read with yield_per.
+        """
+        statement = self.select_batches(filters, after, batch_size)
+        for batch in self.db.execute(statement).scalars().partitions():
+            yield list(batch)
 
-        return query.all()
+    def search_objects(
+        self,
+        query: str,
+        any_filters: List[Dict[str, Any]] = None,
+        limit: int = None,
+        after: Dict[str, Any] = None,
+    ) -> List[tuple[T, float]]:
+        """
+        Returns the objects matching the full-text query, best match first.
+        """
+        if not quoted_terms(query):
+            return []
+        statement = self.select_search(query, any_filters, limit, after)
+        return [(obj, score) for obj, score in self.db.execute(statement)]
 
     def create_object(self, object_data: dict) -> T:
         """
@@ -78,3 +380,128 @@ class SQLRepository(BaseRepository[T], Generic[T]):
         self.db.delete(obj)
         self.db.commit()
         return obj
+
+    def update_matching_object(
+        self, object_id: int, object_data: dict, any_filters: List[Dict[str, Any]]
+    ) -> BulkResult[T]:
+        """
+        Updates the object with a single UPDATE ... RETURNING whose WHERE
+        holds the filters.
+        """
+        statement = self.update_by_id(object_id, object_data, any_filters=any_filters)
+        obj = self.db.scalars(statement).first()
+        self.db.commit()
+        return BulkResult([obj] if obj is not None else [])
+
+    def delete_matching_object(
+        self, object_id: int, any_filters: List[Dict[str, Any]]
+    ) -> T | None:
+        """
+        Deletes the object with a single DELETE ... RETURNING whose WHERE
+        holds the filters.
+        """
+        statement = self.delete_by_ids([object_id], any_filters=any_filters)
+        obj = self.db.scalars(statement).first()
+        if obj is not None:
+            # A detached object keeps its loaded values after the commit.
+            self.db.expunge(obj)
+        self.db.commit()
+        return obj
+
+    def create_objects(self, objects_data: List[dict]) -> BulkResult[T]:
+        """
+        Inserts the rows in one batched statement. If the database refuses
+        the batch, every row is inserted in its own savepoint instead, so
+        valid rows are kept and the failing ones are reported.
+        """
+        if not objects_data:
+            return BulkResult()
+        try:
+            objects = list(self.db.scalars(self.insert_returning(), objects_data))
+            self.db.commit()
+            return BulkResult(objects)
+        except DBAPIError:
+            self.db.rollback()
+
+        result = BulkResult()
+        for index, object_data in enumerate(objects_data):
+            try:
+                with self.db.begin_nested():
+                    statement = self.insert_returning()
+                    result.objects.append(
+                        self.db.scalars(statement, [object_data]).one()
+                    )
+            except DBAPIError as e:
+                result.errors.append(self.insert_error(index, e))
+        self.db.commit()
+        return result
+
+    def update_objects(
+        self, objects_data: List[dict], filters: Dict[str, Any] = None
+    ) -> BulkResult[T]:
+        """
+        Updates every row with an UPDATE ... RETURNING in a single transaction.
+        """
+        result = BulkResult()
+        for index, object_id, fields in split_updates(objects_data):
+            statement = self.update_by_id(object_id, fields, filters)
+            obj = self.db.scalars(statement).first()
+            if obj is None:
+                result.errors.append(not_found_error(index))
+            else:
+                result.objects.append(obj)
+        self.db.commit()
+        return result
+
+    def delete_objects(
+        self, object_ids: List[Any], filters: Dict[str, Any] = None
+    ) -> BulkResult[T]:
+        """
+        Deletes the objects with a single DELETE ... RETURNING.
+        """
+        if not object_ids:
+            return BulkResult()
+        deleted = list(self.db.scalars(self.delete_by_ids(object_ids, filters)))
+        for obj in deleted:
+            # Detached objects keep their loaded values after the commit.
+            self.db.expunge(obj)
+        self.db.commit()
+        return self.deleted_result(object_ids, deleted)
+
+    def ensure_indexes(self) -> None:
+        """
+        Creates the indexes declared in the model table that do not exist yet,
+        and on SQLite the full-text search table of the search fields.
+        """
+        bind = self.db.get_bind()
+        for index in self.model.__table__.indexes:
+            index.create(bind=bind, checkfirst=True)
+        search_fields = getattr(self.model, "__search_fields__", None)
+        if search_fields and bind.dialect.name == "sqlite":
+            with bind.begin() as connection:
+                ensure_full_text_search(connection, self.model.__table__, search_fields)
+
+    def missing_indexes(self) -> List[str]:
+        """
+        Returns the names of the indexes declared in the model table that do not exist.
+        """
+        existing = {
+            index["name"]
+            for index in inspect(self.db.get_bind()).get_indexes(
+                self.model.__tablename__
+            )
+        }
+        missing = [
+            index.name
+            for index in self.model.__table__.indexes
+            if index.name not in existing
+        ]
+        bind = self.db.get_bind()
+        if (
+            getattr(self.model, "__search_fields__", None)
+            and bind.dialect.name == "sqlite"
+        ):
+            with bind.connect() as connection:
+                if not full_text_search_exists(connection, self.model.__table__):
+                    missing.append(fts_table_name(self.model.__table__))
+        return missing
@@ -0,0 +1,14 @@
+from fastapi import APIRouter
+
+from app.str_doc.metrics import get_metrics_responses
+from app.utils.metrics import collect_metrics
+
+metrics_router = APIRouter()
+
+
+@metrics_router.get("", status_code=200, responses=get_metrics_responses)
+async def get_metrics():
+    """
+    Returns the runtime metrics of the application components, such as caches.
+    """
+    return collect_metrics()
@@ -1,25 +1,465 @@
-from typing import List
+import csv
+import io
+import os
+from dataclasses import dataclass
+from datetime import datetime
+from typing import AsyncIterator, List, Literal, Tuple
 
-from fastapi import APIRouter, Depends, Query
+import orjson
+from fastapi import APIRouter, Depends, Header, Query, Request, Response
 from fastapi import HTTPException, status
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from fastapi.security import OAuth2PasswordBearer
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
-from app.database_settings import get_session_local
-from app.schemas.movie import MovieCreate, MovieResponse
+from app.database_settings import get_async_session, get_async_session_factory
+from app.models.movie import GenreEnum, Movie
+from app.repositories.base_repository import BulkResult, In, Range, Sort
+from app.repositories.get_repository import is_valid_id, parse_id
+from app.schemas.movie import (
+    BulkRowError,
+    MovieBulkCreate,
+    MovieBulkDelete,
+    MovieBulkDeleteResponse,
+    MovieBulkResponse,
+    MovieBulkUpdate,
+    MovieChanges,
+    MovieCreate,
+    MovieResponse,
+    MovieStatsResponse,
+    MovieUpdate,
+)
+from app.services.movie_count_service import (
+    PUBLIC_COUNT_SCOPE,
+    MovieCountService,
+    user_count_scope,
+)
 from app.services.movie_service import MovieService
+from app.services.movie_stats_service import MovieStatsService, MovieWrite
 from app.str_doc.movie import (
+    movie_export_responses,
+    movie_bulk_create_responses,
+    movie_bulk_delete_responses,
+    movie_bulk_update_responses,
     create_movie_responses,
     movie_public_responses,
+    movie_search_responses,
+    movie_stats_responses,
     movie_update_responses,
     movie_user_responses,
     movie_delete_responses,
 )
-from app.utils.auth_user import validate_current_user, get_current_user
+from app.utils.auth_user import (
+    get_current_user_async,
+    validate_current_user_async,
+)
+from app.utils.cursor import InvalidCursorError, decode_cursor, encode_cursor
+from app.utils.movie_versions import (
+    PUBLIC_SCOPE,
+    etag_matches,
+    movie_versions,
+    user_scope,
+)
+from app.utils.pagination import NEXT_CURSOR_HEADER, pagination_headers
+from app.utils.public_movie_cache import invalidate_public_movies, public_movie_cache
 
 oauth2_scheme = OAuth2PasswordBearer(
     tokenUrl="/user/login",
 )
-movie_router = APIRouter()
+optional_oauth2_scheme = OAuth2PasswordBearer(
+    tokenUrl="/user/login",
+    auto_error=False,
+)
+movie_router = APIRouter(default_response_class=ORJSONResponse)
+
+MOVIE_EXPORT_BATCH_SIZE = int(os.getenv("MOVIE_EXPORT_BATCH_SIZE", "1000"))
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+MovieSortOrder = Literal[
+    "id", "rating", "-rating", "created_at", "-created_at", "title", "-title"
+]
+
+# JSON types of the sort value stored in the cursor of a sorted listing.
+# created_at is stored as an ISO string.
+SORT_VALUE_TYPES = {"rating": (int, float), "created_at": (str,), "title": (str,)}
+
+movie_list_adapter = TypeAdapter(List[MovieResponse])
+MOVIE_FIELDS = tuple(MovieResponse.model_fields)
+
+
+@dataclass(frozen=True)
+class MovieListQuery:
+    """
+    Filters and order of a movie listing, with a key identifying them in
+    caches and ETags.
+    """
+
+    filters: dict
+    sort: Sort | None
+    key: tuple
+
+
+def movie_list_query(
+    min_year: int = Query(
+        None, description="Only movies published this year or later."
+    ),
+    max_year: int = Query(
+        None, description="Only movies published this year or earlier."
+    ),
+    min_rating: float = Query(None, description="Only movies rated at least this."),
+    max_rating: float = Query(None, description="Only movies rated at most this."),
+    genre: List[GenreEnum] = Query(
+        None, description="Only movies of these genres. Can be repeated."
+    ),
+    sort: MovieSortOrder = Query(
+        "id",
+        description="Order of the movies. A leading '-' sorts in descending order. Ties are in id order, in the same direction.",
+    ),
+) -> MovieListQuery:
+    """
+    Reads the filter and sort query parameters of the movie listings.
+    """
+    filters = {}
+    if min_year is not None or max_year is not None:
+        filters["publication_year"] = Range(min_year, max_year)
+    if min_rating is not None or max_rating is not None:
+        filters["rating"] = Range(min_rating, max_rating)
+    genres = tuple(sorted(set(genre or []), key=lambda value: value.value))
+    if genres:
+        filters["genre"] = In(genres)
+    order = None
+    if sort != "id":
+        order = Sort(sort.lstrip("-"), descending=sort.startswith("-"))
+    key = (
+        min_year,
+        max_year,
+        min_rating,
+        max_rating,
+        tuple(value.value for value in genres),
+        sort,
+    )
+    return MovieListQuery(filters, order, key)
+
+
+def movie_fields(
+    fields: str = Query(
+        None,
+        description="Comma-separated fields to return, such as 'title,rating'. The id is always returned. All fields by default.",
+    ),
+) -> Tuple[str, ...] | None:
+    """
+    Reads the fields of a sparse movie listing, in response order with the id.
+    """
+    if fields is None:
+        return None
+    requested = {field.strip() for field in fields.split(",")} - {""}
+    unknown = requested - MovieResponse.model_fields.keys()
+    if unknown or not requested:
+        detail = {
+            "error": {
+                "code": "INVALID_FIELDS",
+                "message": f"Unknown fields: {', '.join(sorted(unknown)) or fields}.",
+            }
+        }
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+    return tuple(
+        field
+        for field in MovieResponse.model_fields
+        if field in requested or field == "id"
+    )
+
+
+def movie_read_fields(
+    fields: Tuple[str, ...] | None, sort: Sort = None
+) -> Tuple[str, ...] | None:
+    """
+    Returns the fields read for a sparse listing: the requested ones and the
+    sort field, which the next cursor is made of.
+    """
+    if fields is None or sort is None or sort.field in fields:
+        return fields
+    return (*fields, sort.field)
+
+
+def encode_movie_rows(rows: List[dict]) -> bytes:
+    """
+    Encodes movie rows read with `to_rows` as a JSON list.
+    """
+    return orjson.dumps(rows)
+
+
+def serialize_movie_page(
+    repository, objects: list, page_size: int, sort: Sort, fields: Tuple[str, ...]
+) -> Tuple[bytes, str | None]:
+    """
+    Serializes a page of movies, with only `fields` when given, and returns
+    it with the cursor of the next page. The movies were validated when
+    written, so they are read into rows and encoded without building a
+    MovieResponse per movie.
+    """
+    read_fields = movie_read_fields(fields, sort) or MOVIE_FIELDS
+    rows = repository.to_rows(objects, read_fields)
+    next_cursor = get_next_cursor(rows, page_size, sort)
+    if fields is not None and len(read_fields) > len(fields):
+        for row in rows:
+            del row[sort.field]
+    return encode_movie_rows(rows), next_cursor
+
+
+def invalid_cursor_exception() -> HTTPException:
+    """
+    Returns the exception raised for a cursor that cannot be decoded.
+    """
+    detail = {
+        "error": {
+            "code": "INVALID_CURSOR",
+            "message": "Invalid pagination cursor.",
+        }
+    }
+    return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+
+
+def decode_cursor_or_400(cursor: str | None, sort: Sort = None):
+    """
+    Returns the keyset position stored in the cursor: the last seen id, or
+    the last (sort value, id) for sorted listings. None when no cursor is
+    given. The id must have the id type of the backend.
+    """
+    if cursor is None:
+        return None
+    try:
+        position = decode_cursor(cursor)
+    except InvalidCursorError:
+        raise invalid_cursor_exception()
+    if not is_valid_id(position["id"]):
+        raise invalid_cursor_exception()
+    if sort is None:
+        return position["id"]
+    if "value" not in position:
+        raise invalid_cursor_exception()
+    value = position["value"]
+    if value is None:
+        if not Movie.__table__.c[sort.field].nullable:
+            raise invalid_cursor_exception()
+        return value, position["id"]
+    if isinstance(value, bool) or not isinstance(value, SORT_VALUE_TYPES[sort.field]):
+        raise invalid_cursor_exception()
+    if sort.field == "created_at":
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            raise invalid_cursor_exception()
+    return value, position["id"]
+
+
+def decode_search_cursor_or_400(cursor: str | None) -> dict | None:
+    """
+    Returns the score and id of the last search result seen, or None when
+    no cursor is given. The id must have the id type of the backend.
+    """
+    if cursor is None:
+        return None
+    try:
+        position = decode_cursor(cursor)
+    except InvalidCursorError:
+        raise invalid_cursor_exception()
+    score = position.get("score")
+    if isinstance(score, bool) or not isinstance(score, (int, float)):
+        raise invalid_cursor_exception()
+    if not is_valid_id(position["id"]):
+        raise invalid_cursor_exception()
+    return position
+
+
+def get_next_cursor(rows: List[dict], page_size: int, sort: Sort = None) -> str | None:
+    """
+    Returns the cursor of the next page of movie rows, or None when the page
+    is not full.
+    """
+    if not rows or len(rows) < page_size:
+        return None
+    position = {"id": rows[-1]["id"]}
+    if sort is not None:
+        value = rows[-1][sort.field]
+        position["value"] = value.isoformat() if isinstance(value, datetime) else value
+    return encode_cursor(position)
+
+
+async def get_listing_total(
+    session_database, scope: str, list_query: MovieListQuery
+) -> int | None:
+    """
+    Returns the maintained count of a listing scope. Listings narrowed by
+    filters have no count, so their total is None.
+    """
+    if list_query.filters:
+        return None
+    return await MovieCountService(session_database).get_total_async(scope)
+
+
+def movies_response(body: bytes, headers: dict, etag: str) -> Response:
+    """
+    Builds the response of a serialized movie page.
+    """
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": etag, **headers},
+    )
+
+
+def not_modified_response(etag: str) -> Response:
+    """
+    Builds the 304 response sent when the client already has the page.
+    """
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+
+def validation_message(error: dict) -> str:
+    """
+    Formats a validation error of a row like the request validation errors.
+    """
+    field = ".".join(map(str, error["loc"]))
+    return f"Error in field '{field}': {error['msg']}" if field else error["msg"]
+
+
+def to_movie_responses(repository, objects: list) -> List[MovieResponse]:
+    """
+    Converts the objects returned by a repository into movie responses.
+    """
+    return movie_list_adapter.validate_python(
+        repository.to_schema(objects, MovieResponse) or [], from_attributes=True
+    )
+
+
+def encode_export_batch(movies: List[MovieResponse], export_format: str) -> bytes:
+    """
+    Serializes a batch of exported movies as NDJSON lines or CSV rows.
+    """
+    if export_format == "ndjson":
+        return b"".join(movie.model_dump_json().encode() + b"\n" for movie in movies)
+    output = io.StringIO()
+    writer = csv.writer(output)
+    for movie in movies:
+        writer.writerow(movie.model_dump(mode="json").values())
+    return output.getvalue().encode()
+
+
+async def stream_export(
+    session, repository, batches: AsyncIterator, first_batch: list, export_format: str
+) -> AsyncIterator[bytes]:
+    """
+    Streams the exported movies one batch at a time, closing the session at the end.
+    """
+    try:
+        if export_format == "csv":
+            output = io.StringIO()
+            csv.writer(output).writerow(MovieResponse.model_fields)
+            yield output.getvalue().encode()
+        batch = first_batch
+        while batch:
+            yield encode_export_batch(
+                to_movie_responses(repository, batch), export_format
+            )
+            batch = await anext(batches, None)
+    finally:
+        await batches.aclose()
+        await session.close()
+
+
+def validate_rows(rows: List[dict], schema: type[BaseModel], unique: str = None):
+    """
+    Validates every row in one pass. Returns the positions and data of the
+    valid rows along with an error for each invalid one. With `unique`,
+    a row repeating the value of that field of an earlier valid row is
+    rejected, so a movie is written once per batch.
+    """
+    indexes, rows_data, errors = [], [], []
+    seen = set()
+    for index, row in enumerate(rows):
+        try:
+            row_data = schema.model_validate(row).model_dump(exclude_unset=True)
+        except ValidationError as e:
+            message = "; ".join(validation_message(error) for error in e.errors())
+            errors.append(
+                BulkRowError(index=index, code="INVALID_DATA", message=message)
+            )
+            continue
+        if unique is not None:
+            if str(row_data[unique]) in seen:
+                message = f"Duplicate {unique} of an earlier row."
+                errors.append(
+                    BulkRowError(index=index, code="DUPLICATE_ID", message=message)
+                )
+                continue
+            seen.add(str(row_data[unique]))
+        indexes.append(index)
+        rows_data.append(row_data)
+    return indexes, rows_data, errors
+
+
+def bulk_errors(
+    errors: List[BulkRowError], indexes: List[int], result: BulkResult
+) -> List[BulkRowError]:
+    """
+    Adds the errors of the repository, whose positions refer to the valid
+    rows only, to the validation errors.
+    """
+    errors = errors + [
+        BulkRowError(index=indexes[error.index], code=error.code, message=error.message)
+        for error in result.errors
+    ]
+    return sorted(errors, key=lambda error: error.index)
+
+
+def movie_written(user_id: str | int, *is_public: bool) -> None:
+    """
+    Bumps the listing versions of a written movie and, if the movie was or
+    became public, empties the public movie cache.
+    """
+    movie_versions.bump(user_scope(user_id))
+    if any(is_public):
+        movie_versions.bump(PUBLIC_SCOPE)
+    invalidate_public_movies(*is_public)
+
+
+async def record_movie_writes(session_database, writes: List[MovieWrite]) -> None:
+    """
+    Applies the written movies, as (before, after) pairs, to the maintained
+    movie counts and statistics.
+    """
+    await MovieCountService(session_database).record_async(
+        (
+            (before or after).user_id,
+            before.is_public if before else None,
+            after.is_public if after else None,
+        )
+        for before, after in writes
+    )
+    await MovieStatsService(session_database).record_async(writes)
+
+
+async def movie_write_exception(repository, movie_id: int | str) -> HTTPException:
+    """
+    Returns the exception raised when a conditional write matched no movie:
+    404 if the movie does not exist, 403 if the user may not write it.
+    Telling them apart takes one more read, but only when the write failed:
+    writes that succeed still take a single statement.
+    """
+    if await repository.get_object(movie_id) is None:
+        detail = {
+            "error": {
+                "code": "NOT_FOUND",
+                "message": "Movie not found.",
+            }
+        }
+        return HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=detail)
+    detail = {
+        "error": {
+            "code": "UNAUTHORIZED",
+            "message": "You are not authorized to perform this action.",
+        }
+    }
+    return HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=detail)
 
 
 @movie_router.post(
@@ -28,16 +468,16 @@ movie_router = APIRouter()
     response_model=MovieResponse,
     responses=create_movie_responses,
 )
-def create_movie(
+async def create_movie(
     movie_data: MovieCreate,
     token: str = Depends(oauth2_scheme),
-    session_database=Depends(get_session_local),
+    session_database=Depends(get_async_session),
 ):
     """
     Creates a new movie associated with the authenticated user.
     The movie can be private or public.
     """
-    current_user = get_current_user(token, session_database)
+    current_user = await get_current_user_async(token, session_database)
     if not current_user:
         detail = {
             "error": {
@@ -54,31 +494,73 @@ def create_movie(
     movi_service = MovieService(session_database)
     movie_data_dict = movie_data.model_dump()
     movie_data_dict["user_id"] = current_user.id
-    new_movie = movi_service.repository.create_object(movie_data_dict)
+    new_movie = await movi_service.repository.create_object(movie_data_dict)
+    await record_movie_writes(
+        session_database,
+        [(None, to_movie_responses(movi_service.repository, [new_movie])[0])],
+    )
+    movie_written(current_user.id, movie_data.is_public)
     return new_movie
 
 
 @movie_router.get(
     "/public", response_model=List[MovieResponse], responses=movie_public_responses
 )
-def get_public_movies(
+async def get_public_movies(
+    request: Request,
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100),
-    session_database=Depends(get_session_local),
+    cursor: str = Query(
+        None,
+        description="Opaque cursor from the X-Next-Cursor header. Takes precedence over page.",
+    ),
+    list_query: MovieListQuery = Depends(movie_list_query),
+    fields: Tuple[str, ...] | None = Depends(movie_fields),
+    if_none_match: str = Header(None),
+    session_database=Depends(get_async_session),
 ):
     """
-    Retrieve all public movies with pagination.
+    Retrieve all public movies with pagination, filters and sorting.
+    Pages are served from an in-process cache emptied whenever a public movie changes.
+    Unfiltered listings report their total in X-Total-Count.
     """
-    movie_service = MovieService(session_database)
-    offset = (page - 1) * page_size
-    public_movies = movie_service.repository.get_objects_by_filters(
-        filters={"is_public": True},
-        offset=offset,
-        limit=page_size,
+    after = decode_cursor_or_400(cursor, list_query.sort)
+    page_key = ("cursor", after) if after is not None else (page,)
+    cache_key = (*page_key, page_size, *list_query.key, fields)
+    etag = movie_versions.etag(PUBLIC_SCOPE, *cache_key)
+    if etag_matches(if_none_match, etag):
+        return not_modified_response(etag)
+
+    page_content = public_movie_cache.get(cache_key)
+    if page_content is None:
+        generation = public_movie_cache.generation
+        movie_service = MovieService(session_database)
+        offset = 0 if after is not None else (page - 1) * page_size
+        public_movies = await movie_service.repository.get_objects_by_filters(
+            filters={"is_public": True, **list_query.filters},
+            offset=offset,
+            limit=page_size,
+            after=after,
+            sort=list_query.sort,
+            fields=movie_read_fields(fields, list_query.sort),
+        )
+        page_content = (
+            *serialize_movie_page(
+                movie_service.repository,
+                public_movies,
+                page_size,
+                list_query.sort,
+                fields,
+            ),
+            await get_listing_total(session_database, PUBLIC_COUNT_SCOPE, list_query),
+        )
+        public_movie_cache.set(cache_key, page_content, generation)
+
+    body, next_cursor, total = page_content
+    headers = pagination_headers(
+        request.url, page if after is None else None, page_size, total, next_cursor
     )
-    if not public_movies:
-        return []
-    return movie_service.repository.to_schema(public_movies, MovieResponse)
+    return movies_response(body, headers, etag)
 
 
 @movie_router.get(
@@ -86,7 +568,8 @@ def get_public_movies(
     response_model=List[MovieResponse],
     responses=movie_user_responses,
 )
-def get_user_movies(
+async def get_user_movies(
+    request: Request,
     token: str = Depends(oauth2_scheme),
     is_public: bool = Query(
         None,
@@ -94,39 +577,262 @@ def get_user_movies(
     ),
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100),
-    session_database=Depends(get_session_local),
+    cursor: str = Query(
+        None,
+        description="Opaque cursor from the X-Next-Cursor header. Takes precedence over page.",
+    ),
+    list_query: MovieListQuery = Depends(movie_list_query),
+    fields: Tuple[str, ...] | None = Depends(movie_fields),
+    if_none_match: str = Header(None),
+    session_database=Depends(get_async_session),
 ):
     """
-    Retrieve all movies public and private created by the authenticated user.
+    Retrieve all movies public and private created by the authenticated user,
+    with filters and sorting. Unfiltered listings report their total in
+    X-Total-Count.
     """
-    current_user = validate_current_user(token, session_database)
-    filters = {"user_id": current_user.id}
+    after = decode_cursor_or_400(cursor, list_query.sort)
+    current_user = await validate_current_user_async(token, session_database)
+    page_key = ("cursor", after) if after is not None else (page,)
+    etag = movie_versions.etag(
+        user_scope(current_user.id),
+        is_public,
+        page_size,
+        *page_key,
+        *list_query.key,
+        fields,
+    )
+    if etag_matches(if_none_match, etag):
+        return not_modified_response(etag)
+
+    filters = {"user_id": current_user.id, **list_query.filters}
     if is_public is not None:
         filters["is_public"] = is_public
 
     movie_service = MovieService(session_database)
-    offset = (page - 1) * page_size
-    user_movies = movie_service.repository.get_objects_by_filters(
+    offset = 0 if after is not None else (page - 1) * page_size
+    user_movies = await movie_service.repository.get_objects_by_filters(
         filters=filters,
         offset=offset,
         limit=page_size,
+        after=after,
+        sort=list_query.sort,
+        fields=movie_read_fields(fields, list_query.sort),
+    )
+
+    body, next_cursor = serialize_movie_page(
+        movie_service.repository, user_movies, page_size, list_query.sort, fields
+    )
+    total = await get_listing_total(
+        session_database, user_count_scope(current_user.id, is_public), list_query
     )
+    headers = pagination_headers(
+        request.url, page if after is None else None, page_size, total, next_cursor
+    )
+    return movies_response(body, headers, etag)
+
 
-    return movie_service.repository.to_schema(user_movies, MovieResponse)
+@movie_router.get(
+    "/search", response_model=List[MovieResponse], responses=movie_search_responses
+)
+async def search_movies(
+    q: str = Query(
+        ..., min_length=1, max_length=200, description="Words to search for."
+    ),
+    page_size: int = Query(10, ge=1, le=100),
+    cursor: str = Query(
+        None,
+        description="Opaque cursor from the X-Next-Cursor header.",
+    ),
+    token: str = Depends(optional_oauth2_scheme),
+    session_database=Depends(get_async_session),
+):
+    """
+    Full-text search over the title and description of the public movies
+    and, when authenticated, of the user's own movies. Best matches first.
+    """
+    after = decode_search_cursor_or_400(cursor)
+    any_filters = [{"is_public": True}]
+    if token is not None:
+        current_user = await validate_current_user_async(token, session_database)
+        any_filters.append({"user_id": current_user.id})
+
+    movie_service = MovieService(session_database)
+    try:
+        results = await movie_service.repository.search_objects(
+            q, any_filters=any_filters, limit=page_size, after=after
+        )
+    except InvalidCursorError:
+        raise invalid_cursor_exception()
+    rows = movie_service.repository.to_rows([obj for obj, _ in results], MOVIE_FIELDS)
+    headers = {}
+    if len(results) == page_size:
+        headers[NEXT_CURSOR_HEADER] = encode_cursor(
+            {"id": rows[-1]["id"], "score": results[-1][1]}
+        )
+    return Response(
+        content=encode_movie_rows(rows), media_type="application/json", headers=headers
+    )
+
+
+@movie_router.post(
+    "/bulk",
+    response_model=MovieBulkResponse,
+    responses=movie_bulk_create_responses,
+)
+async def create_movies(
+    bulk_data: MovieBulkCreate,
+    token: str = Depends(oauth2_scheme),
+    session_database=Depends(get_async_session),
+):
+    """
+    Creates several movies associated with the authenticated user in one batch.
+    Rows that fail are reported in `errors` with their position.
+    """
+    current_user = await validate_current_user_async(token, session_database)
+    indexes, movies_data, errors = validate_rows(bulk_data.movies, MovieCreate)
+    for movie_data in movies_data:
+        movie_data["user_id"] = current_user.id
+
+    movie_service = MovieService(session_database)
+    result = await movie_service.repository.create_objects(movies_data)
+    movies = to_movie_responses(movie_service.repository, result.objects)
+    await record_movie_writes(session_database, [(None, movie) for movie in movies])
+    movie_written(current_user.id, *(movie.is_public for movie in movies))
+    return MovieBulkResponse(movies=movies, errors=bulk_errors(errors, indexes, result))
+
+
+@movie_router.put(
+    "/bulk",
+    response_model=MovieBulkResponse,
+    responses=movie_bulk_update_responses,
+)
+async def update_movies(
+    bulk_data: MovieBulkUpdate,
+    token: str = Depends(oauth2_scheme),
+    session_database=Depends(get_async_session),
+):
+    """
+    Updates several movies owned by the authenticated user in one batch.
+    Every row holds the movie "id" and the fields to update.
+    """
+    current_user = await validate_current_user_async(token, session_database)
+    indexes, movies_data, errors = validate_rows(
+        bulk_data.movies, MovieUpdate, unique="id"
+    )
+
+    movie_service = MovieService(session_database)
+    result = await movie_service.repository.update_objects(
+        movies_data, filters={"user_id": current_user.id}
+    )
+    movies = to_movie_responses(movie_service.repository, result.objects)
+    previous = {
+        movie.id: movie
+        for movie in to_movie_responses(movie_service.repository, result.previous)
+    }
+    await record_movie_writes(
+        session_database,
+        [(previous[movie.id], movie) for movie in movies if movie.id in previous],
+    )
+    visibility_changed = any("is_public" in movie_data for movie_data in movies_data)
+    movie_written(
+        current_user.id, visibility_changed, *(movie.is_public for movie in movies)
+    )
+    return MovieBulkResponse(movies=movies, errors=bulk_errors(errors, indexes, result))
+
+
+@movie_router.post(
+    "/bulk/delete",
+    response_model=MovieBulkDeleteResponse,
+    responses=movie_bulk_delete_responses,
+)
+async def delete_movies(
+    bulk_data: MovieBulkDelete,
+    token: str = Depends(oauth2_scheme),
+    session_database=Depends(get_async_session),
+):
+    """
+    Deletes several movies owned by the authenticated user in one batch.
+    """
+    current_user = await validate_current_user_async(token, session_database)
+
+    movie_service = MovieService(session_database)
+    result = await movie_service.repository.delete_objects(
+        bulk_data.ids, filters={"user_id": current_user.id}
+    )
+    movies = to_movie_responses(movie_service.repository, result.objects)
+    await record_movie_writes(session_database, [(movie, None) for movie in movies])
+    movie_written(current_user.id, *(movie.is_public for movie in movies))
+    return MovieBulkDeleteResponse(
+        ids=[movie.id for movie in movies],
+        errors=bulk_errors([], list(range(len(bulk_data.ids))), result),
+    )
+
+
+@movie_router.get(
+    "/stats", response_model=MovieStatsResponse, responses=movie_stats_responses
+)
+async def get_movie_stats(session_database=Depends(get_async_session)):
+    """
+    Returns how the public movies spread over genres, ratings and decades.
+    The figures are kept up to date on every write, so no movie is read.
+    """
+    return await MovieStatsService(session_database).get_stats_async()
+
+
+@movie_router.get("/export", responses=movie_export_responses)
+async def export_movies(
+    export_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+    resume_after: str = Query(
+        None,
+        description="Id of the last movie received. The export continues after it.",
+    ),
+    session_factory=Depends(get_async_session_factory),
+):
+    """
+    Streams every public movie in id order as NDJSON or CSV.
+    An interrupted export is resumed with the id of the last movie received.
+    """
+    try:
+        after = parse_id(resume_after) if resume_after is not None else None
+    except ValueError:
+        detail = {
+            "error": {
+                "code": "INVALID_CURSOR",
+                "message": "Invalid resume position.",
+            }
+        }
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+
+    session = session_factory()
+    repository = MovieService(session).repository
+    batches = repository.get_object_batches(
+        {"is_public": True}, after=after, batch_size=MOVIE_EXPORT_BATCH_SIZE
+    )
+    first_batch = await anext(batches, None)
+
+    return StreamingResponse(
+        stream_export(session, repository, batches, first_batch, export_format),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="movies.{export_format}"'
+        },
+    )
 
 
 @movie_router.put(
     "/{movie_id}", response_model=MovieResponse, responses=movie_update_responses
 )
-def update_private_movie(
+async def update_private_movie(
     movie_id: int | str,
-    movie_data: dict,
+    movie_changes: MovieChanges,
     token: str = Depends(oauth2_scheme),
-    session_database=Depends(get_session_local),
+    session_database=Depends(get_async_session),
 ):
     """
     Update at least one field of a private movie owned by the authenticated user.
     """
+    movie_data = movie_changes.model_dump(exclude_unset=True)
     if not movie_data:
         detail = {
             "error": {
@@ -138,74 +844,50 @@ def update_private_movie(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=detail,
         )
-    current_user = validate_current_user(token, session_database)
+    current_user = await validate_current_user_async(token, session_database)
 
     movie_service = MovieService(session_database)
-    movie = movie_service.repository.get_object(movie_id)
-
-    if not movie:
-        detail = {
-            "error": {
-                "code": "NOT_FOUND",
-                "message": "Movie not found.",
-            }
-        }
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=detail)
-
-    movie_obj = movie_service.repository.to_schema(movie, MovieResponse)
-    if not movie_obj.is_public and movie_obj.user_id != current_user.id:
-        detail = {
-            "error": {
-                "code": "UNAUTHORIZED",
-                "message": "You are not authorized to perform this action.",
-            }
-        }
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail=detail,
-        )
+    # Public movies can be updated by anyone, private ones only by their owner.
+    result = await movie_service.repository.update_matching_object(
+        movie_id,
+        movie_data,
+        any_filters=[{"is_public": True}, {"user_id": current_user.id}],
+    )
+    if not result.objects:
+        raise await movie_write_exception(movie_service.repository, movie_id)
 
-    updated_movie = movie_service.repository.update_object(movie_id, movie_data)
-    return movie_service.repository.to_schema(updated_movie, MovieResponse)
+    updated_movie = movie_service.repository.to_schema(result.objects[0], MovieResponse)
+    previous = to_movie_responses(movie_service.repository, result.previous)
+    await record_movie_writes(
+        session_database, [(movie, updated_movie) for movie in previous]
+    )
+    movie_written(
+        updated_movie.user_id, "is_public" in movie_data, updated_movie.is_public
+    )
+    return updated_movie
 
 
 @movie_router.delete(
     "/{movie_id}/delete", status_code=204, responses=movie_delete_responses
 )
-def delete_movie(
+async def delete_movie(
     movie_id: int | str,
     token: str = Depends(oauth2_scheme),
-    session_database=Depends(get_session_local),
+    session_database=Depends(get_async_session),
 ):
     """
     Delete a private movie owned by the authenticated user.
     """
-    current_user = validate_current_user(token, session_database)
+    current_user = await validate_current_user_async(token, session_database)
 
     movie_service = MovieService(session_database)
-    movie = movie_service.repository.get_object(movie_id)
-
-    if not movie:
-        detail = {
-            "error": {
-                "code": "NOT_FOUND",
-                "message": "Movie not found.",
-            }
-        }
+    movie = await movie_service.repository.delete_matching_object(
+        movie_id, any_filters=[{"user_id": current_user.id}]
+    )
+    if movie is None:
+        raise await movie_write_exception(movie_service.repository, movie_id)
 
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=detail)
     movie = movie_service.repository.to_schema(movie, MovieResponse)
-    if movie.user_id != current_user.id:
-        detail = {
-            "error": {
-                "code": "UNAUTHORIZED",
-                "message": "You are not authorized to perform this action.",
-            }
-        }
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail=detail,
-        )
-
-    movie_service.repository.delete_object(movie_id)
+    await record_movie_writes(session_database, [(movie, None)])
+    movie_written(movie.user_id, movie.is_public)
     return {"detail": "Movie deleted successfully"}
@@ -1,10 +1,35 @@
-from fastapi import APIRouter, HTTPException
+from typing import List
 
-from app.str_doc.time_data import get_time_responses
-from app.utils.get_with_retry import get_with_retry
+from fastapi import APIRouter, HTTPException, Query, status
+
+from app.services.time_service import (
+    UnknownTimeZoneError,
+    get_time_data,
+    get_world_time_url,
+    get_zone_index,
+    get_zone_name,
+)
+from app.str_doc.time_data import get_time_responses, get_zones_responses
 
 time_router = APIRouter()
-WORLD_TIME_API_URL = "http://worldtimeapi.org/api/timezone"
+
+
+@time_router.get(
+    "/zones",
+    response_model=List[str],
+    responses=get_zones_responses,
+)
+async def get_zones(
+    area: str = Query(None, description="Only list the zones of an area."),
+):
+    """
+    Lists the time zones known by the local time engine.
+    """
+    zones = get_zone_index()
+    if area:
+        prefix = f"{area}/"
+        return [zone for zone in zones if zone.startswith(prefix)]
+    return zones
 
 
 @time_router.get(
@@ -12,33 +37,31 @@ WORLD_TIME_API_URL = "http://worldtimeapi.org/api/timezone"
     status_code=200,
     responses=get_time_responses,
 )
-def get_time(area: str, location: str, region: str = None):
+async def get_time(area: str, location: str, region: str = None):
     """
     Retrieves time data for an area/location and an optional parameter region.
     """
-    url_parts = [WORLD_TIME_API_URL, area, location]
-    if region:
-        url_parts.append(region)
-
-    world_time_url = "/".join(url_parts)
+    zone_name = get_zone_name(area, location, region)
 
     try:
-        time_data = get_with_retry(world_time_url)
+        return await get_time_data(zone_name)
+    except UnknownTimeZoneError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "error": {
+                    "code": "NOT_FOUND",
+                    "message": f"Unknown time zone {zone_name}.",
+                }
+            },
+        )
     except Exception as e:
         raise HTTPException(
             status_code=502,
             detail={
                 "error": {
                     "code": "REQUEST_ERROR",
-                    "message": f"Error during request to {world_time_url}.",
+                    "message": f"Error during request to {get_world_time_url(zone_name)}.",
                 }
             },
         )
-
-    result = {
-        "datetime": time_data.get("datetime"),
-        "utc_datetime": time_data.get("utc_datetime"),
-        "utc_offset": time_data.get("utc_offset"),
-    }
-
-    return result
@@ -3,50 +3,82 @@ from typing import Annotated
 from fastapi import APIRouter, HTTPException, Depends
 from fastapi.security import OAuth2PasswordRequestForm
 
-from app.database_settings import get_session_local
+from app.database_settings import get_async_session
 from app.schemas.user import UserCreate
 from app.services.user_service import UserService
 from app.str_doc.user import create_user_responses, login_responses
 from app.utils.jwt_handler import create_access_token
-from app.utils.password_hasher import BcryptPasswordHasher
+from app.utils.password_hasher import (
+    BcryptPasswordHasher,
+    PasswordHashingPoolFullError,
+)
+from app.utils.user_cache import invalidate_user
 
 user_router = APIRouter()
 
 
+def service_busy_exception(error: PasswordHashingPoolFullError) -> HTTPException:
+    """
+    Returns the exception raised when the password hashing queue is full.
+    """
+    detail = {
+        "error": {
+            "code": "SERVICE_BUSY",
+            "message": "Too many requests, try again later.",
+        }
+    }
+    return HTTPException(
+        status_code=503,
+        detail=detail,
+        headers={"Retry-After": str(error.retry_after)},
+    )
+
+
 @user_router.post("/create", status_code=201, responses=create_user_responses)
-def create_user(
+async def create_user(
     user_data: UserCreate,
-    session_database=Depends(get_session_local),
+    session_database=Depends(get_async_session),
 ):
     """
     Creates a new user if they are not already registered.
     """
     service = UserService(session_database)
-    existing_user = service.get_user_by_email(user_data.email)
+    existing_user = await service.get_user_by_email_async(user_data.email)
     if existing_user:
         detail = {
             "error": {"code": "USER_ALREADY_EXISTS", "message": "User already exists"},
         }
         raise HTTPException(status_code=400, detail=detail)
-    user_data.password = BcryptPasswordHasher.hash_password(user_data.password)
-    service.repository.create_object(user_data.model_dump())
+    try:
+        user_data.password = await BcryptPasswordHasher.hash_password_async(
+            user_data.password
+        )
+    except PasswordHashingPoolFullError as e:
+        raise service_busy_exception(e)
+    await service.repository.create_object(user_data.model_dump())
+    invalidate_user(user_data.email)
     return {"detail": "User created"}
 
 
 @user_router.post("/login", status_code=200, responses=login_responses)
-def login(
+async def login(
     login_data: Annotated[OAuth2PasswordRequestForm, Depends()],
-    session_database=Depends(get_session_local),
+    session_database=Depends(get_async_session),
 ):
     """
     Authenticates a user and returns a JWT access token if the credentials are valid.
     """
     service = UserService(session_database)
 
-    user = service.get_user_by_email(login_data.username)
-    if not user or not BcryptPasswordHasher.verify_password(
-        login_data.password, user.password
-    ):
+    user = await service.get_user_by_email_async(login_data.username)
+    try:
+        valid_password = user and await BcryptPasswordHasher.verify_password_async(
+            login_data.password, user.password
+        )
+    except PasswordHashingPoolFullError as e:
+        raise service_busy_exception(e)
+
+    if not valid_password:
         detail = {
             "error": {"code": "AUTH_ERROR", "message": "Invalid email or password"}
         }
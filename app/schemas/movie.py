@@ -1,9 +1,13 @@
+import os
 from datetime import datetime
+from typing import Dict, List
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from app.models.movie import GenreEnum
 
+MOVIE_BULK_MAX_ROWS = int(os.getenv("MOVIE_BULK_MAX_ROWS", "5000"))
+
 
 class MovieCreate(BaseModel):
     title: str
@@ -27,3 +31,88 @@ class MovieResponse(BaseModel):
 
     class ConfigDict:
         from_attributes = True
+
+
+class MovieChanges(BaseModel):
+    """
+    Fields of a movie that can be updated. Unknown fields, the id and the
+    owner are rejected.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    title: str = None
+    description: str = None
+    publication_year: int = None
+    genre: GenreEnum = None
+    rating: float = None
+    is_public: bool = None
+
+
+class MovieUpdate(MovieChanges):
+    """
+    Row of a bulk update: the id of the movie and the fields to update.
+    """
+
+    id: str | int
+
+    @model_validator(mode="after")
+    def check_fields(self):
+        if not self.model_fields_set - {"id"}:
+            raise ValueError("There is not data to update.")
+        return self
+
+
+class MovieBulkCreate(BaseModel):
+    """
+    Rows are validated one by one, so invalid rows are reported without
+    rejecting the whole request.
+    """
+
+    movies: List[dict] = Field(min_length=1, max_length=MOVIE_BULK_MAX_ROWS)
+
+
+class MovieBulkUpdate(BaseModel):
+    movies: List[dict] = Field(min_length=1, max_length=MOVIE_BULK_MAX_ROWS)
+
+
+class MovieBulkDelete(BaseModel):
+    ids: List[str | int] = Field(min_length=1, max_length=MOVIE_BULK_MAX_ROWS)
+
+
+class BulkRowError(BaseModel):
+    index: int
+    code: str
+    message: str
+
+
+class MovieBulkResponse(BaseModel):
+    movies: List[MovieResponse]
+    errors: List[BulkRowError]
+
+
+class MovieBulkDeleteResponse(BaseModel):
+    ids: List[str | int]
+    errors: List[BulkRowError]
+
+
+class RatingStats(BaseModel):
+    """
+    Ratings of the public movies. The histogram counts the movies rated
+    from each whole number up to the next one.
+    """
+
+    average: float | None
+    rated: int
+    histogram: Dict[str, int]
+
+
+class MovieStatsResponse(BaseModel):
+    """
+    Breakdown of the public movies by genre, rating and publication decade.
+    """
+
+    movies: int
+    genres: Dict[str, int]
+    rating: RatingStats
+    decades: Dict[str, int]
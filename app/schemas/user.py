@@ -1,6 +1,6 @@
 from typing import Optional
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr
 
 
 class User(BaseModel):
@@ -16,3 +16,16 @@ class UserCreate(BaseModel):
     last_name: str
     email: EmailStr
     password: str
+
+
+class UserIdentity(BaseModel):
+    """
+    Authenticated user, without credentials.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: str | int
+    first_name: str
+    last_name: str
+    email: EmailStr
@@ -0,0 +1,263 @@
+import sys
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from pymongo import UpdateOne
+from sqlalchemy import func, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.movie import Movie
+from app.models.movie_count import (
+    MovieCount,
+    count_trigger_statements,
+    movie_counts_exist,
+)
+from app.repositories.async_sql_repository import AsyncSQLRepository
+from app.repositories.get_repository import get_repository
+from app.repositories.sql_repository import SQLRepository
+
+PUBLIC_COUNT_SCOPE = "public"
+
+# A written movie: its owner and its visibility before and after the write.
+# The visibility before a creation and after a deletion is None.
+MovieChange = Tuple[Any, Optional[bool], Optional[bool]]
+
+# Number of movies of each owner and visibility, on MongoDB.
+MOVIE_GROUPS_PIPELINE = [
+    {
+        "$group": {
+            "_id": {"user_id": "$user_id", "is_public": "$is_public"},
+            "count": {"$sum": 1},
+        }
+    }
+]
+
+
+def user_count_scope(user_id: Any, is_public: bool = None) -> str:
+    """
+    Returns the scope counting the movies of a user, or only its public or
+    private movies.
+    """
+    if is_public is None:
+        return f"user:{user_id}"
+    return f"user:{user_id}:{'public' if is_public else 'private'}"
+
+
+def movie_count_scopes(user_id: Any, is_public: bool | None) -> List[str]:
+    """
+    Returns the scopes a movie is counted in.
+    """
+    scopes = [PUBLIC_COUNT_SCOPE] if is_public else []
+    if user_id is not None:
+        scopes.append(user_count_scope(user_id))
+        if is_public is not None:
+            scopes.append(user_count_scope(user_id, is_public))
+    return scopes
+
+
+def count_deltas(changes: Iterable[MovieChange]) -> Dict[str, int]:
+    """
+    Returns how much each scope changes after the given writes.
+    """
+    deltas = Counter()
+    for user_id, was_public, is_public in changes:
+        if was_public is not None:
+            deltas.subtract(movie_count_scopes(user_id, was_public))
+        if is_public is not None:
+            deltas.update(movie_count_scopes(user_id, is_public))
+    return {scope: delta for scope, delta in deltas.items() if delta}
+
+
+def scope_totals(groups: Iterable[Tuple[Any, Optional[bool], int]]) -> Dict[str, int]:
+    """
+    Returns the total of every scope given the number of movies of each
+    owner and visibility.
+    """
+    totals = Counter()
+    for user_id, is_public, count in groups:
+        for scope in movie_count_scopes(user_id, is_public):
+            totals[scope] += count
+    return dict(totals)
+
+
+def count_operations(deltas: Dict[str, int]) -> List[UpdateOne]:
+    """
+    Returns the MongoDB operations adding the deltas to the counts.
+    """
+    return [
+        UpdateOne({"_id": scope}, {"$inc": {"total": delta}}, upsert=True)
+        for scope, delta in deltas.items()
+    ]
+
+
+def set_total_operations(totals: Dict[str, int]) -> List[UpdateOne]:
+    """
+    Returns the MongoDB operations overwriting the counts.
+    """
+    return [
+        UpdateOne({"_id": scope}, {"$set": {"total": total}}, upsert=True)
+        for scope, total in totals.items()
+    ]
+
+
+class MovieCountService:
+    """
+    Reads and maintains the number of movies of each listing scope, so that
+    listings report their total without counting rows. On SQLite the counts
+    are updated by triggers, in the transaction of every movie write. On
+    MongoDB the write paths apply the changes with $inc; `reconcile` repairs
+    any drift left by failed or out-of-band writes. Other SQL dialects have
+    no triggers, so no counts are kept and listings report no total.
+    """
+
+    def __init__(self, db: Session | AsyncSession):
+        self.repository = get_repository(db, MovieCount)
+        self.movies = get_repository(db, Movie)
+        uses_sql = isinstance(self.repository, (SQLRepository, AsyncSQLRepository))
+        self.uses_triggers = uses_sql and db.get_bind().dialect.name == "sqlite"
+        self.keeps_counts = self.uses_triggers or not uses_sql
+
+    async def get_total_async(self, scope: str) -> int | None:
+        """
+        Returns the number of movies in a scope, or None when no counts
+        are kept.
+        """
+        if not self.keeps_counts:
+            return None
+        if self.uses_triggers:
+            total = await self.repository.db.scalar(
+                select(MovieCount.total).where(MovieCount.scope == scope)
+            )
+        else:
+            document = await self.repository.collection.find_one({"_id": scope})
+            total = document["total"] if document else None
+        return total or 0
+
+    async def record_async(self, changes: Iterable[MovieChange]) -> None:
+        """
+        Applies the count changes of written movies on MongoDB. The SQLite
+        triggers already counted them.
+        """
+        if self.uses_triggers or not self.keeps_counts:
+            return
+        deltas = count_deltas(changes)
+        if deltas:
+            await self.repository.collection.bulk_write(
+                count_operations(deltas), ordered=False
+            )
+
+    def get_totals(self) -> Dict[str, int]:
+        """
+        Returns the stored count of every scope.
+        """
+        if self.uses_triggers:
+            rows = self.repository.db.execute(
+                select(MovieCount.scope, MovieCount.total)
+            )
+            return dict(rows.all())
+        return {
+            document["_id"]: document["total"]
+            for document in self.repository.collection.find()
+        }
+
+    def count_movies(self) -> Dict[str, int]:
+        """
+        Counts the movies of every scope from the movies themselves.
+        """
+        if self.uses_triggers:
+            groups = self.movies.db.execute(
+                select(Movie.user_id, Movie.is_public, func.count()).group_by(
+                    Movie.user_id, Movie.is_public
+                )
+            ).all()
+        else:
+            groups = [
+                (
+                    group["_id"].get("user_id"),
+                    group["_id"].get("is_public"),
+                    group["count"],
+                )
+                for group in self.movies.collection.aggregate(MOVIE_GROUPS_PIPELINE)
+            ]
+        return scope_totals(groups)
+
+    def reconcile(self, repair: bool = True) -> Dict[str, Tuple[int, int]]:
+        """
+        Compares the stored counts with the movies and, when `repair` is set,
+        overwrites the ones that drifted. Returns the (stored, counted) totals
+        of every drifted scope. On SQLite the comparison and the repair share
+        a transaction; on MongoDB writes running meanwhile can drift again,
+        so run it when writes are quiet or run it twice.
+        """
+        if not self.keeps_counts:
+            return {}
+        expected = self.count_movies()
+        stored = self.get_totals()
+        drift = {
+            scope: (stored.get(scope, 0), expected.get(scope, 0))
+            for scope in stored.keys() | expected.keys()
+            if stored.get(scope, 0) != expected.get(scope, 0)
+        }
+        if not repair or not drift:
+            if self.uses_triggers:
+                self.repository.db.rollback()
+            return drift
+
+        totals = {scope: counted for scope, (_, counted) in drift.items()}
+        if self.uses_triggers:
+            statement = sqlite_insert(MovieCount)
+            statement = statement.on_conflict_do_update(
+                index_elements=[MovieCount.scope],
+                set_={"total": statement.excluded.total},
+            )
+            self.repository.db.execute(
+                statement,
+                [{"scope": scope, "total": total} for scope, total in totals.items()],
+            )
+            self.repository.db.commit()
+        else:
+            self.repository.collection.bulk_write(
+                set_total_operations(totals), ordered=False
+            )
+        return drift
+
+    def ensure(self) -> bool:
+        """
+        Starts counting on a database whose movies predate the counts:
+        creates the SQLite triggers, or fills empty MongoDB counts.
+        Returns True when the counts were rebuilt. Nothing is done on other
+        SQL dialects, which keep no counts.
+        """
+        if not self.keeps_counts:
+            return False
+        if self.uses_triggers:
+            with self.repository.db.get_bind().begin() as connection:
+                if movie_counts_exist(connection, Movie.__table__):
+                    return False
+                for statement in count_trigger_statements(Movie.__table__):
+                    connection.exec_driver_sql(statement)
+        elif self.repository.collection.find_one() is not None:
+            return False
+        elif self.movies.collection.find_one() is None:
+            return False
+        self.reconcile()
+        return True
+
+
+if __name__ == "__main__":
+    from app.database_settings import SessionLocal
+    from app.models.user import User  # Movie.user refers to it by name.
+
+    session = SessionLocal()
+    try:
+        drifted = MovieCountService(session).reconcile(repair="--repair" in sys.argv)
+    finally:
+        session.close()
+
+    for scope, (stored_total, counted_total) in sorted(drifted.items()):
+        print(f"Drifted count: {scope} stored {stored_total}, counted {counted_total}")
+    if drifted and "--repair" not in sys.argv:
+        sys.exit(1)
+    print("Movie counts are up to date." if not drifted else "Movie counts repaired.")
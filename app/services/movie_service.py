@@ -1,3 +1,4 @@
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.repositories.get_repository import get_repository
@@ -5,5 +6,5 @@ from app.models.movie import Movie
 
 
 class MovieService:
-    def __init__(self, db: Session):
+    def __init__(self, db: Session | AsyncSession):
         self.repository = get_repository(db, Movie)
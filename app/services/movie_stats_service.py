@@ -0,0 +1,336 @@
+import math
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from pymongo import ReplaceOne, UpdateOne
+from sqlalchemy import case, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.movie import GenreEnum, Movie
+from app.models.movie_stat import (
+    MovieStat,
+    movie_stats_exist,
+    stat_rebuild_statements,
+    stat_trigger_statements,
+)
+from app.repositories.async_sql_repository import AsyncSQLRepository
+from app.repositories.get_repository import get_repository
+from app.repositories.sql_repository import SQLRepository
+from app.schemas.movie import MovieStatsResponse, RatingStats
+from app.utils.enum_utils import serialize_value
+
+GENRE_NAMES = {genre.name: genre.value for genre in GenreEnum}
+
+# A written movie as it was before and after the write, None before a
+# creation and after a deletion.
+MovieWrite = Tuple[Optional[Any], Optional[Any]]
+StatKey = Tuple[str, str]
+
+# Public movies grouped by genre, decade and rating band, on MongoDB.
+MOVIE_STATS_PIPELINE = [
+    {"$match": {"is_public": True}},
+    {
+        "$group": {
+            "_id": {
+                "genre": "$genre",
+                "decade": {
+                    "$subtract": [
+                        "$publication_year",
+                        {"$mod": ["$publication_year", 10]},
+                    ]
+                },
+                "rating": {"$floor": "$rating"},
+            },
+            "movies": {"$sum": 1},
+            "rated": {"$sum": {"$cond": [{"$gt": ["$rating", None]}, 1, 0]}},
+            "rating_sum": {"$sum": "$rating"},
+        }
+    },
+]
+
+
+def movie_stats_statement():
+    """
+    Groups the public movies by genre, decade and rating band on SQL, like
+    MOVIE_STATS_PIPELINE on MongoDB.
+    """
+    decade = Movie.publication_year - Movie.publication_year % 10
+    # floor() is only applied to ratings: the SQLite driver's version fails on NULL.
+    band = case((Movie.rating.is_not(None), func.floor(Movie.rating)))
+    return (
+        select(
+            Movie.genre,
+            decade,
+            band,
+            func.count(),
+            func.count(Movie.rating),
+            func.coalesce(func.sum(Movie.rating), 0.0),
+        )
+        .where(Movie.is_public.is_(True))
+        .group_by(Movie.genre, decade, band)
+    )
+
+
+def stat_keys(genre: Any, publication_year: int, rating: float | None) -> List[StatKey]:
+    """
+    Returns the (dimension, bucket) pairs a public movie is aggregated in.
+    """
+    keys = [
+        ("all", ""),
+        ("genre", serialize_value(genre)),
+        ("decade", str(publication_year - publication_year % 10)),
+    ]
+    if rating is not None:
+        keys.append(("rating", str(math.floor(rating))))
+    return keys
+
+
+def stat_deltas(writes: Iterable[MovieWrite]) -> Dict[StatKey, Tuple[int, int, float]]:
+    """
+    Returns how the movies, rated movies and rating sum of each bucket
+    change after the given writes.
+    """
+    deltas = defaultdict(lambda: [0, 0, 0.0])
+    for before, after in writes:
+        for sign, movie in ((-1, before), (1, after)):
+            if movie is None or not movie.is_public:
+                continue
+            for key in stat_keys(movie.genre, movie.publication_year, movie.rating):
+                delta = deltas[key]
+                delta[0] += sign
+                if movie.rating is not None:
+                    delta[1] += sign
+                    delta[2] += sign * movie.rating
+    return {key: tuple(delta) for key, delta in deltas.items() if any(delta)}
+
+
+def fold_stat_groups(groups: Iterable[Dict]) -> Dict[StatKey, Tuple[int, int, float]]:
+    """
+    Adds the MongoDB groups of MOVIE_STATS_PIPELINE up into every bucket.
+    """
+    totals = defaultdict(lambda: [0, 0, 0.0])
+    for group in groups:
+        band = group["_id"].get("rating")
+        keys = [
+            ("all", ""),
+            ("genre", group["_id"]["genre"]),
+            ("decade", str(int(group["_id"]["decade"]))),
+        ]
+        if band is not None:
+            keys.append(("rating", str(int(band))))
+        for key in keys:
+            total = totals[key]
+            total[0] += group["movies"]
+            total[1] += group["rated"]
+            total[2] += group["rating_sum"]
+    return {key: tuple(total) for key, total in totals.items()}
+
+
+def sql_stat_groups(rows: Iterable[Tuple]) -> List[Dict]:
+    """
+    Returns the rows of movie_stats_statement as MOVIE_STATS_PIPELINE groups.
+    """
+    return [
+        {
+            "_id": {"genre": serialize_value(genre), "decade": decade, "rating": band},
+            "movies": movies,
+            "rated": rated,
+            "rating_sum": rating_sum,
+        }
+        for genre, decade, band, movies, rated, rating_sum in rows
+    ]
+
+
+def stat_document_id(key: StatKey) -> str:
+    return f"{key[0]}:{key[1]}"
+
+
+def stat_operations(deltas: Dict[StatKey, Tuple[int, int, float]]) -> List[UpdateOne]:
+    """
+    Returns the MongoDB operations adding the deltas to the buckets.
+    """
+    return [
+        UpdateOne(
+            {"_id": stat_document_id(key)},
+            {
+                "$inc": {"movies": movies, "rated": rated, "rating_sum": rating_sum},
+                "$setOnInsert": {"dimension": key[0], "bucket": key[1]},
+            },
+            upsert=True,
+        )
+        for key, (movies, rated, rating_sum) in deltas.items()
+    ]
+
+
+def numeric_buckets(buckets: Dict[str, tuple]) -> Dict[str, int]:
+    """
+    Returns the movies of each bucket, in numeric bucket order.
+    """
+    return {
+        bucket: values[0]
+        for bucket, values in sorted(buckets.items(), key=lambda item: int(item[0]))
+    }
+
+
+def stats_response(
+    rows: Iterable[Tuple[str, str, int, int, float]]
+) -> MovieStatsResponse:
+    """
+    Builds the statistics from the stored (dimension, bucket, movies, rated,
+    rating_sum) rows. Empty buckets are left out, except for genres.
+    """
+    buckets = defaultdict(dict)
+    for dimension, bucket, movies, rated, rating_sum in rows:
+        if movies:
+            buckets[dimension][bucket] = (movies, rated, rating_sum)
+    movies, rated, rating_sum = buckets["all"].get("", (0, 0, 0.0))
+    return MovieStatsResponse(
+        movies=movies,
+        genres={
+            genre.value: buckets["genre"].get(genre.value, (0,))[0]
+            for genre in GenreEnum
+        },
+        rating=RatingStats(
+            average=round(rating_sum / rated, 2) if rated else None,
+            rated=rated,
+            histogram=numeric_buckets(buckets["rating"]),
+        ),
+        decades=numeric_buckets(buckets["decade"]),
+    )
+
+
+class MovieStatsService:
+    """
+    Serves the genre, rating and decade breakdown of the public movies from
+    aggregates updated on every write, instead of scanning the movies. On
+    SQLite triggers update the `movie_stat` table in the transaction of the
+    write; on MongoDB the write paths apply the changes with $inc. Other SQL
+    dialects have no triggers, so their statistics are aggregated from the
+    movies on every request.
+    """
+
+    def __init__(self, db: Session | AsyncSession):
+        self.repository = get_repository(db, MovieStat)
+        self.movies = get_repository(db, Movie)
+        uses_sql = isinstance(self.repository, (SQLRepository, AsyncSQLRepository))
+        self.uses_triggers = uses_sql and db.get_bind().dialect.name == "sqlite"
+        self.aggregates_live = uses_sql and not self.uses_triggers
+
+    async def get_stats_async(self) -> MovieStatsResponse:
+        """
+        Returns the statistics of the public movies.
+        """
+        if self.aggregates_live:
+            rows = await self.movies.db.execute(movie_stats_statement())
+            totals = fold_stat_groups(sql_stat_groups(rows.all()))
+            return stats_response(
+                (key[0], key[1], *total) for key, total in totals.items()
+            )
+        if self.uses_triggers:
+            rows = await self.repository.db.execute(
+                select(
+                    MovieStat.dimension,
+                    MovieStat.bucket,
+                    MovieStat.movies,
+                    MovieStat.rated,
+                    MovieStat.rating_sum,
+                )
+            )
+            return stats_response(rows.all())
+        documents = await self.repository.collection.find().to_list()
+        return stats_response(
+            (
+                document["dimension"],
+                document["bucket"],
+                document["movies"],
+                document["rated"],
+                document["rating_sum"],
+            )
+            for document in documents
+        )
+
+    async def record_async(self, writes: Iterable[MovieWrite]) -> None:
+        """
+        Applies the statistics changes of written movies on MongoDB. The
+        SQLite triggers already applied them.
+        """
+        if self.uses_triggers or self.aggregates_live:
+            return
+        deltas = stat_deltas(writes)
+        if deltas:
+            await self.repository.collection.bulk_write(
+                stat_operations(deltas), ordered=False
+            )
+
+    def rebuild(self) -> int:
+        """
+        Aggregates the statistics again from every public movie. Returns the
+        number of buckets. Nothing is stored on SQL dialects without triggers.
+        """
+        if self.aggregates_live:
+            return 0
+        if self.uses_triggers:
+            connection = self.repository.db.connection()
+            for statement in stat_rebuild_statements(Movie.__table__, GENRE_NAMES):
+                connection.exec_driver_sql(statement)
+            self.repository.db.commit()
+            return self.repository.db.query(MovieStat).count()
+
+        totals = fold_stat_groups(
+            self.movies.collection.aggregate(MOVIE_STATS_PIPELINE)
+        )
+        operations = [
+            ReplaceOne(
+                {"_id": stat_document_id(key)},
+                {
+                    "dimension": key[0],
+                    "bucket": key[1],
+                    "movies": movies,
+                    "rated": rated,
+                    "rating_sum": rating_sum,
+                },
+                upsert=True,
+            )
+            for key, (movies, rated, rating_sum) in totals.items()
+        ]
+        if operations:
+            self.repository.collection.bulk_write(operations, ordered=False)
+        self.repository.collection.delete_many(
+            {"_id": {"$nin": [stat_document_id(key) for key in totals]}}
+        )
+        return len(totals)
+
+    def ensure(self) -> bool:
+        """
+        Starts aggregating on a database whose movies predate the statistics:
+        creates the SQLite triggers, or fills empty MongoDB statistics.
+        Returns True when the statistics were rebuilt. Nothing is done on
+        other SQL dialects, whose statistics are aggregated on every request.
+        """
+        if self.aggregates_live:
+            return False
+        if self.uses_triggers:
+            with self.repository.db.get_bind().begin() as connection:
+                if movie_stats_exist(connection, Movie.__table__):
+                    return False
+                for statement in stat_trigger_statements(Movie.__table__, GENRE_NAMES):
+                    connection.exec_driver_sql(statement)
+        elif self.repository.collection.find_one() is not None:
+            return False
+        elif self.movies.collection.find_one() is None:
+            return False
+        self.rebuild()
+        return True
+
+
+if __name__ == "__main__":
+    from app.database_settings import SessionLocal
+    from app.models.user import User  # Movie.user refers to it by name.
+
+    session = SessionLocal()
+    try:
+        buckets = MovieStatsService(session).rebuild()
+    finally:
+        session.close()
+    print(f"Rebuilt {buckets} movie statistics buckets.")
@@ -0,0 +1,188 @@
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from zoneinfo import ZoneInfo, available_timezones
+
+import httpx
+
+from app.utils.get_with_retry import get_with_retry_async
+from app.utils.http_client import get_http_client
+from app.utils.metrics import register_metrics
+from app.utils.ttl_cache import TTLCache
+
+WORLD_TIME_API_URL = "http://worldtimeapi.org/api/timezone"
+
+# "local" computes times from the system tz database, "worldtimeapi" asks the API.
+TIME_ENGINE = os.getenv("TIME_ENGINE", "local")
+# With the local engine, look up zones missing from the tz database in the API.
+TIME_API_FALLBACK = os.getenv("TIME_API_FALLBACK", "false").lower() == "true"
+
+# UTC offsets of time zones, kept until the TTL or the next DST transition.
+time_zone_cache = TTLCache(
+    maxsize=int(os.getenv("TIME_ZONE_CACHE_MAX_SIZE", "1000")),
+    ttl=float(os.getenv("TIME_ZONE_CACHE_TTL_SECONDS", "900")),
+)
+register_metrics("time_zone_cache", time_zone_cache.stats)
+UNKNOWN_ZONE_TTL_SECONDS = float(os.getenv("UNKNOWN_ZONE_TTL_SECONDS", "300"))
+_UNKNOWN_ZONE = object()
+
+
+class UnknownTimeZoneError(Exception):
+    """
+    Raised when the time zone does not exist.
+    """
+
+
+def get_zone_name(area: str, location: str, region: str = None) -> str:
+    """
+    Returns the tz database name of an area/location and optional region.
+    """
+    return "/".join(part for part in (area, location, region) if part)
+
+
+def get_world_time_url(zone_name: str) -> str:
+    """
+    Returns the World Time API URL of a time zone.
+    """
+    return f"{WORLD_TIME_API_URL}/{zone_name}"
+
+
+def parse_utc_offset(utc_offset: str) -> timedelta:
+    """
+    Converts a "+HH:MM" offset into a timedelta.
+    """
+    sign = -1 if utc_offset.startswith("-") else 1
+    hours, minutes = utc_offset.lstrip("+-").split(":")
+    return sign * timedelta(hours=int(hours), minutes=int(minutes))
+
+
+def format_utc_offset(offset: timedelta) -> str:
+    """
+    Converts a timedelta into a "+HH:MM" offset.
+    """
+    sign = "-" if offset < timedelta(0) else "+"
+    minutes = abs(int(offset.total_seconds())) // 60
+    return f"{sign}{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def build_time_data(offset: timedelta, now: datetime = None) -> dict:
+    """
+    Returns the current time in a zone with the given UTC offset.
+    """
+    utc_now = now or datetime.now(timezone.utc)
+    return {
+        "datetime": utc_now.astimezone(timezone(offset)).isoformat(),
+        "utc_datetime": utc_now.isoformat(),
+        "utc_offset": format_utc_offset(offset),
+    }
+
+
+@lru_cache(maxsize=1)
+def get_zone_names() -> frozenset[str]:
+    """
+    Returns the names of the zones in the system tz database, read once.
+    """
+    return frozenset(available_timezones())
+
+
+@lru_cache(maxsize=1)
+def get_zone_index() -> tuple[str, ...]:
+    """
+    Returns the sorted zone names served by /time/zones.
+    """
+    return tuple(sorted(get_zone_names()))
+
+
+@lru_cache(maxsize=None)
+def get_zone(zone_name: str) -> ZoneInfo:
+    """
+    Returns the zone object of an indexed zone, loaded once.
+    """
+    return ZoneInfo(zone_name)
+
+
+def get_local_time_data(zone_name: str, now: datetime = None) -> dict:
+    """
+    Returns the time data of a zone computed from the system tz database.
+    """
+    if zone_name not in get_zone_names():
+        raise UnknownTimeZoneError(zone_name)
+    utc_now = now or datetime.now(timezone.utc)
+    return build_time_data(utc_now.astimezone(get_zone(zone_name)).utcoffset(), utc_now)
+
+
+def next_transition(zone_name: str, now: float, within: float) -> float | None:
+    """
+    Returns the timestamp of the next UTC offset change of a zone in the
+    following `within` seconds, found by bisection in the system tz database.
+    None when there is none, or the zone is not in the database.
+    """
+    if zone_name not in get_zone_names():
+        return None
+    zone = get_zone(zone_name)
+
+    def offset_at(timestamp: float) -> timedelta:
+        return datetime.fromtimestamp(timestamp, zone).utcoffset()
+
+    start, end = now, now + within
+    offset = offset_at(start)
+    if offset_at(end) == offset:
+        return None
+    while end - start > 1:
+        middle = (start + end) / 2
+        if offset_at(middle) == offset:
+            start = middle
+        else:
+            end = middle
+    return end
+
+
+async def fetch_zone_offset(zone_name: str) -> timedelta:
+    """
+    Returns the UTC offset of a time zone, using the cache when possible.
+    Unknown zones are cached too, for a shorter time. Offsets expire at
+    the next transition, from the API's dst_until or the tz database.
+    """
+    cached = time_zone_cache.get(zone_name)
+    if cached is _UNKNOWN_ZONE:
+        raise UnknownTimeZoneError(zone_name)
+    if cached is not None:
+        return cached
+
+    try:
+        time_data = await get_with_retry_async(
+            get_http_client(), get_world_time_url(zone_name)
+        )
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code != 404:
+            raise
+        time_zone_cache.set(
+            zone_name,
+            _UNKNOWN_ZONE,
+            expires_at=time.time() + UNKNOWN_ZONE_TTL_SECONDS,
+        )
+        raise UnknownTimeZoneError(zone_name) from e
+
+    offset = parse_utc_offset(time_data["utc_offset"])
+    dst_until = time_data.get("dst_until")
+    expires_at = datetime.fromisoformat(dst_until).timestamp() if dst_until else None
+    transition = next_transition(zone_name, time.time(), time_zone_cache.ttl)
+    if transition is not None:
+        expires_at = min(expires_at or transition, transition)
+    time_zone_cache.set(zone_name, offset, expires_at=expires_at)
+    return offset
+
+
+async def get_time_data(zone_name: str) -> dict:
+    """
+    Returns the current datetime, UTC datetime and UTC offset of a time zone,
+    from the configured engine.
+    """
+    if TIME_ENGINE == "local":
+        try:
+            return get_local_time_data(zone_name)
+        except UnknownTimeZoneError:
+            if not TIME_API_FALLBACK:
+                raise
+    return build_time_data(await fetch_zone_offset(zone_name))
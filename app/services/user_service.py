@@ -1,14 +1,19 @@
 from typing import Type
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.models.user import User
-from app.schemas.user import User as UserSchema
+from app.schemas.user import User as UserSchema, UserIdentity
 from app.repositories.get_repository import get_repository
 
 
+# Fields of the authenticated user, read without the password hash.
+IDENTITY_FIELDS = list(UserIdentity.model_fields)
+
+
 class UserService:
-    def __init__(self, db: Session):
+    def __init__(self, db: Session | AsyncSession):
         self.repository = get_repository(db, User)
 
     def get_user_by_email(self, user_email: str) -> Type[User] | None:
@@ -21,3 +26,46 @@ class UserService:
 
         user_schema = self.repository.to_schema(user, UserSchema)
         return user_schema[0]
+
+    async def get_user_by_email_async(self, user_email: str) -> Type[User] | None:
+        """
+        Retrieves a user given an email, for services built on an AsyncSession.
+        """
+        user = await self.repository.get_objects_by_filters(
+            {"email": user_email}, limit=1
+        )
+        if not user:
+            return None
+
+        user_schema = self.repository.to_schema(user, UserSchema)
+        return user_schema[0]
+
+    def get_user_identity(self, user_email: str) -> UserIdentity | None:
+        """
+        Retrieves the identity of a user given an email, without reading the
+        password.
+        """
+        user = self.repository.get_objects_by_filters(
+            {"email": user_email}, limit=1, fields=IDENTITY_FIELDS
+        )
+        if not user:
+            return None
+
+        return UserIdentity.model_validate(
+            self.repository.to_schema(user, UserIdentity)[0]
+        )
+
+    async def get_user_identity_async(self, user_email: str) -> UserIdentity | None:
+        """
+        Retrieves the identity of a user given an email, without reading the
+        password, for services built on an AsyncSession.
+        """
+        user = await self.repository.get_objects_by_filters(
+            {"email": user_email}, limit=1, fields=IDENTITY_FIELDS
+        )
+        if not user:
+            return None
+
+        return UserIdentity.model_validate(
+            self.repository.to_schema(user, UserIdentity)[0]
+        )
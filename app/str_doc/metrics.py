@@ -0,0 +1,16 @@
+common_metrics_example = {
+    "user_cache": {
+        "size": 120,
+        "maxsize": 10000,
+        "hits": 9500,
+        "misses": 500,
+        "hit_ratio": 0.95,
+    },
+}
+
+get_metrics_responses = {
+    200: {
+        "description": "Metrics of every registered component.",
+        "content": {"application/json": {"example": common_metrics_example}},
+    },
+}
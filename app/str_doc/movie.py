@@ -66,21 +66,124 @@ create_movie_responses = {
     },
 }
 
+common_next_cursor_header = {
+    "X-Next-Cursor": {
+        "description": "Opaque cursor to request the next page. Only present when the page is full.",
+        "schema": {"type": "string"},
+    }
+}
+
+common_invalid_cursor_response = {
+    "description": "The pagination cursor could not be decoded.",
+    "content": {
+        "application/json": {
+            "example": {
+                "error": {
+                    "code": "INVALID_CURSOR",
+                    "message": "Invalid pagination cursor.",
+                }
+            }
+        }
+    },
+}
+
+common_invalid_listing_response = {
+    "description": "The pagination cursor could not be decoded, or `fields` names an unknown field.",
+    "content": {
+        "application/json": {
+            "examples": {
+                "cursor": {
+                    "value": {
+                        "error": {
+                            "code": "INVALID_CURSOR",
+                            "message": "Invalid pagination cursor.",
+                        }
+                    }
+                },
+                "fields": {
+                    "value": {
+                        "error": {
+                            "code": "INVALID_FIELDS",
+                            "message": "Unknown fields: plot.",
+                        }
+                    }
+                },
+            }
+        }
+    },
+}
+
+common_list_headers = {
+    **common_next_cursor_header,
+    "X-Total-Count": {
+        "description": "Number of movies in the listing. Left out when filters are applied.",
+        "schema": {"type": "integer"},
+    },
+    "Link": {
+        "description": 'URLs of the first, prev, next and last pages, as `<url>; rel="next"`. The next page is linked with its cursor.',
+        "schema": {"type": "string"},
+    },
+    "ETag": {
+        "description": "Version of the page. Send it back in If-None-Match to get a 304 while the page is unchanged.",
+        "schema": {"type": "string"},
+    },
+}
+
+common_not_modified_response = {
+    "description": "The page matches the ETag sent in If-None-Match. The body is empty.",
+}
+
 movie_public_responses = {
     200: {
         "description": "A list of public movies.",
+        "headers": common_list_headers,
         "content": {"application/json": {"example": [common_movie_example]}},
     },
+    304: common_not_modified_response,
+    400: common_invalid_listing_response,
 }
 
 movie_user_responses = {
     200: {
         "description": "A list of movies created by the authenticated user.",
+        "headers": common_list_headers,
+        "content": {"application/json": {"example": [common_movie_example]}},
+    },
+    304: common_not_modified_response,
+    400: common_invalid_listing_response,
+    401: common_unauthorized_response,
+}
+
+movie_search_responses = {
+    200: {
+        "description": "Public movies and movies of the authenticated user containing every word of the query, best match first.",
+        "headers": common_next_cursor_header,
         "content": {"application/json": {"example": [common_movie_example]}},
     },
+    400: common_invalid_cursor_response,
     401: common_unauthorized_response,
 }
 
+movie_stats_responses = {
+    200: {
+        "description": "Movies per genre, rating distribution and movies per decade of the public movies.",
+        "content": {
+            "application/json": {
+                "example": {
+                    "movies": 3,
+                    "genres": {"Action": 1, "Drama": 2},
+                    "rating": {
+                        "average": 7.17,
+                        "rated": 3,
+                        "histogram": {"6": 1, "7": 2},
+                    },
+                    "decades": {"1990": 1, "2000": 2},
+                }
+            }
+        },
+    },
+}
+
 movie_update_responses = {
     200: {
         "description": "Movie updated successfully.",
@@ -109,6 +212,23 @@ movie_update_responses = {
     },
     403: common_unauthorized_response,
     404: common_not_found_response,
+    422: {
+        "description": "Invalid input data. Unknown fields, the id and the owner cannot be updated.",
+        "content": {
+            "application/json": {
+                "example": {
+                    "detail": [
+                        {
+                            "error": {
+                                "code": "EXTRA_FORBIDDEN",
+                                "message": "Error in field 'user_id': Extra inputs are not permitted",
+                            }
+                        }
+                    ]
+                }
+            }
+        },
+    },
 }
 
 movie_delete_responses = {
@@ -116,3 +236,100 @@ movie_delete_responses = {
     403: common_unauthorized_response,
     404: common_not_found_response,
 }
+
+common_bulk_errors_example = [
+    {
+        "index": 1,
+        "code": "INVALID_DATA",
+        "message": "Error in field 'title': Field required",
+    },
+]
+
+movie_bulk_create_responses = {
+    200: {
+        "description": "The valid rows were created. Failed rows are listed in errors by position.",
+        "content": {
+            "application/json": {
+                "example": {
+                    "movies": [common_movie_example],
+                    "errors": common_bulk_errors_example,
+                }
+            }
+        },
+    },
+    401: common_unauthorized_response,
+}
+
+movie_bulk_update_responses = {
+    200: {
+        "description": "The movies found were updated. Failed rows are listed in errors by position.",
+        "content": {
+            "application/json": {
+                "example": {
+                    "movies": [common_movie_example],
+                    "errors": [
+                        {
+                            "index": 1,
+                            "code": "NOT_FOUND",
+                            "message": "Object not found.",
+                        },
+                        {
+                            "index": 2,
+                            "code": "DUPLICATE_ID",
+                            "message": "Duplicate id of an earlier row.",
+                        },
+                    ],
+                }
+            }
+        },
+    },
+    401: common_unauthorized_response,
+}
+
+movie_bulk_delete_responses = {
+    200: {
+        "description": "The movies found were deleted. Ids not found are listed in errors by position.",
+        "content": {
+            "application/json": {
+                "example": {
+                    "ids": [1],
+                    "errors": [
+                        {
+                            "index": 1,
+                            "code": "NOT_FOUND",
+                            "message": "Object not found.",
+                        }
+                    ],
+                }
+            }
+        },
+    },
+    401: common_unauthorized_response,
+}
+
+movie_export_responses = {
+    200: {
+        "description": "Public movies in id order, one per line.",
+        "content": {
+            "application/x-ndjson": {
+                "example": '{"id":1,"title":"Inception","description":"A mind-bending thriller","publication_year":2010,"genre":"Sci-Fi","rating":9.2,"is_public":true,"user_id":123,"created_at":"2025-01-13T01:00:00"}\n'
+            },
+            "text/csv": {
+                "example": "id,title,description,publication_year,genre,rating,is_public,user_id,created_at\n1,Inception,A mind-bending thriller,2010,Sci-Fi,9.2,True,123,2025-01-13T01:00:00\n"
+            },
+        },
+    },
+    400: {
+        "description": "The resume position could not be decoded.",
+        "content": {
+            "application/json": {
+                "example": {
+                    "error": {
+                        "code": "INVALID_CURSOR",
+                        "message": "Invalid resume position.",
+                    }
+                }
+            }
+        },
+    },
+}
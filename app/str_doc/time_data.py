@@ -12,6 +12,20 @@ common_request_error_response = {
     },
 }
 
+common_unknown_zone_response = {
+    "description": "The time zone does not exist.",
+    "content": {
+        "application/json": {
+            "example": {
+                "error": {
+                    "code": "NOT_FOUND",
+                    "message": "Unknown time zone America/Atlantis.",
+                }
+            }
+        }
+    },
+}
+
 common_time_example = {
     "datetime": "2025-01-13T01:40:51.245747-04:00",
     "utc_datetime": "2025-01-13T05:40:51.245747+00:00",
@@ -27,5 +41,17 @@ get_time_responses = {
             }
         },
     },
+    404: common_unknown_zone_response,
     502: common_request_error_response,
 }
+
+get_zones_responses = {
+    200: {
+        "description": "Names of the available time zones.",
+        "content": {
+            "application/json": {
+                "example": ["America/Bogota", "America/New_York"],
+            }
+        },
+    },
+}
@@ -45,12 +45,34 @@ common_access_token_response = {
     },
 }
 
+common_service_busy_response = {
+    "description": "The password hashing queue is full. Retry after the given seconds.",
+    "headers": {
+        "Retry-After": {
+            "description": "Seconds to wait before retrying.",
+            "schema": {"type": "integer"},
+        }
+    },
+    "content": {
+        "application/json": {
+            "example": {
+                "error": {
+                    "code": "SERVICE_BUSY",
+                    "message": "Too many requests, try again later.",
+                }
+            }
+        }
+    },
+}
+
 create_user_responses = {
     201: common_user_created_response,
     400: common_user_already_exists_response,
+    503: common_service_busy_response,
 }
 
 login_responses = {
     200: common_access_token_response,
     401: common_auth_error_response,
+    503: common_service_busy_response,
 }
@@ -1,8 +1,35 @@
 from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from app.schemas.user import UserIdentity
 from app.services.user_service import UserService
 from app.utils.jwt_handler import decode_access_token
+from app.utils.user_cache import user_cache
+
+
+def get_token_payload(token: str) -> dict | None:
+    """
+    Returns the payload of a valid JWT token that identifies a user by email,
+    or None if the token is invalid.
+    """
+    payload = decode_access_token(token)
+    if payload is None or payload.get("email") is None:
+        return None
+
+    return payload
+
+
+def cache_user(user, payload: dict) -> UserIdentity | None:
+    """
+    Stores the user found for a token in the user cache, until the token expires.
+    """
+    if not user:
+        return None
+
+    identity = UserIdentity.model_validate(user)
+    user_cache.set(payload["email"], identity, expires_at=payload.get("exp"))
+    return identity
 
 
 def get_current_user(token: str, session_database):
@@ -10,18 +37,53 @@ def get_current_user(token: str, session_database):
     Validates the JWT token and retrieves the current user.
     Returns None if the token is invalid or the user does not exist in the database.
     """
-    payload = decode_access_token(token)
+    payload = get_token_payload(token)
     if payload is None:
         return None
 
-    email = payload.get("email")
-    if email is None:
+    cached_user = user_cache.get(payload["email"])
+    if cached_user is not None:
+        return cached_user
+
+    user_service = UserService(session_database)
+    user = user_service.get_user_identity(payload["email"])
+
+    return cache_user(user, payload)
+
+
+async def get_current_user_async(token: str, session_database: AsyncSession):
+    """
+    Asyncio version of get_current_user.
+    """
+    payload = get_token_payload(token)
+    if payload is None:
         return None
 
+    cached_user = user_cache.get(payload["email"])
+    if cached_user is not None:
+        return cached_user
+
     user_service = UserService(session_database)
-    user = user_service.get_user_by_email(email)
+    user = await user_service.get_user_identity_async(payload["email"])
 
-    return user
+    return cache_user(user, payload)
+
+
+def unauthorized_exception() -> HTTPException:
+    """
+    Returns the exception raised when the current user cannot be validated.
+    """
+    content = {
+        "error": {
+            "code": "UNAUTHORIZED",
+            "message": "You are not authorized to perform this action.",
+        }
+    }
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=content,
+        headers={"WWW-Authenticate": "Bearer"},
+    )
 
 
 def validate_current_user(token: str, db: Session):
@@ -30,15 +92,15 @@ def validate_current_user(token: str, db: Session):
     """
     current_user = get_current_user(token, db)
     if not current_user:
-        content = {
-            "error": {
-                "code": "UNAUTHORIZED",
-                "message": "You are not authorized to perform this action.",
-            }
-        }
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=content,
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        raise unauthorized_exception()
+    return current_user
+
+
+async def validate_current_user_async(token: str, db: AsyncSession):
+    """
+    Asyncio version of validate_current_user.
+    """
+    current_user = await get_current_user_async(token, db)
+    if not current_user:
+        raise unauthorized_exception()
     return current_user
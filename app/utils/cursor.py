@@ -0,0 +1,41 @@
+import base64
+import binascii
+import json
+from typing import Any, Dict
+
+
+class InvalidCursorError(ValueError):
+    """
+    Raised when a pagination cursor cannot be decoded.
+    """
+
+
+def is_scalar_id(object_id: Any) -> bool:
+    """
+    Returns whether the value can be an object id: an integer or a string.
+    """
+    return isinstance(object_id, (int, str)) and not isinstance(object_id, bool)
+
+
+def encode_cursor(position: Dict[str, Any]) -> str:
+    """
+    Encodes a keyset position into an opaque, URL-safe cursor.
+    """
+    raw = json.dumps(position, separators=(",", ":"), sort_keys=True)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """
+    Decodes a cursor created by encode_cursor back into its keyset position.
+    """
+    padding = "=" * (-len(cursor) % 4)
+    try:
+        raw = base64.urlsafe_b64decode(cursor + padding)
+        position = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise InvalidCursorError("Invalid pagination cursor.")
+
+    if not isinstance(position, dict) or not is_scalar_id(position.get("id")):
+        raise InvalidCursorError("Invalid pagination cursor.")
+    return position
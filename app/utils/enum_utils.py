@@ -10,3 +10,10 @@ def serialize_enums(data: Dict[str, Any]) -> Dict[str, Any]:
         if isinstance(value, Enum):
             data[key] = value.value
     return data
+
+
+def serialize_value(value: Any) -> Any:
+    """
+    Transforms an Enum to its string representation (value).
+    """
+    return value.value if isinstance(value, Enum) else value
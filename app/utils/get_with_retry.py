@@ -1,23 +1,41 @@
 from typing import Optional, Dict
 
-import requests
-from tenacity import retry, stop_after_attempt, wait_fixed
+import httpx
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_fixed,
+)
 
 
-@retry(stop=stop_after_attempt(3), wait=wait_fixed(2))
-def get_with_retry(
+def is_retryable(error: BaseException) -> bool:
+    """
+    Returns True for network errors and server errors, which may succeed on retry.
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code >= 500
+    return isinstance(error, httpx.TransportError)
+
+
+async def get_with_retry_async(
+    client: httpx.AsyncClient,
     url: str,
-    data: Optional[Dict] = None,
     headers: Optional[Dict] = None,
+    attempts: int = 3,
+    wait: float = 0.5,
 ) -> dict | None:
     """
-    Makes an HTTP request with retry logic.
+    Makes an HTTP request with the given client, retrying network and server
+    errors without blocking the event loop.
     """
-
-    response = requests.get(
-        url=url,
-        json=data,
-        headers=headers,
-    )
-    response.raise_for_status()
-    return response.json()
+    async for attempt in AsyncRetrying(
+        stop=stop_after_attempt(attempts),
+        wait=wait_fixed(wait),
+        retry=retry_if_exception(is_retryable),
+        reraise=True,
+    ):
+        with attempt:
+            response = await client.get(url, headers=headers)
+            response.raise_for_status()
+            return response.json()
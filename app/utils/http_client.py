@@ -0,0 +1,36 @@
+import os
+
+import httpx
+
+_http_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Returns the shared keep-alive client used for outgoing requests.
+    """
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(
+                float(os.getenv("HTTP_CLIENT_READ_TIMEOUT", "5")),
+                connect=float(os.getenv("HTTP_CLIENT_CONNECT_TIMEOUT", "2")),
+            ),
+            limits=httpx.Limits(
+                max_connections=int(os.getenv("HTTP_CLIENT_MAX_CONNECTIONS", "20")),
+                max_keepalive_connections=int(
+                    os.getenv("HTTP_CLIENT_MAX_CONNECTIONS", "20")
+                ),
+            ),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """
+    Closes the shared client. A new one is created on the next call.
+    """
+    global _http_client
+    client, _http_client = _http_client, None
+    if client is not None:
+        await client.aclose()
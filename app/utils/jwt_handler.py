@@ -1,36 +1,100 @@
+import hashlib
 import os
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 
 import jwt
 from dotenv import load_dotenv
 
+from app.utils.metrics import register_metrics
+from app.utils.ttl_cache import TTLCache
+
 load_dotenv()
 
 
+@dataclass(frozen=True)
+class AuthSettings:
+    """
+    JWT configuration, read once from the environment. Only token creation
+    needs the expiry, so decoding works without ACCESS_TOKEN_EXPIRE_MINUTES.
+    """
+
+    secret_key: str
+    algorithm: str
+    access_token_expire_minutes: int | None
+
+    @classmethod
+    def from_env(cls) -> "AuthSettings":
+        minutes = os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES")
+        return cls(
+            secret_key=os.environ["SECRET_KEY"],
+            algorithm=os.environ["ALGORITHM"],
+            access_token_expire_minutes=int(minutes) if minutes else None,
+        )
+
+
+@lru_cache(maxsize=1)
+def get_auth_settings() -> AuthSettings:
+    """
+    Returns the JWT configuration, loading it on first use.
+    """
+    return AuthSettings.from_env()
+
+
+# Payloads of tokens whose signature was already verified, keyed by token digest.
+token_cache = TTLCache(
+    maxsize=int(os.getenv("TOKEN_CACHE_MAX_SIZE", "10000")),
+    ttl=float(os.getenv("TOKEN_CACHE_TTL_SECONDS", "3600")),
+)
+register_metrics("token_cache", token_cache.stats)
+
+
+def reload_auth_settings() -> AuthSettings:
+    """
+    Reads the JWT configuration again and forgets every verified token.
+    """
+    get_auth_settings.cache_clear()
+    token_cache.clear()
+    return get_auth_settings()
+
+
 def create_access_token(data: dict) -> str:
     """
     Returns JWT token for login.
     """
+    settings = get_auth_settings()
+    if settings.access_token_expire_minutes is None:
+        raise KeyError("ACCESS_TOKEN_EXPIRE_MINUTES")
     to_encode = data.copy()
     expire = datetime.now(timezone.utc) + timedelta(
-        minutes=int(os.environ["ACCESS_TOKEN_EXPIRE_MINUTES"])
+        minutes=settings.access_token_expire_minutes
     )
     to_encode.update({"exp": expire})
-    return jwt.encode(
-        to_encode, os.environ["SECRET_KEY"], algorithm=os.environ["ALGORITHM"]
-    )
+    return jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
 
 
 def decode_access_token(token: str) -> dict | None:
     """
     Decodes and validates a JWT token, returning a dict or None if the token is invalid.
+    Verified payloads are cached until the token expires, so a token seen
+    again skips the signature check.
     """
+    token_digest = hashlib.sha256(token.encode("utf-8")).digest()
+    payload = token_cache.get(token_digest)
+    if payload is not None:
+        return dict(payload)
+
+    settings = get_auth_settings()
     try:
         payload = jwt.decode(
             token,
-            os.environ["SECRET_KEY"],
-            algorithms=[os.environ["ALGORITHM"]],
+            settings.secret_key,
+            algorithms=[settings.algorithm],
         )
-        return payload
     except jwt.exceptions.PyJWTError as e:
         return None
+
+    if "exp" in payload:
+        token_cache.set(token_digest, payload, expires_at=payload["exp"])
+    return dict(payload)
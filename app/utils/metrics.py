@@ -0,0 +1,17 @@
+from typing import Callable, Dict
+
+_metrics_providers: Dict[str, Callable[[], dict]] = {}
+
+
+def register_metrics(name: str, provider: Callable[[], dict]) -> None:
+    """
+    Registers a function that returns the current metrics of a component.
+    """
+    _metrics_providers[name] = provider
+
+
+def collect_metrics() -> Dict[str, dict]:
+    """
+    Returns the metrics of every registered component.
+    """
+    return {name: provider() for name, provider in _metrics_providers.items()}
@@ -0,0 +1,87 @@
+import hashlib
+import os
+import threading
+import time
+import uuid
+from typing import Hashable
+
+from app.utils.metrics import register_metrics
+
+PUBLIC_SCOPE = "public"
+
+
+def user_scope(user_id: str | int) -> tuple:
+    """
+    Returns the version scope of the movies owned by a user.
+    """
+    return ("user", str(user_id))
+
+
+class VersionCounters:
+    """
+    In-process version counters of movie listings, bumped by every write.
+    ETags combine a nonce drawn at startup, so counters restarting at zero
+    never repeat a tag, with a time epoch that bounds how long a tag stays
+    valid when other processes write to the same database.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self.nonce = uuid.uuid4().hex[:12]
+        self._versions: dict[Hashable, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, scope: Hashable) -> int:
+        """
+        Returns the current version of the scope.
+        """
+        with self._lock:
+            return self._versions.get(scope, 0)
+
+    def bump(self, scope: Hashable) -> None:
+        """
+        Increments the version of the scope.
+        """
+        with self._lock:
+            self._versions[scope] = self._versions.get(scope, 0) + 1
+
+    def etag(self, scope: Hashable, *parts) -> str:
+        """
+        Returns a strong ETag for a representation of the scope identified by parts.
+        """
+        epoch = int(time.time() // self.ttl) if self.ttl > 0 else 0
+        digest = hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()[:16]
+        return f'"{self.nonce}-{epoch}-{self.get(scope)}-{digest}"'
+
+    def clear(self) -> None:
+        """
+        Forgets every version.
+        """
+        with self._lock:
+            self._versions.clear()
+
+    def stats(self) -> dict:
+        """
+        Returns the number of tracked scopes and the public version.
+        """
+        with self._lock:
+            return {
+                "scopes": len(self._versions),
+                "public_version": self._versions.get(PUBLIC_SCOPE, 0),
+            }
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Returns True if the If-None-Match header lists the ETag.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    tags = (tag.strip() for tag in if_none_match.split(","))
+    return etag in (tag[2:] if tag.startswith("W/") else tag for tag in tags)
+
+
+movie_versions = VersionCounters(ttl=float(os.getenv("MOVIE_ETAG_TTL_SECONDS", "300")))
+register_metrics("movie_versions", movie_versions.stats)
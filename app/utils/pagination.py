@@ -0,0 +1,86 @@
+import math
+from typing import Any, Dict
+from urllib.parse import urlencode
+
+from starlette.datastructures import URL, QueryParams
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+TOTAL_COUNT_HEADER = "X-Total-Count"
+
+
+def last_page(total: int, page_size: int) -> int:
+    """
+    Returns the number of the last page, 1 when there are no items.
+    """
+    return max(1, math.ceil(total / page_size))
+
+
+def listing_url(url: URL, **params: Any) -> str:
+    """
+    Returns the URL with the given query parameters set in place, keeping
+    the order of the others. Parameters set to None are removed.
+    """
+    query, replaced = [], set()
+    for key, value in QueryParams(url.query).multi_items():
+        if key not in params:
+            query.append((key, value))
+        elif key not in replaced and params[key] is not None:
+            query.append((key, str(params[key])))
+        replaced.add(key)
+    query.extend(
+        (key, str(value))
+        for key, value in params.items()
+        if key not in replaced and value is not None
+    )
+    return str(url.replace(query=urlencode(query)))
+
+
+def pagination_links(
+    url: URL,
+    page: int | None,
+    page_size: int,
+    total: int | None = None,
+    next_cursor: str | None = None,
+) -> Dict[str, str]:
+    """
+    Returns the first, prev, next and last page URLs of a listing, keyed by
+    relation. `page` is None for a page reached through a cursor, which only
+    links to the first and next pages. The next page is linked with its
+    cursor, so following it stays on keyset pagination.
+    """
+    links = {"first": listing_url(url, page=1, cursor=None)}
+    pages = last_page(total, page_size) if total is not None else None
+    if page is not None and page > 1:
+        previous_page = min(page - 1, pages) if pages is not None else page - 1
+        links["prev"] = listing_url(url, page=previous_page, cursor=None)
+    has_next = next_cursor is not None
+    if page is not None and pages is not None:
+        has_next = has_next and page < pages
+    if has_next:
+        links["next"] = listing_url(url, page=None, cursor=next_cursor)
+    if pages is not None:
+        links["last"] = listing_url(url, page=pages, cursor=None)
+    return links
+
+
+def pagination_headers(
+    url: URL,
+    page: int | None,
+    page_size: int,
+    total: int | None = None,
+    next_cursor: str | None = None,
+) -> Dict[str, str]:
+    """
+    Returns the X-Next-Cursor, X-Total-Count and Link headers of a listing
+    page. The total is left out when it is not known.
+    """
+    headers = {}
+    if next_cursor:
+        headers[NEXT_CURSOR_HEADER] = next_cursor
+    if total is not None:
+        headers[TOTAL_COUNT_HEADER] = str(total)
+    links = pagination_links(url, page, page_size, total, next_cursor)
+    headers["Link"] = ", ".join(
+        f'<{link}>; rel="{relation}"' for relation, link in links.items()
+    )
+    return headers
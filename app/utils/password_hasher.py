@@ -1,5 +1,16 @@
+import asyncio
+import math
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable
+
 import bcrypt
 
+from app.utils.metrics import register_metrics
+
 
 class BcryptPasswordHasher:
     @staticmethod
@@ -19,3 +30,148 @@ class BcryptPasswordHasher:
         return bcrypt.checkpw(
             plain_password.encode("utf-8"), hashed_password.encode("utf-8")
         )
+
+    @staticmethod
+    async def hash_password_async(password: str) -> str:
+        """
+        Hashes the password in the password hashing pool.
+        """
+        return await password_hashing_pool.run(
+            BcryptPasswordHasher.hash_password, password
+        )
+
+    @staticmethod
+    async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+        """
+        Verifies the password in the password hashing pool.
+        """
+        return await password_hashing_pool.run(
+            BcryptPasswordHasher.verify_password, plain_password, hashed_password
+        )
+
+
+class PasswordHashingPoolFullError(Exception):
+    """
+    Raised when the password hashing queue is full.
+    """
+
+    def __init__(self, retry_after: int):
+        super().__init__("The password hashing queue is full.")
+        self.retry_after = retry_after
+
+
+def _timed_call(function: Callable, *args) -> tuple[float, Any]:
+    """
+    Runs the function in a worker and returns when it started along with its result.
+    """
+    return time.time(), function(*args)
+
+
+class PasswordHashingPool:
+    """
+    Runs bcrypt in a dedicated process pool, so hashing does not hold request
+    workers or the GIL. At most `workers + queue_limit` calls are accepted at
+    once; further calls fail fast with PasswordHashingPoolFullError.
+    """
+
+    def __init__(self, workers: int, queue_limit: int):
+        self.workers = workers
+        self.queue_limit = queue_limit
+        self.pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.total_run = 0.0
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # spawn: workers must not inherit the event loop or open connections.
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def retry_after(self) -> int:
+        """
+        Returns the seconds a rejected client should wait before retrying.
+        """
+        average_run = self.total_run / self.completed if self.completed else 0.25
+        return max(1, math.ceil(self.pending * average_run / self.workers))
+
+    async def run(self, function: Callable, *args) -> Any:
+        """
+        Runs the function in the pool, or raises PasswordHashingPoolFullError.
+        """
+        with self._lock:
+            if self.pending >= self.workers + self.queue_limit:
+                self.rejected += 1
+                raise PasswordHashingPoolFullError(self.retry_after())
+            self.pending += 1
+
+        submitted_at = time.time()
+        try:
+            started_at, result = await asyncio.get_running_loop().run_in_executor(
+                self._get_executor(), _timed_call, function, *args
+            )
+        finally:
+            with self._lock:
+                self.pending -= 1
+
+        finished_at = time.time()
+        wait = max(0.0, started_at - submitted_at)
+        with self._lock:
+            self.completed += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+            self.total_run += finished_at - started_at
+        return result
+
+    def shutdown(self) -> None:
+        """
+        Stops the worker processes. They are started again on the next call.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def stats(self) -> dict:
+        """
+        Returns the queue depth and wait times of the pool.
+        """
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "queue_limit": self.queue_limit,
+                "pending": self.pending,
+                "queue_depth": max(0, self.pending - self.workers),
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "average_wait_ms": (
+                    self.total_wait / self.completed * 1000 if self.completed else 0.0
+                ),
+                "max_wait_ms": self.max_wait * 1000,
+            }
+
+
+def _available_cores() -> int:
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+PASSWORD_HASHER_WORKERS = int(
+    os.getenv("PASSWORD_HASHER_WORKERS") or _available_cores()
+)
+password_hashing_pool = PasswordHashingPool(
+    workers=PASSWORD_HASHER_WORKERS,
+    queue_limit=int(
+        os.getenv("PASSWORD_HASHER_QUEUE_LIMIT") or PASSWORD_HASHER_WORKERS * 4
+    ),
+)
+register_metrics("password_hasher", password_hashing_pool.stats)
@@ -0,0 +1,143 @@
+import os
+import threading
+import time
+from typing import Type
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import (
+    AsyncAdaptedQueuePool,
+    NullPool,
+    Pool,
+    QueuePool,
+)
+
+
+class PoolStatistics:
+    """
+    Checkout, wait and hold time counters of a connection pool.
+    """
+
+    def __init__(self):
+        self.checkouts = 0
+        self.checkins = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.total_hold = 0.0
+        self.max_hold = 0.0
+        self.pool: Pool | None = None
+        self._lock = threading.Lock()
+
+    def record_wait(self, seconds: float, timed_out: bool = False) -> None:
+        """
+        Records the time spent waiting for a connection of the pool.
+        """
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.total_wait += seconds
+            self.max_wait = max(self.max_wait, seconds)
+
+    def record_hold(self, seconds: float) -> None:
+        """
+        Records the time a connection was checked out before being returned.
+        """
+        with self._lock:
+            self.checkins += 1
+            self.total_hold += seconds
+            self.max_hold = max(self.max_hold, seconds)
+
+    def attach(self, engine: Engine) -> None:
+        """
+        Listens to the checkouts and checkins of the engine pool.
+        """
+        self.pool = engine.pool
+
+        @event.listens_for(engine, "checkout")
+        def on_checkout(dbapi_connection, connection_record, connection_proxy):
+            connection_record.info["checked_out_at"] = time.perf_counter()
+
+        @event.listens_for(engine, "checkin")
+        def on_checkin(dbapi_connection, connection_record):
+            checked_out_at = connection_record.info.pop("checked_out_at", None)
+            if checked_out_at is not None:
+                self.record_hold(time.perf_counter() - checked_out_at)
+
+    def snapshot(self) -> dict:
+        """
+        Returns the current pool status along with the accumulated counters.
+        """
+        with self._lock:
+            stats = {
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "timeouts": self.timeouts,
+                "average_wait_ms": (
+                    self.total_wait / self.checkouts * 1000 if self.checkouts else 0.0
+                ),
+                "max_wait_ms": self.max_wait * 1000,
+                "average_hold_ms": (
+                    self.total_hold / self.checkins * 1000 if self.checkins else 0.0
+                ),
+                "max_hold_ms": self.max_hold * 1000,
+            }
+        if isinstance(self.pool, QueuePool):
+            stats.update(
+                {
+                    "pool_size": self.pool.size(),
+                    "checked_in": self.pool.checkedin(),
+                    "checked_out": self.pool.checkedout(),
+                    "overflow": self.pool.overflow(),
+                }
+            )
+        return stats
+
+
+class TimedPoolMixin:
+    """
+    Measures how long each checkout waits for a connection.
+    """
+
+    statistics: PoolStatistics
+
+    def _do_get(self):
+        started_at = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.statistics.record_wait(time.perf_counter() - started_at, True)
+            raise
+        self.statistics.record_wait(time.perf_counter() - started_at)
+        return connection
+
+
+def get_pool_options(
+    database_url: str, statistics: PoolStatistics, is_async: bool = False
+) -> dict:
+    """
+    Returns the create_engine pool arguments configured in the environment.
+    In-memory SQLite keeps its default single connection pool.
+    """
+    url = make_url(database_url)
+    default_pool_class = url.get_dialect().get_pool_class(url)
+    if not issubclass(default_pool_class, (QueuePool, NullPool)):
+        return {}
+
+    base_pool_class: Type[QueuePool] = AsyncAdaptedQueuePool if is_async else QueuePool
+    pool_class = type(
+        f"Timed{base_pool_class.__name__}",
+        (TimedPoolMixin, base_pool_class),
+        {"statistics": statistics},
+    )
+    return {
+        "poolclass": pool_class,
+        "pool_size": int(os.getenv("SQL_POOL_SIZE", "5")),
+        "max_overflow": int(os.getenv("SQL_MAX_OVERFLOW", "10")),
+        "pool_timeout": float(os.getenv("SQL_POOL_TIMEOUT", "30")),
+        "pool_recycle": int(os.getenv("SQL_POOL_RECYCLE", "-1")),
+        "pool_pre_ping": os.getenv("SQL_POOL_PRE_PING", "false").lower() == "true",
+    }
@@ -0,0 +1,76 @@
+import os
+import threading
+from typing import Any, Hashable
+
+from app.utils.metrics import register_metrics
+from app.utils.ttl_cache import TTLCache
+
+
+class ResponseCache:
+    """
+    TTL cache of serialized responses that is emptied on every relevant write.
+    Each invalidation starts a new generation; a response computed during an
+    older generation is not stored, so a write racing a read cannot leave a
+    stale page behind.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.generation = 0
+        self.invalidations = 0
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        """
+        Returns the cached response for the key, or None.
+        """
+        return self._cache.get(key)
+
+    def set(self, key: Hashable, value: Any, generation: int) -> None:
+        """
+        Stores a response computed while `generation` was current.
+        """
+        with self._lock:
+            if generation == self.generation:
+                self._cache.set(key, value)
+
+    def invalidate(self) -> None:
+        """
+        Drops every cached response and starts a new generation.
+        """
+        with self._lock:
+            self.generation += 1
+            self.invalidations += 1
+            self._cache.clear()
+
+    def clear(self) -> None:
+        """
+        Drops every cached response without counting an invalidation.
+        """
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        """
+        Returns the cache counters along with the current generation.
+        """
+        return {
+            **self._cache.stats(),
+            "generation": self.generation,
+            "invalidations": self.invalidations,
+        }
+
+
+# Serialized pages of GET /movie/public, keyed by page or cursor and page size.
+public_movie_cache = ResponseCache(
+    maxsize=int(os.getenv("PUBLIC_MOVIE_CACHE_MAX_SIZE", "1000")),
+    ttl=float(os.getenv("PUBLIC_MOVIE_CACHE_TTL_SECONDS", "300")),
+)
+register_metrics("public_movie_cache", public_movie_cache.stats)
+
+
+def invalidate_public_movies(*is_public: bool) -> None:
+    """
+    Empties the public movie cache if the written movie was or became public.
+    """
+    if any(is_public):
+        public_movie_cache.invalidate()
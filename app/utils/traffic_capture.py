@@ -0,0 +1,255 @@
+import base64
+import json
+import os
+import queue
+import random
+import threading
+import time
+from typing import Callable
+from urllib.parse import parse_qsl, urlencode
+
+from app.utils.metrics import register_metrics
+
+REDACTED = "[REDACTED]"
+SENSITIVE_HEADERS = {"authorization", "cookie", "set-cookie", "x-api-key"}
+SENSITIVE_FIELDS = {"password", "access_token", "refresh_token", "token", "secret"}
+
+
+def redact_fields(data):
+    """
+    Replaces the values of sensitive keys in a decoded JSON document.
+    """
+    if isinstance(data, dict):
+        return {
+            key: REDACTED if key.lower() in SENSITIVE_FIELDS else redact_fields(value)
+            for key, value in data.items()
+        }
+    if isinstance(data, list):
+        return [redact_fields(item) for item in data]
+    return data
+
+
+def sanitize_headers(headers: list) -> dict:
+    """
+    Returns the request headers with credentials redacted. The scheme of
+    an Authorization header is kept, so a replay knows what to substitute.
+    """
+    sanitized = {}
+    for name, value in headers:
+        name, value = name.decode("latin-1").lower(), value.decode("latin-1")
+        if name in SENSITIVE_HEADERS:
+            scheme, _, credentials = value.partition(" ")
+            value = f"{scheme} {REDACTED}" if credentials else REDACTED
+        sanitized[name] = value
+    return sanitized
+
+
+def sanitize_body(body: bytes, content_type: str) -> tuple[str, str]:
+    """
+    Returns the request body with sensitive fields redacted, along with its
+    encoding: "utf-8" for text and "base64" for anything else.
+    """
+    if not body:
+        return "", "utf-8"
+    try:
+        if content_type.startswith("application/json"):
+            return json.dumps(redact_fields(json.loads(body))), "utf-8"
+        if content_type.startswith("application/x-www-form-urlencoded"):
+            fields = parse_qsl(body.decode("utf-8"), keep_blank_values=True)
+            fields = [
+                (key, REDACTED if key.lower() in SENSITIVE_FIELDS else value)
+                for key, value in fields
+            ]
+            return urlencode(fields), "utf-8"
+        return body.decode("utf-8"), "utf-8"
+    except ValueError:
+        return base64.b64encode(body).decode("ascii"), "base64"
+
+
+class TrafficCapture:
+    """
+    Appends a sample of the served requests to a JSONL file. Requests only
+    enqueue their record; a background thread writes them, and records
+    arriving while the queue is full are dropped. If the file cannot be
+    opened, the capture disables itself and counts a write error.
+    """
+
+    def __init__(
+        self,
+        path: str | None,
+        sample_rate: float = 1.0,
+        queue_size: int = 10000,
+        max_body_bytes: int = 65536,
+    ):
+        self.path = path
+        self.sample_rate = sample_rate
+        self.max_body_bytes = max_body_bytes
+        self.captured = 0
+        self.dropped = 0
+        self.write_errors = 0
+        self.open_failed = False
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._thread = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.path) and self.sample_rate > 0 and not self.open_failed
+
+    def should_capture(self) -> bool:
+        """
+        Decides whether the next request is sampled.
+        """
+        return self.enabled and random.random() < self.sample_rate
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._write_records, name="traffic-capture", daemon=True
+                )
+                self._thread.start()
+
+    def _drop_queued(self) -> None:
+        while True:
+            try:
+                record = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if record is not None:
+                with self._lock:
+                    self.dropped += 1
+
+    def _write_records(self) -> None:
+        try:
+            file = open(self.path, "a", encoding="utf-8")
+        except OSError:
+            with self._lock:
+                self.write_errors += 1
+                self.open_failed = True
+            self._drop_queued()
+            return
+        with file:
+            while True:
+                record = self._queue.get()
+                if record is None:
+                    break
+                try:
+                    file.write(json.dumps(record) + "\n")
+                    if self._queue.empty():
+                        file.flush()
+                except (OSError, TypeError, ValueError):
+                    with self._lock:
+                        self.write_errors += 1
+
+    def record(self, record: dict) -> None:
+        """
+        Queues a record for writing, or drops it if the queue is full or
+        the capture file could not be opened.
+        """
+        if self.open_failed:
+            with self._lock:
+                self.dropped += 1
+            return
+        self._start()
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+            return
+        with self._lock:
+            self.captured += 1
+
+    def close(self) -> None:
+        """
+        Writes the queued records and stops the writer thread.
+        """
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None and thread.is_alive():
+            self._queue.put(None)
+            thread.join()
+
+    def stats(self) -> dict:
+        """
+        Returns the capture counters.
+        """
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "sample_rate": self.sample_rate,
+                "captured": self.captured,
+                "dropped": self.dropped,
+                "write_errors": self.write_errors,
+                "queue_depth": self._queue.qsize(),
+            }
+
+
+class TrafficCaptureMiddleware:
+    """
+    ASGI middleware that records sampled requests, sanitized, with their
+    route template, response status and duration.
+    """
+
+    def __init__(self, app: Callable, capture: TrafficCapture):
+        self.app = app
+        self.capture = capture
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.capture.should_capture():
+            await self.app(scope, receive, send)
+            return
+
+        body = bytearray()
+        status = {"code": 500}
+        max_body_bytes = self.capture.max_body_bytes
+
+        async def receive_and_keep_body():
+            message = await receive()
+            if message["type"] == "http.request" and len(body) <= max_body_bytes:
+                body.extend(message.get("body", b""))
+            return message
+
+        async def send_and_keep_status(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        timestamp = time.time()
+        started_at = time.perf_counter()
+        try:
+            await self.app(scope, receive_and_keep_body, send_and_keep_status)
+        finally:
+            duration = time.perf_counter() - started_at
+            headers = sanitize_headers(scope.get("headers", []))
+            if len(body) > max_body_bytes:
+                body_text, body_encoding = "", "truncated"
+            else:
+                body_text, body_encoding = sanitize_body(
+                    bytes(body), headers.get("content-type", "")
+                )
+            route = scope.get("route")
+            self.capture.record(
+                {
+                    "timestamp": timestamp,
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "route": getattr(route, "path", None),
+                    "query": scope.get("query_string", b"").decode("latin-1"),
+                    "headers": headers,
+                    "body": body_text,
+                    "body_encoding": body_encoding,
+                    "status": status["code"],
+                    "duration_ms": duration * 1000,
+                }
+            )
+
+
+traffic_capture = TrafficCapture(
+    path=os.getenv("TRAFFIC_CAPTURE_PATH"),
+    sample_rate=float(os.getenv("TRAFFIC_CAPTURE_SAMPLE_RATE", "1.0")),
+    queue_size=int(os.getenv("TRAFFIC_CAPTURE_QUEUE_SIZE", "10000")),
+    max_body_bytes=int(os.getenv("TRAFFIC_CAPTURE_MAX_BODY_BYTES", "65536")),
+)
+register_metrics("traffic_capture", traffic_capture.stats)
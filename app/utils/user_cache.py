@@ -0,0 +1,18 @@
+import os
+
+from app.utils.metrics import register_metrics
+from app.utils.ttl_cache import TTLCache
+
+# Authenticated users, keyed by the email stored in their access token.
+user_cache = TTLCache(
+    maxsize=int(os.getenv("USER_CACHE_MAX_SIZE", "10000")),
+    ttl=float(os.getenv("USER_CACHE_TTL_SECONDS", "60")),
+)
+register_metrics("user_cache", user_cache.stats)
+
+
+def invalidate_user(email: str) -> None:
+    """
+    Removes a user from the authenticated-user cache.
+    """
+    user_cache.invalidate(email)
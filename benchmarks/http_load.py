@@ -0,0 +1,347 @@
+"""
+HTTP load benchmark of the full application. It seeds a dedicated database
+with users and movies whose ownership and activity follow a Zipf
+distribution, then drives a mix of login, listing, create, update and
+delete requests concurrently and reports latency percentiles and throughput
+per route.
+
+Requests go through an in-process ASGI client, or to a running server with
+--url. The mongodb backend needs a reachable mongod (MONGO_DATABASE_URL):
+the routes use the asyncio PyMongo client, which mongomock cannot replace.
+
+Usage: python -m benchmarks.http_load [--backend sqlite mongodb]
+       [--users N] [--movies N] [--requests N] [--concurrency N]
+       [--output results.json] [--compare previous.json]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+
+# The benchmark always resets its data, so it never uses the configured databases.
+os.environ["SQL_DATABASE_URL"] = os.getenv(
+    "BENCHMARK_SQL_DATABASE_URL", "sqlite:///./benchmark.db"
+)
+os.environ.pop("ASYNC_SQL_DATABASE_URL", None)
+os.environ["MONGO_DB_NAME"] = os.getenv("BENCHMARK_MONGO_DB_NAME", "movies_benchmark")
+os.environ["IS_TEST"] = "false"
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "30")
+
+import httpx
+
+from benchmarks.latency import summarize
+
+EMAIL_PREFIX = "bench-"
+PASSWORD = "password"
+
+# Share of each operation in the request mix.
+OPERATIONS = {
+    "login": 5,
+    "public_list": 40,
+    "user_list": 30,
+    "create": 10,
+    "update": 10,
+    "delete": 5,
+}
+
+
+class LoadState:
+    """
+    Tokens and created movies of the simulated users, shared by the workers.
+    """
+
+    def __init__(self, users: int, zipf_exponent: float, public_pages: int):
+        from app.repositories.bulk_loader import zipf_weights
+
+        self.emails = [f"{EMAIL_PREFIX}{i}@example.com" for i in range(users)]
+        self.user_weights = zipf_weights(users, zipf_exponent)
+        self.page_weights = zipf_weights(public_pages, zipf_exponent)
+        self.tokens = {}
+        self.created = defaultdict(list)
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+
+    def record(self, route: str, started_at: float, response: httpx.Response):
+        self.latencies[route].append(time.perf_counter() - started_at)
+        if response.status_code >= 400:
+            self.errors[route] += 1
+
+
+def random_movie(rng: random.Random) -> dict:
+    from app.models.movie import GenreEnum
+    from app.repositories.bulk_loader import SAMPLE_DESCRIPTIONS, SAMPLE_TITLES
+
+    return {
+        "title": rng.choice(SAMPLE_TITLES),
+        "description": rng.choice(SAMPLE_DESCRIPTIONS),
+        "publication_year": rng.randint(1990, 2024),
+        "genre": rng.choice(list(GenreEnum)).value,
+        "rating": round(rng.uniform(1.0, 10.0), 1),
+        "is_public": rng.random() < 0.5,
+    }
+
+
+async def login(client: httpx.AsyncClient, state: LoadState, email: str) -> str | None:
+    """
+    Logs the user in and keeps the token. Failed logins, such as 503s when
+    the password hashing pool is full, are only recorded.
+    """
+    started_at = time.perf_counter()
+    response = await client.post(
+        "/user/login", data={"username": email, "password": PASSWORD}
+    )
+    state.record("login", started_at, response)
+    if response.status_code != 200:
+        return None
+    state.tokens[email] = response.json()["access_token"]
+    return state.tokens[email]
+
+
+async def run_operation(
+    client: httpx.AsyncClient, state: LoadState, rng: random.Random
+) -> None:
+    """
+    Runs one operation of the mix as a Zipf-chosen user.
+    """
+    operation = rng.choices(list(OPERATIONS), weights=list(OPERATIONS.values()))[0]
+    email = rng.choices(state.emails, cum_weights=state.user_weights)[0]
+    if operation == "login" or email not in state.tokens:
+        token = await login(client, state, email)
+        if operation == "login" or token is None:
+            return
+    token = state.tokens[email]
+    headers = {"Authorization": f"Bearer {token}"}
+    if operation in ("update", "delete") and not state.created[email]:
+        operation = "create"
+
+    started_at = time.perf_counter()
+    if operation == "public_list":
+        page = rng.choices(range(1, len(state.page_weights) + 1), state.page_weights)
+        response = await client.get(
+            "/movie/public", params={"page": page[0], "page_size": 20}
+        )
+    elif operation == "user_list":
+        response = await client.get(
+            "/movie/user", params={"page_size": 20}, headers=headers
+        )
+    elif operation == "create":
+        response = await client.post(
+            "/movie/create", json=random_movie(rng), headers=headers
+        )
+        if response.status_code == 201:
+            state.created[email].append(response.json()["id"])
+    elif operation == "update":
+        movie_id = rng.choice(state.created[email])
+        response = await client.put(
+            f"/movie/{movie_id}",
+            json={"rating": round(rng.uniform(1.0, 10.0), 1)},
+            headers=headers,
+        )
+    else:
+        movie_id = state.created[email].pop()
+        response = await client.delete(f"/movie/{movie_id}/delete", headers=headers)
+    state.record(operation, started_at, response)
+
+
+async def warm_up(client: httpx.AsyncClient, state: LoadState) -> None:
+    """
+    Logs every user in before the measured run, as many at a time as the
+    password hashing pool has workers, so the run starts with valid tokens.
+    """
+    from app.utils.password_hasher import PASSWORD_HASHER_WORKERS
+
+    semaphore = asyncio.Semaphore(PASSWORD_HASHER_WORKERS)
+
+    async def warm_up_user(email: str):
+        async with semaphore:
+            await login(client, state, email)
+
+    await asyncio.gather(*(warm_up_user(email) for email in state.emails))
+    state.latencies.clear()
+    state.errors.clear()
+
+
+async def drive(
+    client: httpx.AsyncClient, state: LoadState, requests: int, concurrency: int
+) -> float:
+    """
+    Logs the users in, then runs the requests with the given number of
+    concurrent workers and returns the elapsed seconds of the run.
+    """
+    await warm_up(client, state)
+    remaining = iter(range(requests))
+
+    async def worker(seed: int):
+        rng = random.Random(seed)
+        for _ in remaining:
+            await run_operation(client, state, rng)
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(worker(seed) for seed in range(concurrency)))
+    return time.perf_counter() - started_at
+
+
+def reset_data(backend: str) -> None:
+    """
+    Drops the benchmark data of the backend.
+    """
+    from app.database_settings import MONGO_DB_NAME, Base, engine, mongo_client
+
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    if backend == "mongodb":
+        mongo_client.drop_database(MONGO_DB_NAME)
+
+
+def clear_caches() -> None:
+    from app.utils.jwt_handler import token_cache
+    from app.utils.movie_versions import movie_versions
+    from app.utils.public_movie_cache import public_movie_cache
+    from app.utils.user_cache import user_cache
+
+    for cache in (user_cache, token_cache, public_movie_cache, movie_versions):
+        cache.clear()
+
+
+async def run_backend(backend: str, options: argparse.Namespace) -> dict:
+    """
+    Seeds the backend, drives the load and returns its results.
+    """
+    from app.repositories.bulk_loader import load_synthetic_data
+    from main import app
+
+    os.environ["REPOSITORY_TYPE"] = backend
+    reset_data(backend)
+    clear_caches()
+    reports = load_synthetic_data(
+        options.users,
+        options.movies,
+        email_prefix=EMAIL_PREFIX,
+        zipf_exponent=options.zipf_exponent,
+    )
+    public_pages = max(1, options.movies // 2 // 20)
+    state = LoadState(options.users, options.zipf_exponent, public_pages)
+
+    if options.url:
+        async with httpx.AsyncClient(base_url=options.url, timeout=60) as client:
+            elapsed = await drive(client, state, options.requests, options.concurrency)
+    else:
+        transport = httpx.ASGITransport(app=app)
+        async with app.router.lifespan_context(app):
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://benchmark", timeout=60
+            ) as client:
+                elapsed = await drive(
+                    client, state, options.requests, options.concurrency
+                )
+
+    routes = summarize(state.latencies, state.errors, elapsed)
+    total = sum(route["requests"] for route in routes.values())
+    return {
+        "seed": [
+            {
+                "model": report.model,
+                "rows": report.rows,
+                "rows_per_second": report.rows_per_second,
+            }
+            for report in reports
+        ],
+        "elapsed_seconds": elapsed,
+        "throughput_rps": total / elapsed if elapsed else 0.0,
+        "routes": routes,
+    }
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_results(results: dict, previous: dict = None) -> None:
+    for backend, result in results["backends"].items():
+        print(
+            f"\n{backend}: {result['throughput_rps']:.1f} req/s "
+            f"over {result['elapsed_seconds']:.2f}s"
+        )
+        print(
+            f"{'route':<12}{'requests':>9}{'errors':>7}{'req/s':>9}"
+            f"{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'p95 diff':>10}"
+        )
+        previous_routes = (
+            (previous or {}).get("backends", {}).get(backend, {}).get("routes", {})
+        )
+        for route, stats in result["routes"].items():
+            diff = ""
+            if route in previous_routes and previous_routes[route]["p95_ms"]:
+                change = stats["p95_ms"] / previous_routes[route]["p95_ms"] - 1
+                diff = f"{change:+.0%}"
+            print(
+                f"{route:<12}{stats['requests']:>9}{stats['errors']:>7}"
+                f"{stats['throughput_rps']:>9.1f}{stats['p50_ms']:>9.1f}"
+                f"{stats['p95_ms']:>9.1f}{stats['p99_ms']:>9.1f}{diff:>10}"
+            )
+
+
+def parse_args(args=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--backend", nargs="+", choices=["sqlite", "mongodb"], default=["sqlite"]
+    )
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--movies", type=int, default=20000)
+    parser.add_argument("--zipf-exponent", type=float, default=1.1)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--url", help="Base URL of a running server to load.")
+    parser.add_argument("--output", default="http_load_results.json")
+    parser.add_argument("--compare", help="Previous results to compare p95 with.")
+    return parser.parse_args(args)
+
+
+def main(args=None) -> dict:
+    options = parse_args(args)
+    results = {
+        "benchmark": "http_load",
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "parameters": {
+            key: value
+            for key, value in vars(options).items()
+            if key not in ("output", "compare")
+        },
+        "backends": {},
+    }
+    for backend in options.backend:
+        results["backends"][backend] = asyncio.run(run_backend(backend, options))
+
+    with open(options.output, "w", encoding="utf-8") as file:
+        json.dump(results, file, indent=2)
+    previous = None
+    if options.compare:
+        with open(options.compare, encoding="utf-8") as file:
+            previous = json.load(file)
+    print_results(results, previous)
+    print(f"\nResults written to {options.output}")
+    return results
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,33 @@
+"""
+Latency statistics shared by the HTTP benchmarks.
+"""
+
+
+def percentile(sorted_values: list, fraction: float) -> float:
+    """
+    Returns the nearest-rank percentile of already sorted values.
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+def summarize(latencies: dict, errors: dict, elapsed: float) -> dict:
+    """
+    Returns the request count, errors, throughput and latency percentiles
+    in milliseconds of every route.
+    """
+    summary = {}
+    for route, values in sorted(latencies.items()):
+        values = sorted(values)
+        summary[route] = {
+            "requests": len(values),
+            "errors": errors.get(route, 0),
+            "throughput_rps": len(values) / elapsed if elapsed else 0.0,
+            "p50_ms": percentile(values, 0.50) * 1000,
+            "p95_ms": percentile(values, 0.95) * 1000,
+            "p99_ms": percentile(values, 0.99) * 1000,
+            "max_ms": values[-1] * 1000,
+        }
+    return summary
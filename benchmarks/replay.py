@@ -0,0 +1,262 @@
+"""
+Replays a traffic capture written by TrafficCaptureMiddleware
+(TRAFFIC_CAPTURE_PATH) and reports the latency distribution per route, next
+to the captured latencies, and the responses whose status differs from the
+captured one.
+
+Requests keep their original pacing, scaled by --speed (2 replays twice as
+fast, 0 sends them as fast as possible). Captured credentials are redacted,
+so authenticated requests use the token of --email/--password instead.
+Requests go to the configured database through an in-process ASGI client,
+or to a running server with --url.
+
+Usage: python -m benchmarks.replay capture.jsonl [--speed 1.0]
+       [--email user@example.com --password secret] [--url URL]
+       [--output replay_results.json]
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import os
+import sys
+import time
+from collections import Counter, defaultdict
+from urllib.parse import parse_qsl, urlencode
+
+# A replay must not capture its own traffic.
+os.environ.pop("TRAFFIC_CAPTURE_PATH", None)
+
+import httpx
+
+from app.utils.traffic_capture import REDACTED
+from benchmarks.latency import summarize
+
+
+def read_capture(path: str, limit: int = None) -> list:
+    """
+    Returns the captured records in timestamp order.
+    """
+    with open(path, encoding="utf-8") as file:
+        records = [json.loads(line) for line in file if line.strip()]
+    records.sort(key=lambda record: record["timestamp"])
+    return records[:limit] if limit else records
+
+
+def route_key(record: dict) -> str:
+    return f"{record['method']} {record.get('route') or record['path']}"
+
+
+def restore_body(record: dict, password: str | None) -> bytes:
+    """
+    Returns the body to send, with redacted passwords replaced.
+    """
+    if record["body_encoding"] == "base64":
+        return base64.b64decode(record["body"])
+    body = record["body"]
+    content_type = record["headers"].get("content-type", "")
+    if password is None:
+        return body.encode("utf-8")
+    if content_type.startswith("application/x-www-form-urlencoded"):
+        fields = [
+            (key, password if value == REDACTED else value)
+            for key, value in parse_qsl(body, keep_blank_values=True)
+        ]
+        return urlencode(fields).encode("utf-8")
+    return body.replace(json.dumps(REDACTED), json.dumps(password)).encode("utf-8")
+
+
+def restore_headers(record: dict, token: str | None) -> dict:
+    """
+    Returns the headers to send, with the redacted Authorization replaced
+    by the replay token and the hop-by-hop headers removed.
+    """
+    headers = {
+        name: value
+        for name, value in record["headers"].items()
+        if name not in ("host", "content-length", "connection", "cookie")
+    }
+    if token and REDACTED in headers.get("authorization", ""):
+        headers["authorization"] = f"Bearer {token}"
+    elif REDACTED in headers.get("authorization", ""):
+        del headers["authorization"]
+    return headers
+
+
+class ReplayState:
+    """
+    Latencies and status differences of the replayed requests.
+    """
+
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.captured = defaultdict(list)
+        self.mismatches = defaultdict(Counter)
+        self.max_lag = 0.0
+
+    def record(self, record: dict, latency: float, status: int) -> None:
+        key = route_key(record)
+        self.latencies[key].append(latency)
+        self.captured[key].append(record["duration_ms"] / 1000)
+        if status >= 400:
+            self.errors[key] += 1
+        if status != record["status"]:
+            self.mismatches[key][f"{record['status']}->{status}"] += 1
+
+
+async def replay(
+    client: httpx.AsyncClient,
+    records: list,
+    speed: float,
+    concurrency: int,
+    token: str | None,
+    password: str | None,
+) -> tuple[ReplayState, float]:
+    """
+    Sends the records at their scheduled times and returns the replay
+    state along with the elapsed seconds.
+    """
+    state = ReplayState()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def send(record: dict, scheduled_at: float):
+        async with semaphore:
+            state.max_lag = max(state.max_lag, time.perf_counter() - scheduled_at)
+            started_at = time.perf_counter()
+            try:
+                response = await client.request(
+                    record["method"],
+                    record["path"],
+                    params=record["query"] or None,
+                    headers=restore_headers(record, token),
+                    content=restore_body(record, password),
+                )
+                status = response.status_code
+            except httpx.TransportError:
+                status = 599
+            state.record(record, time.perf_counter() - started_at, status)
+
+    started_at = time.perf_counter()
+    first_timestamp = records[0]["timestamp"] if records else 0.0
+    tasks = []
+    for record in records:
+        if record["body_encoding"] == "truncated":
+            continue
+        offset = (record["timestamp"] - first_timestamp) / speed if speed else 0.0
+        scheduled_at = started_at + offset
+        delay = scheduled_at - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.create_task(send(record, scheduled_at)))
+    await asyncio.gather(*tasks)
+    return state, time.perf_counter() - started_at
+
+
+async def login(client: httpx.AsyncClient, email: str, password: str) -> str:
+    response = await client.post(
+        "/user/login", data={"username": email, "password": password}
+    )
+    response.raise_for_status()
+    return response.json()["access_token"]
+
+
+async def run(options: argparse.Namespace) -> dict:
+    """
+    Replays the capture and returns the results.
+    """
+    records = read_capture(options.capture, options.limit)
+
+    async def replay_with(client: httpx.AsyncClient):
+        token = None
+        if options.email and options.password:
+            token = await login(client, options.email, options.password)
+        return await replay(
+            client, records, options.speed, options.concurrency, token, options.password
+        )
+
+    if options.url:
+        async with httpx.AsyncClient(base_url=options.url, timeout=60) as client:
+            state, elapsed = await replay_with(client)
+    else:
+        from main import app
+
+        transport = httpx.ASGITransport(app=app)
+        async with app.router.lifespan_context(app):
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://replay", timeout=60
+            ) as client:
+                state, elapsed = await replay_with(client)
+
+    routes = summarize(state.latencies, state.errors, elapsed)
+    captured = summarize(state.captured, {}, elapsed)
+    for key, stats in routes.items():
+        stats["captured_p50_ms"] = captured[key]["p50_ms"]
+        stats["captured_p95_ms"] = captured[key]["p95_ms"]
+        stats["captured_p99_ms"] = captured[key]["p99_ms"]
+        stats["status_mismatches"] = dict(state.mismatches[key])
+    return {
+        "capture": options.capture,
+        "speed": options.speed,
+        "requests": sum(stats["requests"] for stats in routes.values()),
+        "elapsed_seconds": elapsed,
+        "max_lag_ms": state.max_lag * 1000,
+        "routes": routes,
+    }
+
+
+def print_results(results: dict) -> None:
+    print(
+        f"{results['requests']} requests replayed in "
+        f"{results['elapsed_seconds']:.2f}s "
+        f"(max start lag {results['max_lag_ms']:.1f} ms)"
+    )
+    print(
+        f"{'route':<32}{'requests':>9}{'p50 ms':>9}{'p95 ms':>9}"
+        f"{'p99 ms':>9}{'was p95':>9}  status diff"
+    )
+    for key, stats in results["routes"].items():
+        mismatches = ", ".join(
+            f"{change} x{count}" for change, count in stats["status_mismatches"].items()
+        )
+        print(
+            f"{key:<32}{stats['requests']:>9}{stats['p50_ms']:>9.1f}"
+            f"{stats['p95_ms']:>9.1f}{stats['p99_ms']:>9.1f}"
+            f"{stats['captured_p95_ms']:>9.1f}  {mismatches}"
+        )
+
+
+def parse_args(args=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("capture", help="JSONL file written by the capture.")
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=1.0,
+        help="Pacing factor; 0 sends every request without waiting.",
+    )
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--limit", type=int, help="Replay only the first N requests.")
+    parser.add_argument("--email", help="User whose token replaces redacted ones.")
+    parser.add_argument(
+        "--password",
+        help="Password of --email, also sent in place of redacted passwords.",
+    )
+    parser.add_argument("--url", help="Base URL of a running server to replay against.")
+    parser.add_argument("--output", help="Writes the results as JSON.")
+    return parser.parse_args(args)
+
+
+def main(args=None) -> dict:
+    options = parse_args(args)
+    results = asyncio.run(run(options))
+    if options.output:
+        with open(options.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+    print_results(results)
+    return results
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
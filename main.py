@@ -1,3 +1,4 @@
+import logging
 from contextlib import asynccontextmanager
 
 import uvicorn
@@ -6,16 +7,40 @@ from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 
-from app.database_settings import engine, Base
+from app.database_settings import async_engine, engine, Base, SessionLocal
+from app.repositories.indexes import ensure_indexes
+from app.routers.metrics import metrics_router
 from app.routers.movie import movie_router
 from app.routers.time_data import time_router
 from app.routers.user import user_router
+from app.services.movie_count_service import MovieCountService
+from app.services.movie_stats_service import MovieStatsService
+from app.utils.http_client import close_http_client
+from app.utils.password_hasher import password_hashing_pool
+from app.utils.traffic_capture import TrafficCaptureMiddleware, traffic_capture
+
+logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     Base.metadata.create_all(bind=engine)
+    session = SessionLocal()
+    try:
+        missing_indexes = ensure_indexes(session)
+        if MovieCountService(session).ensure():
+            logger.info("Counted the existing movies.")
+        if MovieStatsService(session).ensure():
+            logger.info("Aggregated the statistics of the existing movies.")
+    finally:
+        session.close()
+    if missing_indexes:
+        logger.warning("Missing indexes: %s", ", ".join(missing_indexes))
     yield
+    password_hashing_pool.shutdown()
+    traffic_capture.close()
+    await close_http_client()
+    await async_engine.dispose()
 
 
 app = FastAPI(
@@ -24,6 +49,7 @@ app = FastAPI(
     description="This API allows users to create, read, update, and delete movie data.",
     version="1.0",
 )
+app.add_middleware(TrafficCaptureMiddleware, capture=traffic_capture)
 
 
 @app.exception_handler(RequestValidationError)
@@ -50,6 +76,7 @@ app.include_router(user_router, prefix="/user", tags=["user"])
 app.include_router(movie_router, prefix="/movie", tags=["movie"])
 
 app.include_router(time_router, prefix="/time", tags=["time"])
+app.include_router(metrics_router, prefix="/metrics", tags=["metrics"])
 
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -1,78 +1,110 @@
-import random
-from datetime import datetime, timezone
+"""
+Loads movies into the configured database, either generated or read from
+NDJSON/CSV files such as the ones served by /movie/export.
 
-from app.database_settings import engine, SessionLocal, Base
-from app.models.user import User
-from app.models.movie import Movie, GenreEnum
+Usage:
+    python populate_database.py
+    python populate_database.py --users 1000 --movies 1000000 --workers 4
+    python populate_database.py --file movies.ndjson --batch-size 10000
+"""
 
-Base.metadata.create_all(bind=engine)
+import argparse
+import os
 
+from app.database_settings import SessionLocal
+from app.models.movie import Movie
+from app.repositories.bulk_loader import (
+    get_bulk_writer,
+    load,
+    load_synthetic_data,
+    read_movies,
+)
+from app.services.movie_count_service import MovieCountService
+from app.services.movie_stats_service import MovieStatsService
 
-def create_movies():
-    """
-    Create 15 public movies and save them to the database.
-    """
-    titles = [
-        "The Shawshank Redemption",
-        "The Godfather",
-        "The Dark Knight",
-        "Pulp Fiction",
-        "The Lord of the Rings: The Return of the King",
-        "Forrest Gump",
-        "Inception",
-        "Fight Club",
-        "The Matrix",
-        "Goodfellas",
-        "The Silence of the Lambs",
-        "Interstellar",
-        "Se7en",
-        "The Usual Suspects",
-        "The Lion King",
-    ]
 
-    descriptions = [
-        "A story of hope and friendship.",
-        "A powerful tale of family and crime.",
-        "A dark hero rises to save the city.",
-        "Non-linear storytelling at its best.",
-        "An epic journey to destroy the One Ring.",
-        "A man's journey through life and love.",
-        "A dream within a dream.",
-        "A story about rebellion and freedom.",
-        "A mind-bending sci-fi masterpiece.",
-        "The rise and fall of a gangster.",
-        "A psychological thriller of a lifetime.",
-        "Exploring the boundaries of space and time.",
-        "A gritty detective story.",
-        "A twisty tale of deception.",
-        "A heartwarming animated classic.",
-    ]
+def parse_args(args=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--file",
+        action="append",
+        default=[],
+        help="NDJSON or CSV file of movies to load; can be repeated.",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["ndjson", "csv"],
+        help="Format of the files, by default their extension.",
+    )
+    parser.add_argument("--users", type=int, default=0, help="Users to generate.")
+    parser.add_argument(
+        "--movies",
+        type=int,
+        default=None,
+        help="Movies to generate, 15 when neither files nor users are given.",
+    )
+    parser.add_argument(
+        "--zipf-exponent",
+        type=float,
+        default=None,
+        help="Skew movie ownership towards the first users following a Zipf "
+        "distribution with this exponent; uniform by default.",
+    )
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Batches written in parallel. SQLite serializes writers, so "
+        "more than one only helps server databases and MongoDB.",
+    )
+    return parser.parse_args(args)
 
-    genres = list(GenreEnum)
 
-    session = SessionLocal()
-    try:
-        for i in range(15):
-            movie = Movie(
-                title=titles[i],
-                description=descriptions[i],
-                publication_year=random.randint(1990, 2024),
-                genre=random.choice(genres),
-                rating=round(random.uniform(1.0, 10.0), 1),
-                is_public=True,
-                created_at=datetime.now(timezone.utc),
-                updated_at=datetime.now(timezone.utc),
+def main(args=None) -> None:
+    options = parse_args(args)
+    if os.getenv("REPOSITORY_TYPE", "sqlite") != "mongodb":
+        from app.database_settings import Base, engine
+
+        Base.metadata.create_all(bind=engine)
+
+    reports = []
+    for path in options.file:
+        reports.append(
+            load(
+                read_movies(path, options.format),
+                get_bulk_writer(Movie),
+                path,
+                options.batch_size,
+                options.workers,
             )
-            session.add(movie)
+        )
 
-        session.commit()
-        print("15 movies were successfully created and saved to the database.")
-    except Exception as e:
-        session.rollback()
-        print(f"An error occurred: {e}")
+    movies = options.movies
+    if movies is None:
+        movies = 0 if options.file or options.users else 15
+    reports.extend(
+        load_synthetic_data(
+            options.users,
+            movies,
+            options.batch_size,
+            options.workers,
+            zipf_exponent=options.zipf_exponent,
+        )
+    )
+    for report in reports:
+        print(report)
+
+    # Bulk writes bypass the counts and statistics on MongoDB.
+    session = SessionLocal()
+    try:
+        drifted = MovieCountService(session).reconcile()
+        MovieStatsService(session).rebuild()
     finally:
         session.close()
+    if drifted:
+        print(f"Repaired {len(drifted)} movie counts.")
 
 
 if __name__ == "__main__":
-    create_movies()
+    main()
@@ -5,13 +5,30 @@ import pytest
 from app.database_settings import (
     Base,
     test_engine,
+    TestingAsyncSessionLocal,
     TestingSessionLocal,
+    get_async_session,
+    get_async_session_factory,
     get_session_local,
 )
 
+from app.services.time_service import time_zone_cache
+from app.utils.jwt_handler import reload_auth_settings, token_cache
+from app.utils.movie_versions import movie_versions
+from app.utils.password_hasher import password_hashing_pool
+from app.utils.public_movie_cache import public_movie_cache
+from app.utils.user_cache import user_cache
 from main import app
 
 
+@pytest.fixture
+def anyio_backend():
+    """
+    Runs the asynchronous tests with asyncio.
+    """
+    return "asyncio"
+
+
 @pytest.fixture(scope="session", autouse=True)
 def setup_test_db():
     """
@@ -21,8 +38,10 @@ def setup_test_db():
     os.environ["SECRET_TOKEN"] = "secret_token"
     os.environ["ALGORITHM"] = "HS256"
     os.environ["REPOSITORY_TYPE"] = "sqlite"
+    reload_auth_settings()
     Base.metadata.create_all(bind=test_engine)
     yield
+    password_hashing_pool.shutdown()
     Base.metadata.drop_all(bind=test_engine)
 
 
@@ -45,3 +64,34 @@ def override_dependency(test_db):
     Function to override FastAPI's SessionLocal dependency for testing.
     """
     app.dependency_overrides[get_session_local] = lambda: test_db
+
+
+async def override_async_session():
+    """
+    Yields an asyncio session bound to the test database.
+    """
+    async with TestingAsyncSessionLocal() as session:
+        yield session
+
+
+@pytest.fixture(scope="function", autouse=True)
+def override_async_dependency():
+    """
+    Function to override FastAPI's asyncio session dependency for testing.
+    """
+    app.dependency_overrides[get_async_session] = override_async_session
+    app.dependency_overrides[get_async_session_factory] = (
+        lambda: TestingAsyncSessionLocal
+    )
+
+
+@pytest.fixture(scope="function", autouse=True)
+def clear_caches():
+    """
+    Starts every test with empty in-process caches.
+    """
+    user_cache.clear()
+    token_cache.clear()
+    public_movie_cache.clear()
+    movie_versions.clear()
+    time_zone_cache.clear()
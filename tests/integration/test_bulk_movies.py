@@ -0,0 +1,195 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+from app.services.movie_count_service import PUBLIC_COUNT_SCOPE, MovieCountService
+from app.services.movie_service import MovieService
+from app.services.user_service import UserService
+from app.utils.jwt_handler import create_access_token
+from app.utils.public_movie_cache import public_movie_cache
+from tests.testing_helper import SetupHelper
+
+client = TestClient(app)
+
+
+class TestBulkMovies:
+    """
+    Tests for the create_movies, update_movies and delete_movies endpoints.
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self, test_db):
+        """
+        Initial configuration for every test.
+        """
+        self.test_db = test_db
+        self.user_service = UserService(self.test_db)
+        self.test_user = SetupHelper.create_test_user(
+            self.user_service, "bulk_user@example.com", "password123"
+        )
+        valid_token = create_access_token({"email": "bulk_user@example.com"})
+        self.headers = {"Authorization": f"Bearer {valid_token}"}
+        self.movie_service = MovieService(self.test_db)
+        self.movie_data = {
+            "title": "Bulk Movie",
+            "description": "Description",
+            "publication_year": 2020,
+            "genre": "Drama",
+            "rating": 7.5,
+            "is_public": False,
+        }
+
+    def create_movie(self, **fields):
+        """
+        Creates a movie of the test user directly in the database.
+        """
+        return self.movie_service.repository.create_object(
+            {
+                **self.movie_data,
+                "genre": "DRAMA",
+                "user_id": self.test_user.id,
+                **fields,
+            }
+        )
+
+    def test_create_movies(self):
+        """
+        Test creating several movies, reporting the invalid rows by position.
+        """
+        movies = [
+            {**self.movie_data, "title": "First"},
+            {**self.movie_data, "genre": "Unknown"},
+            {**self.movie_data, "title": "Third"},
+        ]
+        response = client.post(
+            "/movie/bulk", json={"movies": movies}, headers=self.headers
+        )
+
+        assert response.status_code == 200
+        result = response.json()
+        assert [movie["title"] for movie in result["movies"]] == ["First", "Third"]
+        assert all(movie["user_id"] == self.test_user.id for movie in result["movies"])
+        assert [error["index"] for error in result["errors"]] == [1]
+        assert result["errors"][0]["code"] == "INVALID_DATA"
+
+    def test_create_movies_invalidates_public_cache(self):
+        """
+        Test that creating a public movie in bulk invalidates the public cache.
+        """
+        generation = public_movie_cache.generation
+
+        client.post(
+            "/movie/bulk", json={"movies": [self.movie_data]}, headers=self.headers
+        )
+        assert public_movie_cache.generation == generation
+
+        public_movie = {**self.movie_data, "is_public": True}
+        client.post(
+            "/movie/bulk", json={"movies": [public_movie]}, headers=self.headers
+        )
+        assert public_movie_cache.generation == generation + 1
+
+    def test_create_movies_too_many_rows(self):
+        """
+        Test that requests above the row limit are rejected.
+        """
+        response = client.post(
+            "/movie/bulk",
+            json={"movies": [self.movie_data] * 5001},
+            headers=self.headers,
+        )
+
+        assert response.status_code == 422
+
+    def test_create_movies_unauthenticated(self):
+        """
+        Test creating movies without authentication.
+        """
+        response = client.post("/movie/bulk", json={"movies": [self.movie_data]})
+
+        assert response.status_code == 401
+
+    def test_update_movies(self):
+        """
+        Test updating several movies, reporting missing and foreign movies.
+        """
+        movie = self.create_movie()
+        other_user = SetupHelper.create_test_user(
+            self.user_service, "bulk_other@example.com", "password123"
+        )
+        other_movie = self.create_movie(user_id=other_user.id)
+
+        response = client.put(
+            "/movie/bulk",
+            json={
+                "movies": [
+                    {"id": movie.id, "title": "Updated"},
+                    {"id": other_movie.id, "title": "Not mine"},
+                    {"id": movie.id},
+                    {"id": movie.id, "owner": "me"},
+                ]
+            },
+            headers=self.headers,
+        )
+
+        assert response.status_code == 200
+        result = response.json()
+        assert [movie["title"] for movie in result["movies"]] == ["Updated"]
+        assert [(error["index"], error["code"]) for error in result["errors"]] == [
+            (1, "NOT_FOUND"),
+            (2, "INVALID_DATA"),
+            (3, "INVALID_DATA"),
+        ]
+
+    def test_update_movies_rejects_duplicate_ids(self):
+        """
+        Test that a movie repeated in a batch is written once, so the public
+        count only moves by one.
+        """
+        movie = self.create_movie()
+        count_service = MovieCountService(self.test_db)
+        public_total = count_service.get_totals().get(PUBLIC_COUNT_SCOPE, 0)
+
+        response = client.put(
+            "/movie/bulk",
+            json={
+                "movies": [
+                    {"id": movie.id, "is_public": True},
+                    {"id": str(movie.id), "is_public": True},
+                ]
+            },
+            headers=self.headers,
+        )
+        self.test_db.rollback()
+        totals = count_service.get_totals()
+        self.movie_service.repository.delete_object(movie.id)
+
+        assert response.status_code == 200
+        result = response.json()
+        assert [movie["id"] for movie in result["movies"]] == [movie.id]
+        assert [(error["index"], error["code"]) for error in result["errors"]] == [
+            (1, "DUPLICATE_ID")
+        ]
+        assert totals[PUBLIC_COUNT_SCOPE] == public_total + 1
+
+    def test_delete_movies(self):
+        """
+        Test deleting several movies, reporting missing and foreign movies.
+        """
+        movie = self.create_movie()
+        other_user = SetupHelper.create_test_user(
+            self.user_service, "bulk_other@example.com", "password123"
+        )
+        other_movie = self.create_movie(user_id=other_user.id)
+
+        response = client.post(
+            "/movie/bulk/delete",
+            json={"ids": [movie.id, other_movie.id, 99999]},
+            headers=self.headers,
+        )
+
+        assert response.status_code == 200
+        result = response.json()
+        assert result["ids"] == [movie.id]
+        assert [error["index"] for error in result["errors"]] == [1, 2]
+        assert self.movie_service.repository.get_object(other_movie.id) is not None
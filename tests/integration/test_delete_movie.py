@@ -2,10 +2,11 @@ import pytest
 from fastapi.testclient import TestClient
 
 from main import app
+from app.database_settings import test_async_engine
 from app.services.movie_service import MovieService
 from app.services.user_service import UserService
 from app.utils.jwt_handler import create_access_token
-from tests.testing_helper import SetupHelper
+from tests.testing_helper import SetupHelper, capture_statements
 
 client = TestClient(app)
 
@@ -74,6 +75,21 @@ class TestDeleteMovie:
             error_detail["message"] == "You are not authorized to perform this action."
         )
 
+    def test_delete_movie_unauthorized_user_keeps_movie(self):
+        """
+        Test that a refused delete leaves the movie of the other user in place.
+        """
+        other_user = SetupHelper.create_test_user(
+            self.user_service, "keep_user@example.com"
+        )
+        other_user_token = create_access_token({"email": other_user.email})
+
+        headers = {"Authorization": f"Bearer {other_user_token}"}
+        client.delete(f"movie/{self.movie.id}/delete", headers=headers)
+
+        self.db.expire_all()
+        assert self.movie_service.repository.get_object(self.movie.id) is not None
+
     def test_delete_movie_no_authentication(self):
         """
         Test deleting a private movie without authentication.
@@ -95,3 +111,21 @@ class TestDeleteMovie:
         assert response.status_code == 204
         assert response.text == ""
         assert movie_in_db is None
+
+    def test_delete_movie_single_statement(self):
+        """
+        Test that a successful delete checks the owner and deletes the movie
+        with a single DELETE ... RETURNING.
+        """
+        headers = {"Authorization": f"Bearer {self.valid_token}"}
+        client.get("/movie/user", headers=headers)
+
+        with capture_statements(test_async_engine.sync_engine) as statements:
+            response = client.delete(f"movie/{self.movie.id}/delete", headers=headers)
+
+        assert response.status_code == 204
+        movie_queries = [query for query in statements if "movie" in query]
+        assert len(movie_queries) == 1
+        assert movie_queries[0].startswith("DELETE FROM movie")
+        assert "user_id" in movie_queries[0]
+        assert "RETURNING" in movie_queries[0]
@@ -0,0 +1,114 @@
+import csv
+import io
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+from app.database_settings import test_async_engine
+from app.services.movie_service import MovieService
+from tests.testing_helper import capture_statements
+
+client = TestClient(app)
+
+
+class TestExportMovies:
+    """
+    Tests for the export_movies endpoint.
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self, test_db):
+        """
+        Initial configuration for every test. The movies are deleted
+        afterwards, since other tests count the public movies.
+        """
+        self.movie_service = MovieService(test_db)
+        movie_ids = []
+        for i in range(1, 6):
+            movie = self.movie_service.repository.create_object(
+                {
+                    "title": f"Export Movie {i}",
+                    "description": f"Description {i}",
+                    "publication_year": 2000 + i,
+                    "genre": "DRAMA",
+                    "rating": 6.0 + i,
+                    "is_public": i != 3,
+                    "user_id": None,
+                }
+            )
+            movie_ids.append(movie.id)
+        yield
+        self.movie_service.repository.delete_objects(movie_ids)
+
+    def test_export_movies_ndjson(self):
+        """
+        Test that every public movie is streamed as one JSON line, in id order.
+        """
+        response = client.get("/movie/export")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        movies = [json.loads(line) for line in response.text.splitlines()]
+        public_movies = self.movie_service.repository.get_objects_by_filters(
+            {"is_public": True}
+        )
+        assert [movie["id"] for movie in movies] == [
+            movie.id for movie in public_movies
+        ]
+        assert all(movie["is_public"] for movie in movies)
+
+    def test_export_movies_invalid_resume_position(self):
+        """
+        Test that a resume position that is not a movie id is rejected.
+        """
+        response = client.get("/movie/export?resume_after=abc")
+
+        assert response.status_code == 400
+        assert response.json()["detail"]["error"]["code"] == "INVALID_CURSOR"
+
+    def test_export_movies_resume(self):
+        """
+        Test that an export resumed after a movie continues right after it.
+        """
+        movies = [json.loads(line) for line in client.get("/movie/export").iter_lines()]
+        last_received = movies[len(movies) // 2]["id"]
+
+        response = client.get(f"/movie/export?resume_after={last_received}")
+        resumed = [json.loads(line) for line in response.text.splitlines()]
+
+        assert resumed == movies[len(movies) // 2 + 1 :]
+
+    def test_export_movies_without_owner_join(self):
+        """
+        Test that the export reads the movies with a single query, without
+        joining their owners.
+        """
+        with capture_statements(test_async_engine.sync_engine) as statements:
+            response = client.get("/movie/export")
+
+        assert response.status_code == 200
+        movie_queries = [query for query in statements if "FROM movie" in query]
+        assert len(movie_queries) == 1
+        assert "JOIN" not in movie_queries[0]
+
+    def test_export_movies_csv(self):
+        """
+        Test exporting public movies as CSV with a header row.
+        """
+        response = client.get("/movie/export?format=csv")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert "Export Movie 1" in [row["title"] for row in rows]
+        assert "Export Movie 3" not in [row["title"] for row in rows]
+
+    def test_export_movies_invalid_format(self):
+        """
+        Test exporting with an unsupported format.
+        """
+        response = client.get("/movie/export?format=xml")
+
+        assert response.status_code == 422
@@ -0,0 +1,225 @@
+import random
+
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+from app.services.movie_service import MovieService
+from app.services.user_service import UserService
+from app.utils.cursor import encode_cursor
+from app.utils.jwt_handler import create_access_token
+from tests.testing_helper import SetupHelper
+
+client = TestClient(app)
+
+
+class TestFilterMovies:
+    """
+    Tests for the filter and sort parameters of the movie listings.
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self, test_db):
+        """
+        Initial configuration for every test. Every test filters on its own
+        publication year, and its movies are deleted afterwards, since other
+        tests count the public movies.
+        """
+        self.year = random.randint(3000, 900000)
+        self.user_service = UserService(test_db)
+        self.test_user = SetupHelper.create_test_user(self.user_service)
+        self.headers = {
+            "Authorization": f"Bearer {create_access_token({'email': self.test_user.email})}"
+        }
+        self.movie_service = MovieService(test_db)
+        self.movies = [
+            ("Alpha", "DRAMA", 7.5, True),
+            ("Bravo", "ACTION", 9.0, True),
+            ("Charlie", "COMEDY", 5.0, True),
+            ("Delta", "ACTION", 7.5, True),
+            ("Echo", "DRAMA", 8.0, False),
+        ]
+        self.ids = {}
+        for title, genre, rating, is_public in self.movies:
+            movie = self.movie_service.repository.create_object(
+                {
+                    "title": title,
+                    "description": "Description",
+                    "publication_year": self.year,
+                    "genre": genre,
+                    "rating": rating,
+                    "is_public": is_public,
+                    "user_id": self.test_user.id,
+                }
+            )
+            self.ids[title] = movie.id
+        yield
+        for movie_id in self.ids.values():
+            self.movie_service.repository.delete_object(movie_id)
+
+    def titles(self, response) -> list:
+        return [movie["title"] for movie in response.json()]
+
+    def get_public(self, **params):
+        params = {"min_year": self.year, "max_year": self.year, **params}
+        return client.get("/movie/public", params=params)
+
+    def test_rating_range(self):
+        """
+        Test that only movies rated within the range are listed.
+        """
+        response = self.get_public(min_rating=7.5, max_rating=8.5)
+
+        assert response.status_code == 200
+        assert self.titles(response) == ["Alpha", "Delta"]
+
+    def test_genre_list(self):
+        """
+        Test that only movies of the requested genres are listed.
+        """
+        response = self.get_public(genre=["Action", "Comedy"])
+
+        assert self.titles(response) == ["Bravo", "Charlie", "Delta"]
+
+    def test_sort_by_rating_descending(self):
+        """
+        Test that ties of a descending sort are in descending id order.
+        """
+        response = self.get_public(sort="-rating")
+
+        assert self.titles(response) == ["Bravo", "Delta", "Alpha", "Charlie"]
+
+    def test_sort_by_title(self):
+        """
+        Test that movies are sorted by title.
+        """
+        response = self.get_public(sort="title", genre=["Drama", "Action"])
+
+        assert self.titles(response) == ["Alpha", "Bravo", "Delta"]
+
+    @pytest.mark.parametrize("sort", ["rating", "-rating", "created_at", "-title"])
+    def test_sorted_keyset_pagination(self, sort):
+        """
+        Test that following X-Next-Cursor of a sorted listing returns the
+        same movies as a single page.
+        """
+        expected = self.titles(self.get_public(sort=sort, page_size=10))
+
+        seen = []
+        params = {"sort": sort, "page_size": 1}
+        while True:
+            response = self.get_public(**params)
+            seen.extend(self.titles(response))
+            cursor = response.headers.get("X-Next-Cursor")
+            if cursor is None:
+                break
+            params["cursor"] = cursor
+
+        assert seen == expected
+
+    @pytest.mark.parametrize("sort", ["rating", "-rating"])
+    def test_sorted_keyset_pagination_across_null_ratings(self, sort):
+        """
+        Test that pages of a rating listing continue past unrated movies,
+        listed first in ascending order and last in descending order.
+        """
+        for title in ("Unrated 1", "Unrated 2"):
+            movie = self.movie_service.repository.create_object(
+                {
+                    "title": title,
+                    "description": "Description",
+                    "publication_year": self.year,
+                    "genre": "DRAMA",
+                    "rating": None,
+                    "is_public": True,
+                    "user_id": self.test_user.id,
+                }
+            )
+            self.ids[title] = movie.id
+
+        seen = []
+        params = {"sort": sort, "page_size": 2}
+        while True:
+            response = self.get_public(**params)
+            assert response.status_code == 200
+            seen.extend(self.titles(response))
+            cursor = response.headers.get("X-Next-Cursor")
+            if cursor is None:
+                break
+            params["cursor"] = cursor
+
+        rated = ["Charlie", "Alpha", "Delta", "Bravo"]
+        if sort == "rating":
+            assert seen == ["Unrated 1", "Unrated 2", *rated]
+        else:
+            assert seen == ["Bravo", "Delta", "Alpha", "Charlie"] + [
+                "Unrated 2",
+                "Unrated 1",
+            ]
+
+    def test_sorted_listing_rejects_id_cursor(self):
+        """
+        Test that a cursor without a sort value is rejected by a sorted listing.
+        """
+        response = self.get_public(sort="rating", cursor=encode_cursor({"id": 1}))
+
+        assert response.status_code == 400
+        assert response.json()["detail"]["error"]["code"] == "INVALID_CURSOR"
+
+    @pytest.mark.parametrize(
+        "sort, value",
+        [
+            ("rating", [1]),
+            ("rating", "high"),
+            ("rating", True),
+            ("title", 1),
+            ("title", None),
+            ("created_at", {"a": 1}),
+            ("created_at", "yesterday"),
+        ],
+    )
+    def test_sorted_listing_rejects_invalid_value(self, sort, value):
+        """
+        Test that a cursor whose value does not match the sort field is rejected.
+        """
+        cursor = encode_cursor({"id": self.ids["Alpha"], "value": value})
+
+        response = self.get_public(sort=sort, cursor=cursor)
+
+        assert response.status_code == 400
+        assert response.json()["detail"]["error"]["code"] == "INVALID_CURSOR"
+
+    def test_invalid_sort(self):
+        """
+        Test that only the supported sort orders are accepted.
+        """
+        response = self.get_public(sort="description")
+
+        assert response.status_code == 422
+
+    def test_filters_change_etag(self):
+        """
+        Test that pages with different filters get different ETags.
+        """
+        first = self.get_public(genre=["Action"])
+        second = self.get_public(genre=["Drama"])
+
+        assert first.headers["ETag"] != second.headers["ETag"]
+
+    def test_user_movies_filters(self):
+        """
+        Test that the user listing accepts the same filters and sorting.
+        """
+        response = client.get(
+            "/movie/user",
+            params={
+                "min_year": self.year,
+                "max_year": self.year,
+                "min_rating": 7.5,
+                "sort": "-rating",
+            },
+            headers=self.headers,
+        )
+
+        assert response.status_code == 200
+        assert self.titles(response) == ["Bravo", "Echo", "Delta", "Alpha"]
@@ -1,10 +1,15 @@
+from unittest.mock import patch
+
 import pytest
 from fastapi.testclient import TestClient
 from main import app
+from app.database_settings import test_async_engine
 from app.services.movie_service import MovieService
 from app.services.user_service import UserService
+from app.utils.cursor import encode_cursor
 from app.utils.jwt_handler import create_access_token
-from tests.testing_helper import SetupHelper
+from app.utils.public_movie_cache import public_movie_cache
+from tests.testing_helper import SetupHelper, capture_statements
 
 client = TestClient(app)
 
@@ -102,3 +107,186 @@ class TestGetPublicMovies:
             response.json()["detail"][0]["error"]["message"]
             == "Error in field 'page_size': Input should be less than or equal to 100"
         )
+
+    def test_get_public_movies_next_cursor(self):
+        """
+        Test that a full page returns a cursor for the next page.
+        """
+        response = client.get("movie/public?page=1&page_size=2")
+        assert response.status_code == 200
+        assert "X-Next-Cursor" in response.headers
+
+    def test_get_public_movies_with_cursor(self):
+        """
+        Test to walk public movies with the keyset cursor.
+        """
+        first_page = client.get("movie/public?page_size=2")
+        cursor = first_page.headers["X-Next-Cursor"]
+
+        response = client.get(f"movie/public?page_size=2&cursor={cursor}")
+        assert response.status_code == 200
+
+        first_ids = [movie["id"] for movie in first_page.json()]
+        next_ids = [movie["id"] for movie in response.json()]
+        assert len(next_ids) == 2
+        assert min(next_ids) > max(first_ids)
+        for movie in response.json():
+            assert movie["is_public"] is True
+
+    def test_get_public_movies_cursor_matches_page(self):
+        """
+        Test that the cursor returns the same movies as the equivalent page.
+        """
+        first_page = client.get("movie/public?page=1&page_size=3")
+        cursor = first_page.headers["X-Next-Cursor"]
+
+        by_cursor = client.get(f"movie/public?page_size=3&cursor={cursor}")
+        by_page = client.get("movie/public?page=2&page_size=3")
+        assert by_cursor.json() == by_page.json()
+
+    def test_get_public_movies_invalid_cursor(self):
+        """
+        Test retrieving public movies with a malformed cursor.
+        """
+        response = client.get("movie/public?cursor=not-a-cursor")
+        assert response.status_code == 400
+        assert response.json()["detail"]["error"]["code"] == "INVALID_CURSOR"
+
+    @pytest.mark.parametrize("movie_id", ["abc", [1], {"a": 1}, True, None])
+    def test_get_public_movies_cursor_with_invalid_id(self, movie_id):
+        """
+        Test that a cursor whose id is not a movie id is rejected.
+        """
+        cursor = encode_cursor({"id": movie_id})
+
+        response = client.get("movie/public", params={"cursor": cursor})
+
+        assert response.status_code == 400
+        assert response.json()["detail"]["error"]["code"] == "INVALID_CURSOR"
+
+    def test_get_public_movies_served_from_cache(self):
+        """
+        Test that a repeated page is served from the cache without querying.
+        """
+        first = client.get("movie/public?page=1&page_size=100")
+        self.movie_service.repository.create_object({**self.movies[1], "title": "New"})
+
+        hits = public_movie_cache.stats()["hits"]
+        second = client.get("movie/public?page=1&page_size=100")
+        assert second.status_code == 200
+        assert second.content == first.content
+        assert public_movie_cache.stats()["hits"] == hits + 1
+
+    def test_get_public_movies_invalidated_by_public_movie(self):
+        """
+        Test that creating a public movie through the API invalidates the cache.
+        """
+        user_email = "public_cache@example.com"
+        SetupHelper.create_test_user(UserService(self.test_db), user_email, "pass")
+        headers = {
+            "Authorization": f"Bearer {create_access_token({'email': user_email})}"
+        }
+        movie_data = {
+            key: value for key, value in self.movies[0].items() if key != "user_id"
+        }
+        movie_data["genre"] = "Action"
+        client.get("movie/public?page=1&page_size=100")
+        generation = public_movie_cache.generation
+
+        private = client.post("/movie/create", json=movie_data, headers=headers)
+        assert private.status_code == 201
+        assert public_movie_cache.generation == generation
+
+        movie_data["is_public"] = True
+        created = client.post("/movie/create", json=movie_data, headers=headers)
+        assert public_movie_cache.generation == generation + 1
+
+        hits = public_movie_cache.stats()["hits"]
+        client.get("movie/public?page=1&page_size=100")
+        assert public_movie_cache.stats()["hits"] == hits
+        cursor = encode_cursor({"id": created.json()["id"] - 1})
+        response = client.get(f"movie/public?page_size=1&cursor={cursor}")
+        assert response.json()[0]["id"] == created.json()["id"]
+
+    def test_get_public_movies_not_modified(self):
+        """
+        Test that a matching If-None-Match returns 304 without querying movies.
+        """
+        first = client.get("movie/public?page=1&page_size=2")
+        etag = first.headers["ETag"]
+
+        with patch("app.routers.movie.MovieService", side_effect=AssertionError):
+            response = client.get(
+                "movie/public?page=1&page_size=2", headers={"If-None-Match": etag}
+            )
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        assert response.content == b""
+
+    def test_get_public_movies_etag_changes_after_write(self):
+        """
+        Test that writing a public movie through the API changes the ETag.
+        """
+        user_email = "public_etag@example.com"
+        SetupHelper.create_test_user(UserService(self.test_db), user_email, "pass")
+        headers = {
+            "Authorization": f"Bearer {create_access_token({'email': user_email})}"
+        }
+        etag = client.get("movie/public?page=1&page_size=2").headers["ETag"]
+        assert client.get("movie/public?page=2&page_size=2").headers["ETag"] != etag
+
+        movie_data = {
+            "title": "ETag movie",
+            "description": "Description",
+            "publication_year": 2020,
+            "genre": "Action",
+            "rating": 7.0,
+            "is_public": True,
+        }
+        client.post("/movie/create", json=movie_data, headers=headers)
+
+        response = client.get(
+            "movie/public?page=1&page_size=2", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+    def test_get_public_movies_with_fields(self):
+        """
+        Test that only the requested fields and the id are returned, and the
+        sparse page is cached apart from the full one.
+        """
+        full = client.get("movie/public?page_size=3&sort=-rating")
+        response = client.get("movie/public?page_size=3&sort=-rating&fields=title")
+
+        assert response.status_code == 200
+        assert response.json() == [
+            {"id": movie["id"], "title": movie["title"]} for movie in full.json()
+        ]
+        assert response.headers["ETag"] != full.headers["ETag"]
+        assert response.headers["X-Next-Cursor"] == full.headers["X-Next-Cursor"]
+
+    def test_get_public_movies_invalid_fields(self):
+        """
+        Test retrieving public movies with an unknown field.
+        """
+        response = client.get("movie/public?fields=title,plot")
+        assert response.status_code == 400
+        assert response.json()["detail"]["error"] == {
+            "code": "INVALID_FIELDS",
+            "message": "Unknown fields: plot.",
+        }
+
+    def test_get_public_movies_without_owner_join(self):
+        """
+        Test that a page is read with one movie query, without joining the
+        owners, and its total from the maintained count.
+        """
+        with capture_statements(test_async_engine.sync_engine) as statements:
+            response = client.get("movie/public?page_size=5&sort=-rating")
+
+        assert response.status_code == 200
+        movie_queries = [query for query in statements if "FROM movie " in query]
+        assert len(movie_queries) == 1
+        assert "JOIN" not in movie_queries[0]
+        assert len(statements) == 2
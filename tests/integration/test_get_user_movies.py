@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import pytest
 from fastapi.testclient import TestClient
 from main import app
@@ -89,6 +91,47 @@ class TestGetUserMovies:
         assert response.status_code == 200
         assert len(movies) == 5
 
+    def test_get_user_movies_with_cursor(self):
+        """
+        Test to walk the movies of the authenticated user with the keyset cursor.
+        """
+        headers = {"Authorization": f"Bearer {self.valid_token}"}
+        seen_ids = []
+        url = "/movie/user?page_size=4"
+        while True:
+            response = client.get(url, headers=headers)
+            assert response.status_code == 200
+            seen_ids.extend(movie["id"] for movie in response.json())
+            cursor = response.headers.get("X-Next-Cursor")
+            if cursor is None:
+                break
+            url = f"/movie/user?page_size=4&cursor={cursor}"
+
+        assert seen_ids == sorted(seen_ids)
+        assert len(seen_ids) == len(set(seen_ids))
+        assert len(seen_ids) >= len(self.user_movies)
+
+    def test_get_user_movies_with_fields(self):
+        """
+        Test to walk sparse pages of the authenticated user sorted by a field
+        that is not returned.
+        """
+        headers = {"Authorization": f"Bearer {self.valid_token}"}
+        seen = []
+        url = "/movie/user?page_size=4&sort=rating&fields=title,is_public"
+        while True:
+            response = client.get(url, headers=headers)
+            assert response.status_code == 200
+            seen.extend(response.json())
+            cursor = response.headers.get("X-Next-Cursor")
+            if cursor is None:
+                break
+            url = f"/movie/user?page_size=4&sort=rating&fields=title,is_public&cursor={cursor}"
+
+        assert {tuple(movie) for movie in seen} == {("id", "title", "is_public")}
+        assert len({movie["id"] for movie in seen}) == len(seen)
+        assert len(seen) >= len(self.user_movies)
+
     def test_get_user_movies_unauthenticated(self):
         """
         Test to retrieve movies without authentication.
@@ -96,3 +139,46 @@ class TestGetUserMovies:
         response = client.get("/movie/user")
         assert response.status_code == 401
         assert response.json()["detail"] == "Not authenticated"
+
+    def test_get_user_movies_not_modified(self):
+        """
+        Test that a matching If-None-Match returns 304 without querying movies.
+        """
+        headers = {"Authorization": f"Bearer {self.valid_token}"}
+        etag = client.get("/movie/user?page_size=2", headers=headers).headers["ETag"]
+
+        with patch("app.routers.movie.MovieService", side_effect=AssertionError):
+            response = client.get(
+                "/movie/user?page_size=2",
+                headers={**headers, "If-None-Match": etag},
+            )
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+
+    def test_get_user_movies_etag_scoped_to_user(self):
+        """
+        Test that only writes of the owner change the ETag of their movies.
+        """
+        headers = {"Authorization": f"Bearer {self.valid_token}"}
+        etag = client.get("/movie/user", headers=headers).headers["ETag"]
+        movie_data = {
+            "title": "ETag movie",
+            "description": "Description",
+            "publication_year": 2020,
+            "genre": "Sci-Fi",
+            "rating": 7.0,
+            "is_public": False,
+        }
+
+        other_email = "other_etag@example.com"
+        SetupHelper.create_test_user(self.user_service, other_email, "pass")
+        other_token = create_access_token({"email": other_email})
+        client.post(
+            "/movie/create",
+            json=movie_data,
+            headers={"Authorization": f"Bearer {other_token}"},
+        )
+        assert client.get("/movie/user", headers=headers).headers["ETag"] == etag
+
+        client.post("/movie/create", json=movie_data, headers=headers)
+        assert client.get("/movie/user", headers=headers).headers["ETag"] != etag
@@ -1,8 +1,11 @@
+from unittest.mock import patch
+
 import pytest
 from fastapi.testclient import TestClient
 
 from main import app
 from app.services.user_service import UserService
+from app.utils.password_hasher import PasswordHashingPoolFullError
 from tests.testing_helper import SetupHelper
 
 client = TestClient(app)
@@ -122,3 +125,20 @@ class TestLogin:
             response.json()["detail"][0]["error"]["message"]
             == "Error in field 'username': Field required"
         )
+
+    def test_login_password_hasher_busy(self):
+        """
+        Test that a full password hashing queue returns 503 with Retry-After.
+        """
+        with patch(
+            "app.utils.password_hasher.password_hashing_pool.run",
+            side_effect=PasswordHashingPoolFullError(retry_after=3),
+        ):
+            response = client.post(
+                "/user/login/",
+                data={"username": self.user_email, "password": self.password},
+            )
+
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "3"
+        assert response.json()["detail"]["error"]["code"] == "SERVICE_BUSY"
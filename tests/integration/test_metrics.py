@@ -0,0 +1,23 @@
+from fastapi.testclient import TestClient
+
+from main import app
+
+client = TestClient(app)
+
+
+class TestGetMetrics:
+    """
+    Tests for the get_metrics endpoint.
+    """
+
+    def test_get_metrics_user_cache(self):
+        """
+        Test that the user cache counters are reported.
+        """
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        user_cache_metrics = response.json()["user_cache"]
+        assert {"size", "maxsize", "hits", "misses", "hit_ratio"} <= set(
+            user_cache_metrics
+        )
@@ -0,0 +1,155 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+from app.services.movie_service import MovieService
+from app.services.user_service import UserService
+from app.utils.jwt_handler import create_access_token
+from tests.testing_helper import SetupHelper
+
+client = TestClient(app)
+
+
+class TestMovieCounts:
+    """
+    Tests for the totals and page links of the movie listings.
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self, test_db):
+        """
+        Initial configuration for every test. The user's movies are deleted
+        afterwards, since other tests count the public movies.
+        """
+        self.user_service = UserService(test_db)
+        self.test_user = SetupHelper.create_test_user(
+            self.user_service, email="listing-counts@example.com"
+        )
+        self.headers = {
+            "Authorization": f"Bearer {create_access_token({'email': self.test_user.email})}"
+        }
+        self.movie_service = MovieService(test_db)
+        yield
+        for movie in self.movie_service.repository.get_objects_by_filters(
+            {"user_id": self.test_user.id}
+        ):
+            self.movie_service.repository.delete_object(movie.id)
+
+    def create_movie(self, is_public: bool) -> dict:
+        response = client.post(
+            "/movie/create",
+            headers=self.headers,
+            json={
+                "title": "Counted",
+                "description": "Description",
+                "publication_year": 2002,
+                "genre": "Drama",
+                "rating": 7.0,
+                "is_public": is_public,
+            },
+        )
+        assert response.status_code == 201
+        return response.json()
+
+    def user_total(self, **params) -> int:
+        response = client.get("/movie/user", headers=self.headers, params=params)
+        return int(response.headers["X-Total-Count"])
+
+    def public_total(self) -> int:
+        return int(client.get("/movie/public").headers["X-Total-Count"])
+
+    def test_totals_follow_writes(self):
+        """
+        Test that the totals change with every create, update and delete.
+        """
+        public_total = self.public_total()
+        public_movie = self.create_movie(True)
+        private_movie = self.create_movie(False)
+        self.create_movie(False)
+
+        assert self.public_total() == public_total + 1
+        assert self.user_total() == 3
+        assert self.user_total(is_public=True) == 1
+        assert self.user_total(is_public=False) == 2
+
+        response = client.put(
+            f"/movie/{private_movie['id']}",
+            headers=self.headers,
+            json={"is_public": True},
+        )
+        assert response.status_code == 200
+        assert self.public_total() == public_total + 2
+        assert self.user_total(is_public=False) == 1
+
+        response = client.delete(
+            f"/movie/{public_movie['id']}/delete", headers=self.headers
+        )
+        assert response.status_code == 204
+        assert self.public_total() == public_total + 1
+        assert self.user_total() == 2
+
+    def test_bulk_writes_update_totals(self):
+        """
+        Test that the bulk endpoints keep the totals exact.
+        """
+        response = client.post(
+            "/movie/bulk",
+            headers=self.headers,
+            json={
+                "movies": [
+                    {
+                        "title": f"Bulk {i}",
+                        "description": "Description",
+                        "publication_year": 2002,
+                        "genre": "Drama",
+                        "rating": 7.0,
+                        "is_public": False,
+                    }
+                    for i in range(3)
+                ]
+            },
+        )
+        ids = [movie["id"] for movie in response.json()["movies"]]
+        assert self.user_total(is_public=False) == 3
+
+        client.put(
+            "/movie/bulk",
+            headers=self.headers,
+            json={"movies": [{"id": ids[0], "is_public": True}]},
+        )
+        assert self.user_total(is_public=True) == 1
+
+        client.post("/movie/bulk/delete", headers=self.headers, json={"ids": ids[1:]})
+        assert self.user_total() == 1
+        assert self.user_total(is_public=False) == 0
+
+    def test_link_header(self):
+        """
+        Test that numbered pages link to their neighbours and the last page.
+        """
+        for _ in range(5):
+            self.create_movie(False)
+
+        response = client.get(
+            "/movie/user", headers=self.headers, params={"page": 2, "page_size": 2}
+        )
+
+        assert response.headers["X-Total-Count"] == "5"
+        links = response.headers["Link"]
+        assert 'page=1&page_size=2>; rel="prev"' in links
+        assert 'page=3&page_size=2>; rel="last"' in links
+        assert f"cursor={response.headers['X-Next-Cursor']}>; rel=\"next\"" in links
+
+    def test_filtered_listing_has_no_total(self):
+        """
+        Test that listings narrowed by filters leave the total out.
+        """
+        self.create_movie(True)
+
+        response = client.get(
+            "/movie/user", headers=self.headers, params={"min_year": 2000}
+        )
+
+        assert response.status_code == 200
+        assert "X-Total-Count" not in response.headers
+        assert 'rel="first"' in response.headers["Link"]
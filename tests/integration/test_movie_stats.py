@@ -0,0 +1,92 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+from app.services.movie_service import MovieService
+from app.services.user_service import UserService
+from app.utils.jwt_handler import create_access_token
+from tests.testing_helper import SetupHelper
+
+client = TestClient(app)
+
+
+class TestMovieStats:
+    """
+    Tests for the public movie statistics endpoint.
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self, test_db):
+        """
+        Initial configuration for every test. The user's movies are deleted
+        afterwards, since other tests count the public movies.
+        """
+        self.user_service = UserService(test_db)
+        self.test_user = SetupHelper.create_test_user(
+            self.user_service, email="movie-stats@example.com"
+        )
+        self.headers = {
+            "Authorization": f"Bearer {create_access_token({'email': self.test_user.email})}"
+        }
+        self.movie_service = MovieService(test_db)
+        yield
+        for movie in self.movie_service.repository.get_objects_by_filters(
+            {"user_id": self.test_user.id}
+        ):
+            self.movie_service.repository.delete_object(movie.id)
+
+    def create_movie(self, is_public: bool, rating: float) -> dict:
+        response = client.post(
+            "/movie/create",
+            headers=self.headers,
+            json={
+                "title": "Counted",
+                "description": "Description",
+                "publication_year": 1968,
+                "genre": "Sci-Fi",
+                "rating": rating,
+                "is_public": is_public,
+            },
+        )
+        assert response.status_code == 201
+        return response.json()
+
+    def test_stats_follow_writes(self):
+        """
+        Test that the statistics change with every create, update and delete
+        of a public movie, and ignore private movies.
+        """
+        before = client.get("/movie/stats").json()
+        public_movie = self.create_movie(True, 8.5)
+        private_movie = self.create_movie(False, 3.0)
+
+        stats = client.get("/movie/stats").json()
+        assert stats["movies"] == before["movies"] + 1
+        assert stats["genres"]["Sci-Fi"] == before["genres"]["Sci-Fi"] + 1
+        assert stats["decades"]["1960"] == before["decades"].get("1960", 0) + 1
+        assert stats["rating"]["rated"] == before["rating"]["rated"] + 1
+
+        client.put(
+            f"/movie/{private_movie['id']}",
+            headers=self.headers,
+            json={"is_public": True},
+        )
+        client.delete(f"/movie/{public_movie['id']}/delete", headers=self.headers)
+
+        stats = client.get("/movie/stats").json()
+        assert stats["movies"] == before["movies"] + 1
+        assert stats["rating"]["histogram"]["3"] == (
+            before["rating"]["histogram"].get("3", 0) + 1
+        )
+        assert stats["rating"]["histogram"].get("8", 0) == (
+            before["rating"]["histogram"].get("8", 0)
+        )
+
+    def test_stats_list_every_genre(self):
+        """
+        Test that every genre is listed, even without public movies.
+        """
+        response = client.get("/movie/stats")
+
+        assert response.status_code == 200
+        assert set(response.json()["genres"]) >= {"Action", "Drama", "Sci-Fi"}
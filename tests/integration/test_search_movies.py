@@ -0,0 +1,186 @@
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+from app.services.movie_service import MovieService
+from app.services.user_service import UserService
+from app.utils.cursor import encode_cursor
+from app.utils.jwt_handler import create_access_token
+from tests.testing_helper import SetupHelper
+
+client = TestClient(app)
+
+
+class TestSearchMovies:
+    """
+    Tests for the search_movies endpoint.
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self, test_db):
+        """
+        Initial configuration for every test. Every test searches for its own
+        word, since the test database keeps the movies of previous tests.
+        """
+        self.word = f"word{uuid.uuid4().hex[:12]}"
+        self.user_service = UserService(test_db)
+        self.test_user = SetupHelper.create_test_user(self.user_service)
+        self.other_user = SetupHelper.create_test_user(
+            self.user_service, email="other_search@example.com"
+        )
+        self.token = create_access_token({"email": self.test_user.email})
+        self.movie_service = MovieService(test_db)
+
+    def create_movie(self, title: str, description: str, **fields) -> int:
+        movie = {
+            "title": title,
+            "description": description,
+            "publication_year": 2000,
+            "genre": "DRAMA",
+            "rating": 7.0,
+            "is_public": True,
+            "user_id": None,
+            **fields,
+        }
+        return self.movie_service.repository.create_object(movie).id
+
+    def search(self, q: str, **params):
+        headers = params.pop("headers", {})
+        return client.get("/movie/search", params={"q": q, **params}, headers=headers)
+
+    def test_search_ranks_matches(self):
+        """
+        Test that movies mentioning the word more often come first.
+        """
+        once = self.create_movie("Some title", f"A {self.word} story")
+        twice = self.create_movie(f"{self.word}", f"The {self.word} returns")
+        self.create_movie("Unrelated", "Nothing to see")
+
+        response = self.search(self.word)
+
+        assert response.status_code == 200
+        assert [movie["id"] for movie in response.json()] == [twice, once]
+
+    def test_search_requires_every_word(self):
+        """
+        Test that only movies containing every word of the query are returned.
+        """
+        both = self.create_movie(f"{self.word} night", "A dark story")
+        self.create_movie(f"{self.word} day", "A bright story")
+
+        response = self.search(f"{self.word} night")
+
+        assert [movie["id"] for movie in response.json()] == [both]
+
+    def test_search_ignores_query_syntax(self):
+        """
+        Test that FTS operators in the query are treated as plain words.
+        """
+        movie_id = self.create_movie(f"{self.word} or near", "A story")
+
+        response = self.search(f'{self.word} OR "NEAR(')
+
+        assert response.status_code == 200
+        assert [movie["id"] for movie in response.json()] == [movie_id]
+
+    def test_search_visibility(self):
+        """
+        Test that private movies are only found by their owner.
+        """
+        public_id = self.create_movie(self.word, "Public")
+        own_id = self.create_movie(
+            self.word, "Own", is_public=False, user_id=self.test_user.id
+        )
+        self.create_movie(
+            self.word, "Other", is_public=False, user_id=self.other_user.id
+        )
+
+        anonymous = self.search(self.word)
+        authenticated = self.search(
+            self.word, headers={"Authorization": f"Bearer {self.token}"}
+        )
+
+        assert [movie["id"] for movie in anonymous.json()] == [public_id]
+        assert sorted(movie["id"] for movie in authenticated.json()) == [
+            public_id,
+            own_id,
+        ]
+
+    def test_search_invalid_token(self):
+        """
+        Test that an invalid token is rejected instead of being ignored.
+        """
+        response = self.search(self.word, headers={"Authorization": "Bearer invalid"})
+
+        assert response.status_code == 401
+
+    def test_search_keyset_pagination(self):
+        """
+        Test that following X-Next-Cursor returns every match exactly once.
+        """
+        movie_ids = {self.create_movie(self.word, f"Movie {i}") for i in range(5)}
+
+        seen = []
+        cursor = None
+        while True:
+            params = {"page_size": 2}
+            if cursor:
+                params["cursor"] = cursor
+            response = self.search(self.word, **params)
+            seen.extend(movie["id"] for movie in response.json())
+            cursor = response.headers.get("X-Next-Cursor")
+            if cursor is None:
+                break
+
+        assert sorted(seen) == sorted(movie_ids)
+
+    def test_search_follows_updates_and_deletes(self):
+        """
+        Test that the search index follows updated and deleted movies.
+        """
+        movie_id = self.create_movie(self.word, "Before")
+        deleted_id = self.create_movie(self.word, "Deleted")
+        self.movie_service.repository.update_object(movie_id, {"title": "Renamed"})
+        self.movie_service.repository.delete_object(deleted_id)
+
+        response = self.search(self.word)
+
+        assert response.json() == []
+
+    def test_search_invalid_cursor(self):
+        """
+        Test that a cursor without a score is rejected.
+        """
+        response = self.search(self.word, cursor=encode_cursor({"id": 1}))
+
+        assert response.status_code == 400
+        assert response.json()["detail"]["error"]["code"] == "INVALID_CURSOR"
+
+    @pytest.mark.parametrize(
+        "position",
+        [
+            {"id": [1], "score": 1.0},
+            {"id": {"a": 1}, "score": 1.0},
+            {"id": "abc", "score": 1.0},
+            {"id": 1, "score": True},
+        ],
+    )
+    def test_search_cursor_with_invalid_position(self, position):
+        """
+        Test that a cursor whose id or score has the wrong type is rejected.
+        """
+        response = self.search(self.word, cursor=encode_cursor(position))
+
+        assert response.status_code == 400
+        assert response.json()["detail"]["error"]["code"] == "INVALID_CURSOR"
+
+    def test_search_without_words(self):
+        """
+        Test that a query without words returns no movies.
+        """
+        response = self.search("!!!")
+
+        assert response.status_code == 200
+        assert response.json() == []
@@ -1,5 +1,6 @@
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
 from fastapi.testclient import TestClient
 
@@ -13,55 +14,89 @@ client = TestClient(app)
 
 class TestGetTimeEndpoint:
     """
-    Tests for the `get_time` endpoint.
+    Tests for the `get_time` endpoint with the World Time API engine.
     """
 
     @pytest.fixture(autouse=True)
     def septup(self):
         self.test_url = "/time/America/Bogota"
+        with patch("app.services.time_service.TIME_ENGINE", "worldtimeapi"), patch(
+            "app.services.time_service.get_with_retry_async", new_callable=AsyncMock
+        ) as mock_get_with_retry:
+            self.mock_get_with_retry = mock_get_with_retry
+            yield
 
-    @patch("app.routers.time_data.get_with_retry")
-    def test_get_time_success(self, mock_get_with_retry):
+    def test_get_time_success(self):
         """
         Test that the endpoint returns correct data.
         """
-        mock_response = {
+        self.mock_get_with_retry.return_value = {
             "datetime": "2025-01-01T12:00:00-05:00",
             "utc_datetime": "2025-01-01T17:00:00+00:00",
             "utc_offset": "-05:00",
         }
-        mock_get_with_retry.return_value = mock_response
         response = client.get(self.test_url)
 
         assert response.status_code == 200
-        assert response.json() == mock_response
+        time_data = response.json()
+        assert time_data["utc_offset"] == "-05:00"
+        assert time_data["datetime"].endswith("-05:00")
+        assert time_data["utc_datetime"].endswith("+00:00")
 
-    @patch("app.routers.time_data.get_with_retry")
-    def test_get_time_with_region_success(self, mock_get_with_retry):
+    def test_get_time_with_region_success(self):
         """
         Test that the endpoint returns correct data with a region.
         """
         test_url = "/time/America/Argentina?region=Salta"
-        mock_response = {
+        self.mock_get_with_retry.return_value = {
             "datetime": "2025-01-01T12:00:00-03:00",
             "utc_datetime": "2025-01-01T15:00:00+00:00",
             "utc_offset": "-03:00",
         }
-        mock_get_with_retry.return_value = mock_response
         response = client.get(test_url)
 
         assert response.status_code == 200
-        assert response.json() == mock_response
-        mock_get_with_retry.assert_called_once_with(
-            "http://worldtimeapi.org/api/timezone/America/Argentina/Salta"
+        assert response.json()["utc_offset"] == "-03:00"
+        self.mock_get_with_retry.assert_called_once()
+        assert (
+            self.mock_get_with_retry.call_args.args[1]
+            == "http://worldtimeapi.org/api/timezone/America/Argentina/Salta"
         )
 
-    @patch("app.routers.time_data.get_with_retry")
-    def test_get_time_failure(self, mock_get_with_retry):
+    def test_get_time_cached(self):
+        """
+        Test that repeated lookups of a zone skip the network.
+        """
+        self.mock_get_with_retry.return_value = {"utc_offset": "-05:00"}
+
+        client.get(self.test_url)
+        response = client.get(self.test_url)
+
+        assert response.status_code == 200
+        assert response.json()["utc_offset"] == "-05:00"
+        self.mock_get_with_retry.assert_called_once()
+
+    def test_get_time_unknown_zone(self):
+        """
+        Test that unknown zones return 404 and are cached as unknown.
+        """
+        request = httpx.Request("GET", "http://worldtimeapi.org")
+        self.mock_get_with_retry.side_effect = httpx.HTTPStatusError(
+            "Not Found", request=request, response=httpx.Response(404, request=request)
+        )
+
+        client.get("/time/America/Atlantis")
+        response = client.get("/time/America/Atlantis")
+
+        assert response.status_code == 404
+        assert response.json()["detail"]["error"]["code"] == "NOT_FOUND"
+        self.mock_get_with_retry.assert_called_once()
+
+    def test_get_time_failure(self):
         """
         Test that the endpoint returns an error.
         """
-        mock_get_with_retry.side_effect = Exception("Connection error")
+        self.mock_get_with_retry.side_effect = Exception("Connection error")
 
         response = client.get(self.test_url)
         assert response.status_code == 502
@@ -73,3 +108,61 @@ class TestGetTimeEndpoint:
                 }
             }
         }
+
+
+class TestGetTimeLocalEngine:
+    """
+    Tests for the `get_time` and `get_zones` endpoints with the local engine.
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        with patch(
+            "app.services.time_service.get_with_retry_async", new_callable=AsyncMock
+        ) as mock_get_with_retry:
+            self.mock_get_with_retry = mock_get_with_retry
+            yield
+
+    def test_get_time_local(self):
+        """
+        Test that the time is computed without calling the API.
+        """
+        response = client.get("/time/America/Bogota")
+
+        assert response.status_code == 200
+        assert response.json()["utc_offset"] == "-05:00"
+        assert response.json()["datetime"].endswith("-05:00")
+        self.mock_get_with_retry.assert_not_called()
+
+    def test_get_time_local_unknown_zone(self):
+        """
+        Test that zones missing from the tz database return 404.
+        """
+        response = client.get("/time/America/Atlantis")
+
+        assert response.status_code == 404
+        self.mock_get_with_retry.assert_not_called()
+
+    def test_get_time_local_api_fallback(self):
+        """
+        Test that the API is asked for unknown zones when the fallback is enabled.
+        """
+        self.mock_get_with_retry.return_value = {"utc_offset": "+01:00"}
+
+        with patch("app.services.time_service.TIME_API_FALLBACK", True):
+            response = client.get("/time/America/Atlantis")
+
+        assert response.status_code == 200
+        assert response.json()["utc_offset"] == "+01:00"
+
+    def test_get_zones(self):
+        """
+        Test listing the time zones, optionally filtered by area.
+        """
+        zones = client.get("/time/zones").json()
+        america = client.get("/time/zones?area=America").json()
+
+        assert "America/Bogota" in zones
+        assert zones == sorted(zones)
+        assert "America/Bogota" in america
+        assert all(zone.startswith("America/") for zone in america)
@@ -0,0 +1,72 @@
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+from app.utils.traffic_capture import REDACTED, traffic_capture
+
+client = TestClient(app)
+
+
+class TestTrafficCaptureMiddleware:
+    """
+    Tests for the traffic capture middleware.
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path, monkeypatch):
+        """
+        Enables the capture into a temporary file.
+        """
+        self.path = tmp_path / "capture.jsonl"
+        monkeypatch.setattr(traffic_capture, "path", str(self.path))
+        monkeypatch.setattr(traffic_capture, "sample_rate", 1.0)
+        yield
+        traffic_capture.close()
+
+    def read_records(self) -> list:
+        traffic_capture.close()
+        return [json.loads(line) for line in self.path.read_text().splitlines()]
+
+    def test_request_is_captured(self):
+        """
+        Test that a request is recorded with its route template and status.
+        """
+        client.get("/movie/public", params={"page_size": 2})
+
+        record = self.read_records()[0]
+        assert record["method"] == "GET"
+        assert record["path"] == "/movie/public"
+        assert record["route"] == "/movie/public"
+        assert record["query"] == "page_size=2"
+        assert record["status"] == 200
+        assert record["duration_ms"] > 0
+
+    def test_credentials_are_redacted(self):
+        """
+        Test that tokens and passwords never reach the capture file.
+        """
+        client.post(
+            "/user/login",
+            data={"username": "nobody@example.com", "password": "Secret123!"},
+            headers={"Authorization": "Bearer secret-token"},
+        )
+
+        record = self.read_records()[0]
+        content = self.path.read_text()
+        assert "Secret123!" not in content
+        assert "secret-token" not in content
+        assert record["headers"]["authorization"] == f"Bearer {REDACTED}"
+        assert record["status"] == 401
+
+    def test_not_sampled(self, monkeypatch):
+        """
+        Test that requests outside the sample are not recorded.
+        """
+        monkeypatch.setattr(traffic_capture, "sample_rate", 0.0)
+
+        client.get("/movie/public")
+
+        traffic_capture.close()
+        assert not self.path.exists()
@@ -2,10 +2,12 @@ import pytest
 from fastapi.testclient import TestClient
 
 from main import app
+from app.database_settings import test_async_engine
 from app.services.movie_service import MovieService
 from app.services.user_service import UserService
 from app.utils.jwt_handler import create_access_token
-from tests.testing_helper import SetupHelper
+from app.utils.public_movie_cache import public_movie_cache
+from tests.testing_helper import SetupHelper, capture_statements
 
 client = TestClient(app)
 
@@ -58,6 +60,52 @@ class TestUpdatePrivateMovie:
         assert updated_movie["description"] == "Updated Description"
         assert updated_movie["title"] == "Test Movie"
 
+    def test_update_private_movie_single_statement(self):
+        """
+        Test that a successful update reads and writes the movie with a single
+        UPDATE ... RETURNING.
+        """
+        headers = {"Authorization": f"Bearer {self.valid_token}"}
+        client.put(f"/movie/{self.movie.id}", json={"rating": 8}, headers=headers)
+
+        with capture_statements(test_async_engine.sync_engine) as statements:
+            response = client.put(
+                f"/movie/{self.movie.id}", json={"rating": 9}, headers=headers
+            )
+
+        assert response.status_code == 200
+        assert response.json()["rating"] == 9
+        movie_queries = [query for query in statements if "movie" in query]
+        assert len(movie_queries) == 1
+        assert movie_queries[0].startswith("UPDATE movie SET")
+        assert "RETURNING" in movie_queries[0]
+
+    def test_update_public_movie_of_other_user(self):
+        """
+        Test that a public movie can be updated by a user who does not own it.
+        """
+        owner_token = create_access_token({"email": self.user_email})
+        client.put(
+            f"/movie/{self.movie.id}",
+            json={"is_public": True},
+            headers={"Authorization": f"Bearer {owner_token}"},
+        )
+        SetupHelper.create_test_user(
+            self.user_service, "public_editor@example.com", "password456"
+        )
+        other_user_token = create_access_token({"email": "public_editor@example.com"})
+
+        response = client.put(
+            f"/movie/{self.movie.id}",
+            json={"description": "Edited"},
+            headers={"Authorization": f"Bearer {other_user_token}"},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["description"] == "Edited"
+        assert response.json()["user_id"] == self.test_user.id
+        self.movie_service.repository.delete_object(self.movie.id)
+
     def test_update_private_movie_not_found(self):
         """
         Test to try to update a movie that does not exist.
@@ -124,3 +172,36 @@ class TestUpdatePrivateMovie:
         assert response.status_code == 400
         assert error_detail["error"]["code"] == "MISSING"
         assert error_detail["error"]["message"] == "There is not data to update."
+
+    def test_update_private_movie_rejects_unknown_fields(self):
+        """
+        Test that unknown fields, the id and the owner are rejected before
+        any movie is written.
+        """
+        headers = {"Authorization": f"Bearer {self.valid_token}"}
+
+        for update_data in ({"foo": 1}, {"id": 999}, {"user_id": 999}):
+            with capture_statements(test_async_engine.sync_engine) as statements:
+                response = client.put(
+                    f"/movie/{self.movie.id}", json=update_data, headers=headers
+                )
+
+            assert response.status_code == 422
+            field = next(iter(update_data))
+            error = response.json()["detail"][0]["error"]
+            assert error["code"] == "EXTRA_FORBIDDEN"
+            assert error["message"].startswith(f"Error in field '{field}'")
+            assert not [query for query in statements if "movie" in query]
+
+    def test_update_private_movie_public_cache(self):
+        """
+        Test that only updates touching a public movie invalidate the public cache.
+        """
+        headers = {"Authorization": f"Bearer {self.valid_token}"}
+        generation = public_movie_cache.generation
+
+        client.put(f"/movie/{self.movie.id}", json={"rating": 9}, headers=headers)
+        assert public_movie_cache.generation == generation
+
+        client.put(f"/movie/{self.movie.id}", json={"is_public": True}, headers=headers)
+        assert public_movie_cache.generation == generation + 1
@@ -1,5 +1,34 @@
+from contextlib import contextmanager
+from typing import Iterator, List
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
 from app.utils.password_hasher import BcryptPasswordHasher
 
+# Methods that return a cursor synchronously in the PyMongo async API.
+ASYNC_MONGO_CURSOR_METHODS = {"find", "sort", "skip", "limit", "batch_size"}
+# Methods awaited for a cursor in the PyMongo async API.
+ASYNC_MONGO_AWAITED_CURSOR_METHODS = {"aggregate"}
+
+
+@contextmanager
+def capture_statements(engine: Engine) -> Iterator[List[str]]:
+    """
+    Collects the SQL statements sent through the engine inside the block,
+    so tests can assert how many queries a code path runs.
+    """
+    statements = []
+
+    def before_cursor_execute(connection, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
 
 class SetupHelper:
     """
@@ -29,3 +58,42 @@ class SetupHelper:
                 }
             )
         return user_data
+
+
+class AsyncMongoMock:
+    """
+    Exposes a mongomock client, database, collection or cursor through the
+    PyMongo async API, so the asyncio repositories can be tested without a server.
+    """
+
+    def __init__(self, target):
+        self._target = target
+
+    def __getitem__(self, name):
+        return AsyncMongoMock(self._target[name])
+
+    def __getattr__(self, name):
+        attribute = getattr(self._target, name)
+        if not callable(attribute):
+            return attribute
+
+        if name in ASYNC_MONGO_CURSOR_METHODS:
+            return lambda *args, **kwargs: AsyncMongoMock(attribute(*args, **kwargs))
+
+        async def async_method(*args, **kwargs):
+            if name in ASYNC_MONGO_AWAITED_CURSOR_METHODS:
+                return AsyncMongoMock(attribute(*args, **kwargs))
+            return attribute(*args, **kwargs)
+
+        return async_method
+
+    async def to_list(self, length=None):
+        documents = list(self._target)
+        return documents if length is None else documents[:length]
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for document in self._target:
+            yield document
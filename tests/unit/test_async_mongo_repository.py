@@ -0,0 +1,199 @@
+from datetime import datetime, timezone
+
+import pytest
+from mongomock import MongoClient
+
+from app.repositories.async_mongo_repository import AsyncMongoDBRepository
+from app.utils.cursor import InvalidCursorError
+from tests.testing_helper import AsyncMongoMock
+
+pytestmark = pytest.mark.anyio
+
+
+class TestAsyncMongoDBRepository:
+
+    @pytest.fixture(autouse=True)
+    async def setup(self, anyio_backend):
+        """
+        Initial configuration of the asyncio MongoDB repository
+        """
+        client = AsyncMongoMock(MongoClient())
+        self.repository = AsyncMongoDBRepository("test_db", "test_collection", client)
+        self.sample_data = {
+            "name": "Test Object",
+            "value": 42,
+            "created_at": datetime.now(timezone.utc),
+            "updated_at": datetime.now(timezone.utc),
+        }
+        self.document = await self.repository.create_object(self.sample_data)
+        yield
+        await self.repository.collection.delete_many({})
+
+    async def test_create_object(self):
+        """
+        Test to verify object creation.
+        """
+        result = await self.repository.create_object({"name": "Other", "value": 40})
+
+        assert "id" in result
+        assert "created_at" in result
+        assert result["value"] == 40
+
+    async def test_get_object(self):
+        """
+        Test to verify object retrieval.
+        """
+        retrieved_object = await self.repository.get_object(self.document["id"])
+
+        assert retrieved_object["name"] == self.sample_data["name"]
+        assert await self.repository.get_object("67844c2a7c100713fc7f89ef") is None
+
+    async def test_get_all_objects(self):
+        """
+        Test to verify all objects retrieved.
+        """
+        await self.repository.create_object({"name": "Another Object", "value": 45})
+
+        assert len(await self.repository.get_all_objects()) == 2
+
+    async def test_get_objects_by_filters(self):
+        """
+        Test to verify objects retrieved by filters, limit, keyset position
+        and projection.
+        """
+        second = await self.repository.create_object({"name": "Second", "value": 98})
+        await self.repository.create_object({"name": "Third", "value": 98})
+
+        limited = await self.repository.get_objects_by_filters({"value": 98}, limit=1)
+        after_second = await self.repository.get_objects_by_filters(
+            {"value": 98}, after=second["id"]
+        )
+
+        assert [doc["name"] for doc in limited] == ["Second"]
+        assert [doc["name"] for doc in after_second] == ["Third"]
+        projected = await self.repository.get_objects_by_filters(
+            {"value": 98}, fields=["value"]
+        )
+        assert [sorted(doc) for doc in projected] == [["_id", "value"]] * 2
+        with pytest.raises(InvalidCursorError):
+            await self.repository.get_objects_by_filters({}, after="invalid")
+
+    async def test_update_object(self):
+        """
+        Test to verify object updates correctly.
+        """
+        updated_object = await self.repository.update_object(
+            self.document["id"], {"name": "Updated Object"}
+        )
+
+        assert updated_object["name"] == "Updated Object"
+
+    async def test_delete_object(self):
+        """
+        Test to verify object deletion correctly.
+        """
+        deleted_object = await self.repository.delete_object(self.document["id"])
+
+        assert deleted_object["name"] == self.sample_data["name"]
+        assert await self.repository.get_all_objects() == []
+
+    async def test_create_objects(self):
+        """
+        Test to create several objects in one batch.
+        """
+        result = await self.repository.create_objects(
+            [{"name": "Bulk 1", "value": 1}, {"name": "Bulk 2", "value": 2}]
+        )
+
+        assert [document["name"] for document in result.objects] == [
+            "Bulk 1",
+            "Bulk 2",
+        ]
+        assert result.errors == []
+
+    async def test_update_objects(self):
+        """
+        Test to update several objects, reporting the ones not found.
+        """
+        result = await self.repository.update_objects(
+            [
+                {"id": self.document["id"], "value": 84},
+                {"id": "67844c2a7c100711fc7f89ef", "value": 1},
+            ]
+        )
+
+        assert [document["value"] for document in result.objects] == [84]
+        assert [error.index for error in result.errors] == [1]
+        assert [document["value"] for document in result.previous] == [42]
+
+    async def test_update_matching_object(self):
+        """
+        Test that only a document matching one of the filters is updated.
+        """
+        not_matched = await self.repository.update_matching_object(
+            self.document["id"], {"value": 1}, any_filters=[{"name": "Other"}]
+        )
+        matched = await self.repository.update_matching_object(
+            self.document["id"],
+            {"value": 84},
+            any_filters=[{"name": "Other"}, {"value": 42}],
+        )
+
+        assert not_matched.objects == []
+        assert [document["value"] for document in matched.objects] == [84]
+        assert [document["value"] for document in matched.previous] == [42]
+
+    async def test_delete_matching_object(self):
+        """
+        Test that only a document matching one of the filters is deleted.
+        """
+        not_matched = await self.repository.delete_matching_object(
+            self.document["id"], any_filters=[{"name": "Other"}]
+        )
+        deleted = await self.repository.delete_matching_object(
+            self.document["id"], any_filters=[{"name": "Test Object"}]
+        )
+
+        assert not_matched is None
+        assert deleted["value"] == 42
+        assert await self.repository.get_object(self.document["id"]) is None
+
+    async def test_delete_objects(self):
+        """
+        Test to delete several objects, reporting the ones not found.
+        """
+        result = await self.repository.delete_objects(
+            [self.document["id"], "67844c2a7c100711fc7f89ef"]
+        )
+
+        assert len(result.objects) == 1
+        assert [error.index for error in result.errors] == [1]
+        assert await self.repository.get_all_objects() == []
+
+    async def test_delete_objects_returns_each_document_once(self):
+        """
+        Test that a repeated id deletes and returns its document once.
+        """
+        result = await self.repository.delete_objects(
+            [self.document["id"], self.document["id"]]
+        )
+
+        assert len(result.objects) == 1
+        assert result.errors == []
+        assert await self.repository.get_all_objects() == []
+
+    async def test_get_object_batches(self):
+        """
+        Test that every matching document is yielded in batches.
+        """
+        for value in range(3):
+            await self.repository.create_object({"name": "Batch", "value": value})
+
+        batches = [
+            batch
+            async for batch in self.repository.get_object_batches(
+                {"name": "Batch"}, batch_size=2
+            )
+        ]
+
+        assert [len(batch) for batch in batches] == [2, 1]
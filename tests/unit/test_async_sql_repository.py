@@ -0,0 +1,238 @@
+import pytest
+
+from app.database_settings import TestingAsyncSessionLocal
+from app.models.user import User
+from app.repositories.async_sql_repository import AsyncSQLRepository
+
+pytestmark = pytest.mark.anyio
+
+
+class TestAsyncSQLRepository:
+    """
+    Unit tests for AsyncSQLRepository.
+    """
+
+    @pytest.fixture(autouse=True)
+    async def setup(self, anyio_backend):
+        """
+        Initial configuration for every test.
+        """
+        async with TestingAsyncSessionLocal() as session:
+            self.db = session
+            self.repository = AsyncSQLRepository[User](db=self.db, model=User)
+            self.user_email = "async_user@example.com"
+            users = await self.repository.get_objects_by_filters(
+                {"email": self.user_email}, limit=1
+            )
+            if users:
+                self.created_object = users[0]
+            else:
+                self.created_object = await self.repository.create_object(
+                    {
+                        "first_name": "Async",
+                        "last_name": "User",
+                        "email": self.user_email,
+                        "password": "securepassword",
+                    }
+                )
+            yield
+
+    async def test_create_object(self):
+        """
+        Test to create an object.
+        """
+        created_object = await self.repository.create_object(
+            {
+                "first_name": "Jane",
+                "last_name": "Doe",
+                "email": "async_jane@example.com",
+                "password": "securepassword",
+            }
+        )
+        assert created_object.id is not None
+        assert created_object.first_name == "Jane"
+
+    async def test_get_object(self):
+        """
+        Test to get an object by id.
+        """
+        fetched_object = await self.repository.get_object(self.created_object.id)
+
+        assert fetched_object is not None
+        assert fetched_object.email == self.user_email
+
+    async def test_get_object_failed(self):
+        """
+        Test to get an object by id failed.
+        """
+        assert await self.repository.get_object(0) is None
+
+    async def test_get_all_objects(self):
+        """
+        Test to get all objects.
+        """
+        users = await self.repository.get_all_objects()
+
+        assert self.user_email in {user.email for user in users}
+
+    async def test_get_objects_by_filters_with_keyset_pagination(self):
+        """
+        Test to retrieve objects with filters, limit and keyset pagination.
+        """
+        for i in range(1, 4):
+            await self.repository.create_object(
+                {
+                    "first_name": f"AsyncKeyset{i}",
+                    "last_name": "Test",
+                    "email": f"async_keyset_{i}@example.com",
+                    "password": "password123",
+                }
+            )
+
+        first_page = await self.repository.get_objects_by_filters({}, limit=2)
+        next_page = await self.repository.get_objects_by_filters(
+            {}, limit=2, after=first_page[-1].id
+        )
+        filtered = await self.repository.get_objects_by_filters(
+            {"email": self.user_email}
+        )
+
+        assert len(next_page) == 2
+        assert all(obj.id > first_page[-1].id for obj in next_page)
+        assert [obj.email for obj in filtered] == [self.user_email]
+
+    async def test_update_object(self):
+        """
+        Test to update an object.
+        """
+        updated_user = await self.repository.update_object(
+            self.created_object.id, {"first_name": "Maria"}
+        )
+
+        assert updated_user is not None
+        assert updated_user.first_name == "Maria"
+
+    async def test_update_object_failed(self):
+        """
+        Test to update an object does not exist.
+        """
+        assert await self.repository.update_object(0, {"first_name": "Maria"}) is None
+
+    async def test_delete_object(self):
+        """
+        Test to delete an object.
+        """
+        user_id = self.created_object.id
+        deleted_user = await self.repository.delete_object(user_id)
+
+        assert deleted_user is not None
+        assert deleted_user.id == user_id
+        assert await self.repository.get_object(user_id) is None
+
+    async def test_delete_object_failed(self):
+        """
+        Test to delete an object that does not exist.
+        """
+        assert await self.repository.delete_object(0) is None
+
+    async def test_create_objects(self):
+        """
+        Test to create several objects in one batch, reporting refused rows.
+        """
+        result = await self.repository.create_objects(
+            [
+                {
+                    "first_name": "Bulk",
+                    "last_name": "Doe",
+                    "email": "async_bulk@example.com",
+                    "password": "securepassword",
+                },
+                {
+                    "first_name": "Duplicated",
+                    "last_name": "Doe",
+                    "email": self.user_email,
+                    "password": "securepassword",
+                },
+            ]
+        )
+
+        assert [user.email for user in result.objects] == ["async_bulk@example.com"]
+        assert [(error.index, error.code) for error in result.errors] == [
+            (1, "INVALID_DATA")
+        ]
+
+    async def test_update_objects(self):
+        """
+        Test to update several objects, reporting the ones not found.
+        """
+        result = await self.repository.update_objects(
+            [
+                {"id": self.created_object.id, "first_name": "Bulk Updated"},
+                {"id": 0, "first_name": "Missing"},
+            ]
+        )
+
+        assert [user.first_name for user in result.objects] == ["Bulk Updated"]
+        assert result.errors[0].index == 1
+
+    async def test_update_matching_object(self):
+        """
+        Test that only an object matching one of the filters is updated.
+        """
+        matched = await self.repository.update_matching_object(
+            self.created_object.id,
+            {"first_name": "Matched"},
+            any_filters=[
+                {"email": "other@example.com"},
+                {"id": self.created_object.id},
+            ],
+        )
+        not_matched = await self.repository.update_matching_object(
+            self.created_object.id,
+            {"first_name": "Not Matched"},
+            any_filters=[{"email": "other@example.com"}],
+        )
+
+        assert [user.first_name for user in matched.objects] == ["Matched"]
+        assert not_matched.objects == []
+
+    async def test_delete_matching_object(self):
+        """
+        Test that only an object matching one of the filters is deleted.
+        """
+        user_id = self.created_object.id
+        not_matched = await self.repository.delete_matching_object(
+            user_id, any_filters=[{"email": "other@example.com"}]
+        )
+        deleted = await self.repository.delete_matching_object(
+            user_id, any_filters=[{"id": user_id}]
+        )
+
+        assert not_matched is None
+        assert deleted.id == user_id
+        assert await self.repository.get_object(user_id) is None
+
+    async def test_delete_objects(self):
+        """
+        Test to delete several objects, reporting the ones not found.
+        """
+        user_id = self.created_object.id
+        result = await self.repository.delete_objects([user_id, 0])
+
+        assert [user.id for user in result.objects] == [user_id]
+        assert result.errors[0].index == 1
+        assert await self.repository.get_object(user_id) is None
+
+    async def test_get_object_batches(self):
+        """
+        Test that every matching object is yielded in id order, in batches.
+        """
+        all_ids = [user.id for user in await self.repository.get_all_objects()]
+
+        batches = [
+            batch
+            async for batch in self.repository.get_object_batches({}, batch_size=2)
+        ]
+
+        assert all(len(batch) <= 2 for batch in batches)
+        assert [user.id for batch in batches for user in batch] == sorted(all_ids)
@@ -1,10 +1,13 @@
+from unittest.mock import patch
+
 import pytest
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.services.user_service import UserService
 from app.utils.auth_user import validate_current_user, get_current_user
-from app.utils.jwt_handler import create_access_token
+from app.utils.jwt_handler import create_access_token, decode_access_token
+from app.utils.user_cache import user_cache
 from tests.testing_helper import SetupHelper
 
 
@@ -105,3 +108,43 @@ class TestGetCurrentUser:
         result = get_current_user(valid_token, self.session_db)
 
         assert result is None
+
+    def test_get_current_user_is_cached(self):
+        """
+        Test that the second lookup with the same token does not query the database.
+        """
+        valid_token = create_access_token({"email": self.user_email})
+        first_user = get_current_user(valid_token, self.session_db)
+        hits = user_cache.stats()["hits"]
+
+        with patch.object(UserService, "get_user_identity") as get_user_identity:
+            cached_user = get_current_user(valid_token, self.session_db)
+
+        get_user_identity.assert_not_called()
+        assert cached_user == first_user
+        assert user_cache.stats()["hits"] == hits + 1
+
+    def test_get_current_user_cache_follows_token_expiration(self):
+        """
+        Test that a cached user does not outlive the token expiration.
+        """
+        valid_token = create_access_token({"email": self.user_email})
+        get_current_user(valid_token, self.session_db)
+        token_exp = decode_access_token(valid_token)["exp"]
+
+        expires_at, _ = user_cache._entries[self.user_email]
+        assert expires_at <= token_exp
+
+    def test_get_current_user_cache_invalidated_on_update(self):
+        """
+        Test that updating the user removes it from the cache.
+        """
+        valid_token = create_access_token({"email": self.user_email})
+        get_current_user(valid_token, self.session_db)
+
+        self.user_service.repository.update_object(
+            self.created_user.id, {"first_name": "Changed"}
+        )
+
+        assert user_cache.get(self.user_email) is None
+        assert get_current_user(valid_token, self.session_db).first_name == "Changed"
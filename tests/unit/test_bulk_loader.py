@@ -0,0 +1,180 @@
+import json
+from unittest.mock import patch
+
+import pytest
+from mongomock import MongoClient
+from sqlalchemy import select
+
+from app.database_settings import test_engine
+from app.models.movie import GenreEnum, Movie
+import populate_database
+from app.models.user import User
+from app.repositories.bulk_loader import (
+    MongoBulkWriter,
+    SQLBulkWriter,
+    batched,
+    load,
+    read_movies,
+    synthetic_movies,
+    synthetic_users,
+    zipf_weights,
+)
+
+
+class TestBulkLoader:
+    """
+    Tests for the bulk loader used by populate_database.py.
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self, test_db):
+        """
+        Setup test environment.
+        """
+        self.db = test_db
+        self.mongo_db = MongoClient()["loader_db"]
+
+    def test_batched(self):
+        """
+        Test that rows are grouped in batches of at most batch_size rows.
+        """
+        batches = list(batched(({"i": i} for i in range(5)), 2))
+
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+
+    def test_load_sql(self):
+        """
+        Test that synthetic users and movies are written with Core inserts.
+        """
+        user_writer = SQLBulkWriter(test_engine, User)
+        users = synthetic_users(3, "sql-loader-", "hash")
+        user_report = load(users, user_writer, "user", batch_size=2, workers=2)
+        user_ids = user_writer.user_ids("sql-loader-")
+
+        movies = synthetic_movies(7, user_ids)
+        report = load(movies, SQLBulkWriter(test_engine, Movie), "movie", 3, 2)
+
+        assert user_report.rows == 3
+        assert report.rows == 7
+        assert len(user_ids) == 3
+        loaded = self.db.scalars(select(Movie).where(Movie.user_id.in_(user_ids))).all()
+        assert len(loaded) == 7
+        assert all(isinstance(movie.genre, GenreEnum) for movie in loaded)
+
+    def test_load_mongo(self):
+        """
+        Test that synthetic users and movies are written with insert_many.
+        """
+        user_writer = MongoBulkWriter(self.mongo_db.client, "loader_db", User)
+        load(synthetic_users(4, "mongo-loader-", "hash"), user_writer, "user", 3)
+        user_ids = user_writer.user_ids("mongo-loader-")
+
+        movie_writer = MongoBulkWriter(self.mongo_db.client, "loader_db", Movie)
+        report = load(synthetic_movies(5, user_ids), movie_writer, "movie", 2)
+
+        assert report.rows == 5
+        assert len(user_ids) == 4
+        movie = self.mongo_db["movie"].find_one()
+        assert movie["user_id"] in user_ids
+        assert movie["genre"] in [genre.value for genre in GenreEnum]
+
+    def test_synthetic_movies_without_users(self):
+        """
+        Test that movies generated without users are public and unowned.
+        """
+        movies = list(synthetic_movies(3, []))
+
+        assert all(movie["is_public"] for movie in movies)
+        assert all(movie["user_id"] is None for movie in movies)
+
+    def test_zipf_weights(self):
+        """
+        Test that Zipf weights are cumulative and decrease with the rank.
+        """
+        weights = zipf_weights(3, exponent=1.0)
+
+        assert weights == pytest.approx([1.0, 1.5, 1.5 + 1 / 3])
+
+    def test_synthetic_movies_with_weights(self):
+        """
+        Test that movie owners are drawn following the cumulative weights.
+        """
+        movies = list(synthetic_movies(20, [1, 2], cum_weights=[1.0, 1.0]))
+
+        assert all(movie["user_id"] == 1 for movie in movies)
+
+    def test_populate_database_skews_ownership(self, monkeypatch):
+        """
+        Test that --zipf-exponent reaches the generator: with a steep exponent
+        every movie belongs to the first user.
+        """
+        monkeypatch.setenv("REPOSITORY_TYPE", "mongodb")
+        self.mongo_db.client.drop_database("loader_db")
+
+        def get_bulk_writer(model):
+            return MongoBulkWriter(self.mongo_db.client, "loader_db", model)
+
+        with (
+            patch("app.repositories.bulk_loader.get_bulk_writer", get_bulk_writer),
+            patch.object(populate_database, "SessionLocal"),
+            patch.object(populate_database, "MovieCountService") as count_service,
+            patch.object(populate_database, "MovieStatsService"),
+        ):
+            count_service.return_value.reconcile.return_value = {}
+            populate_database.main(
+                ["--users", "3", "--movies", "200", "--zipf-exponent", "30"]
+            )
+
+        first_user = self.mongo_db["user"].find_one(sort=[("_id", 1)])
+        owners = self.mongo_db["movie"].distinct("user_id")
+        assert owners == [str(first_user["_id"])]
+
+    def test_read_ndjson(self, tmp_path):
+        """
+        Test that exported NDJSON rows are validated and their id dropped.
+        """
+        path = tmp_path / "movies.ndjson"
+        row = {
+            "id": 10,
+            "title": "Movie",
+            "description": "Description",
+            "publication_year": 2020,
+            "genre": "Action",
+            "rating": 8.0,
+            "is_public": True,
+            "user_id": None,
+        }
+        path.write_text(json.dumps(row) + "\n\n")
+
+        movies = list(read_movies(str(path)))
+
+        assert len(movies) == 1
+        assert "id" not in movies[0]
+        assert movies[0]["genre"] == GenreEnum.ACTION
+        assert movies[0]["created_at"] is not None
+
+    def test_read_csv(self, tmp_path):
+        """
+        Test that CSV values are converted to the movie field types.
+        """
+        path = tmp_path / "movies.csv"
+        path.write_text(
+            "title,description,publication_year,genre,rating,is_public,user_id\n"
+            "Movie,Description,1999,Drama,7.5,false,\n"
+        )
+
+        movies = list(read_movies(str(path)))
+
+        assert movies[0]["publication_year"] == 1999
+        assert movies[0]["is_public"] is False
+        assert movies[0]["user_id"] is None
+
+    def test_read_unsupported_format(self, tmp_path):
+        """
+        Test that files with an unknown format are rejected.
+        """
+        path = tmp_path / "movies.xml"
+        path.write_text("<movies/>")
+
+        with pytest.raises(ValueError):
+            list(read_movies(str(path)))
@@ -0,0 +1,43 @@
+import pytest
+
+from app.utils.cursor import InvalidCursorError, decode_cursor, encode_cursor
+
+
+def test_encode_decode_cursor_roundtrip():
+    """
+    Test that a decoded cursor returns the encoded position.
+    """
+    position = {"id": 42}
+
+    cursor = encode_cursor(position)
+
+    assert isinstance(cursor, str)
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == position
+
+
+def test_encode_decode_cursor_with_string_id():
+    """
+    Test that string ids (MongoDB ObjectId) survive the roundtrip.
+    """
+    position = {"id": "67844c2a7c100713fc7f89ef"}
+
+    assert decode_cursor(encode_cursor(position)) == position
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "", "W10", "eyJmb28iOjF9"])
+def test_decode_invalid_cursor(cursor):
+    """
+    Test that malformed cursors, non-dict payloads and positions without id are rejected.
+    """
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor)
+
+
+@pytest.mark.parametrize("object_id", [[1], {"a": 1}, True, None, 1.5])
+def test_decode_cursor_with_invalid_id(object_id):
+    """
+    Test that positions whose id is not an integer or a string are rejected.
+    """
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(encode_cursor({"id": object_id}))
@@ -0,0 +1,88 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.database_settings import get_async_session, get_session_local
+
+
+class TestGetSessionLocal:
+    """
+    Tests for get_session_local dependency.
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """
+        Replaces the session factory with a mock.
+        """
+        self.session = MagicMock()
+        with patch("app.database_settings.SessionLocal", return_value=self.session):
+            yield
+
+    def test_session_is_closed(self):
+        """
+        Test that the session is closed once the request finishes.
+        """
+        dependency = get_session_local()
+        assert next(dependency) is self.session
+        with pytest.raises(StopIteration):
+            next(dependency)
+
+        self.session.close.assert_called_once()
+        self.session.rollback.assert_not_called()
+
+    def test_session_is_rolled_back_on_error(self):
+        """
+        Test that the session is rolled back and closed when the request fails.
+        """
+        dependency = get_session_local()
+        next(dependency)
+        with pytest.raises(ValueError):
+            dependency.throw(ValueError("request failed"))
+
+        self.session.rollback.assert_called_once()
+        self.session.close.assert_called_once()
+
+
+class TestGetAsyncSession:
+    """
+    Tests for get_async_session dependency.
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """
+        Replaces the async session factory with a mock.
+        """
+        self.session = AsyncMock()
+        self.session.__aenter__.return_value = self.session
+        with patch(
+            "app.database_settings.AsyncSessionLocal", return_value=self.session
+        ):
+            yield
+
+    @pytest.mark.anyio
+    async def test_session_is_closed(self):
+        """
+        Test that the session context is exited once the request finishes.
+        """
+        dependency = get_async_session()
+        assert await dependency.__anext__() is self.session
+        with pytest.raises(StopAsyncIteration):
+            await dependency.__anext__()
+
+        self.session.__aexit__.assert_awaited_once()
+        self.session.rollback.assert_not_awaited()
+
+    @pytest.mark.anyio
+    async def test_session_is_rolled_back_on_error(self):
+        """
+        Test that the session is rolled back when the request fails.
+        """
+        dependency = get_async_session()
+        await dependency.__anext__()
+        with pytest.raises(ValueError):
+            await dependency.athrow(ValueError("request failed"))
+
+        self.session.rollback.assert_awaited_once()
+        self.session.__aexit__.assert_awaited_once()
@@ -1,9 +1,12 @@
 import os
 import pytest
 from unittest.mock import patch, MagicMock
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.repositories.get_repository import get_repository
+from app.repositories.async_mongo_repository import AsyncMongoDBRepository
+from app.repositories.async_sql_repository import AsyncSQLRepository
+from app.repositories.get_repository import get_repository, is_valid_id, parse_id
 from app.repositories.mongo_repository import MongoDBRepository
 from app.repositories.sql_repository import SQLRepository
 
@@ -61,6 +64,25 @@ def test_get_repository_mongodb(mock_mongo_client, mock_env_mongodb):
     assert repository.collection.name == "fake_model"
 
 
+def test_get_repository_async_sqlite(mock_env_sqlite):
+    """
+    Test to verify an AsyncSession returns AsyncSQLRepository.
+    """
+    mock_async_session = MagicMock(spec=AsyncSession)
+    repository = get_repository(db=mock_async_session, model=FakeModel)
+    assert isinstance(repository, AsyncSQLRepository)
+    assert repository.db == mock_async_session
+
+
+def test_get_repository_async_mongodb(mock_env_mongodb):
+    """
+    Test to verify an AsyncSession returns AsyncMongoDBRepository.
+    """
+    repository = get_repository(db=MagicMock(spec=AsyncSession), model=FakeModel)
+    assert isinstance(repository, AsyncMongoDBRepository)
+    assert repository.collection.name == "fake_model"
+
+
 def test_get_repository_invalid_type(mock_sql_session):
     """
     Test to verify that it raises ValueError.
@@ -68,3 +90,37 @@ def test_get_repository_invalid_type(mock_sql_session):
     with patch.dict(os.environ, {"REPOSITORY_TYPE": "invalid"}):
         with pytest.raises(ValueError, match="Unsupported repository type"):
             get_repository(db=mock_sql_session, model=FakeModel)
+
+
+def test_is_valid_id_sqlite(mock_env_sqlite):
+    """
+    Test that integers are the ids of the SQL backend.
+    """
+    assert is_valid_id(1)
+    assert not is_valid_id("67844c2a7c100713fc7f89ef")
+
+
+def test_is_valid_id_mongodb(mock_env_mongodb):
+    """
+    Test that ObjectId strings are the ids of the MongoDB backend.
+    """
+    assert is_valid_id("67844c2a7c100713fc7f89ef")
+    assert not is_valid_id(1)
+
+
+def test_parse_id_sqlite(mock_env_sqlite):
+    """
+    Test that query parameters are read as integer ids on SQL.
+    """
+    assert parse_id("42") == 42
+    with pytest.raises(ValueError):
+        parse_id("abc")
+
+
+def test_parse_id_mongodb(mock_env_mongodb):
+    """
+    Test that only ObjectId strings are read as ids on MongoDB.
+    """
+    assert parse_id("67844c2a7c100713fc7f89ef") == "67844c2a7c100713fc7f89ef"
+    with pytest.raises(ValueError):
+        parse_id("abc")
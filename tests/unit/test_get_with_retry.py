@@ -1,56 +1,52 @@
-from unittest.mock import patch, MagicMock
-
+import httpx
 import pytest
-from requests.exceptions import HTTPError
 
-from app.utils.get_with_retry import get_with_retry
+from app.utils.get_with_retry import get_with_retry_async
 
 
-class TestGetWithRetry:
+class TestGetWithRetryAsync:
     """
-    Tests for the `get_with_retry` function using unittest.mock.
+    Tests for the `get_with_retry_async` function using httpx.MockTransport.
     """
 
-    @pytest.fixture(autouse=True)
-    def septup(self):
-        self.test_url = "http://example.com"
-
-    @patch("app.utils.get_with_retry.requests.get")
-    def test_successful_request(self, mock_get):
+    @staticmethod
+    def get_client(responses: list) -> httpx.AsyncClient:
         """
-        Test that a successful request returns.
+        Returns a client answering the given responses in order.
         """
-        expected_response = {"key": "value"}
+        responses = iter(responses)
+        return httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: next(responses))
+        )
 
-        mock_response = MagicMock()
-        mock_response.json.return_value = expected_response
-        mock_response.status_code = 200
-        mock_get.return_value = mock_response
+    @pytest.mark.anyio
+    async def test_retry_on_server_error(self):
+        """
+        Test that server errors are retried.
+        """
+        client = self.get_client(
+            [httpx.Response(503), httpx.Response(200, json={"key": "value"})]
+        )
 
-        response = get_with_retry(self.test_url)
-        assert response == expected_response
-        mock_get.assert_called_once_with(url=self.test_url, json=None, headers=None)
+        response = await get_with_retry_async(client, "http://example.com", wait=0)
+        assert response == {"key": "value"}
 
-    @patch("app.utils.get_with_retry.requests.get")
-    def test_retry_on_failure(self, mock_get):
+    @pytest.mark.anyio
+    async def test_no_retry_on_client_error(self):
         """
-        Test that the function retries on failure and succeeds on a later attempt.
+        Test that client errors are raised without retrying.
         """
-        expected_response = {"key": "value"}
+        client = self.get_client([httpx.Response(404), httpx.Response(200, json={})])
 
-        mock_response_fail = MagicMock()
-        mock_response_fail.raise_for_status.side_effect = HTTPError("Server Error")
+        with pytest.raises(httpx.HTTPStatusError):
+            await get_with_retry_async(client, "http://example.com", wait=0)
 
-        mock_response_success = MagicMock()
-        mock_response_success.json.return_value = expected_response
-        mock_response_success.status_code = 200
-
-        mock_get.side_effect = [
-            mock_response_fail,
-            mock_response_fail,
-            mock_response_success,
-        ]
+    @pytest.mark.anyio
+    async def test_gives_up_after_attempts(self):
+        """
+        Test that the last error is raised once the attempts are exhausted.
+        """
+        client = self.get_client([httpx.Response(500)] * 3)
 
-        response = get_with_retry(self.test_url)
-        assert response == expected_response
-        assert mock_get.call_count == 3
+        with pytest.raises(httpx.HTTPStatusError):
+            await get_with_retry_async(client, "http://example.com", wait=0)
@@ -1,10 +1,17 @@
 import os
 from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
 
 import jwt
 import pytest
 
-from app.utils.jwt_handler import create_access_token, decode_access_token
+from app.utils.jwt_handler import (
+    create_access_token,
+    decode_access_token,
+    get_auth_settings,
+    reload_auth_settings,
+    token_cache,
+)
 
 
 class TestCreateAccessToken:
@@ -113,3 +120,87 @@ class TestDecodeAccessToken:
         malformed_token = "this.is.not.a.jwt"
         decoded_payload = decode_access_token(malformed_token)
         assert decoded_payload is None
+
+    def test_decode_cached_token_skips_verification(self):
+        """
+        Test that a token decoded before is served from the cache.
+        """
+        valid_token = create_access_token({"email": "user@example.com"})
+        first_payload = decode_access_token(valid_token)
+
+        with patch("app.utils.jwt_handler.jwt.decode") as jwt_decode:
+            cached_payload = decode_access_token(valid_token)
+
+        jwt_decode.assert_not_called()
+        assert cached_payload == first_payload
+
+    def test_decode_tampered_token_is_not_cached(self):
+        """
+        Test that a cached token does not validate a token with another signature.
+        """
+        valid_token = create_access_token({"email": "user@example.com"})
+        decode_access_token(valid_token)
+        tampered_token = valid_token[:-2] + ("AA" if valid_token[-2:] != "AA" else "BB")
+
+        assert decode_access_token(tampered_token) is None
+
+    def test_decode_cached_token_expires_with_token(self):
+        """
+        Test that the cached payload expires at the token expiration.
+        """
+        valid_token = create_access_token({"email": "user@example.com"})
+        payload = decode_access_token(valid_token)
+
+        with patch(
+            "app.utils.ttl_cache.time.time", return_value=payload["exp"] + 1
+        ), patch("app.utils.jwt_handler.jwt.decode") as jwt_decode:
+            jwt_decode.side_effect = jwt.ExpiredSignatureError()
+            assert decode_access_token(valid_token) is None
+        jwt_decode.assert_called_once()
+
+
+class TestAuthSettings:
+    """
+    Tests for the JWT configuration loading.
+    """
+
+    def test_settings_are_loaded_once(self):
+        """
+        Test that the settings are read from the environment once.
+        """
+        assert get_auth_settings() is get_auth_settings()
+        assert get_auth_settings().algorithm == os.environ["ALGORITHM"]
+
+    def test_reload_auth_settings(self):
+        """
+        Test that reloading reads the environment again and clears verified tokens.
+        """
+        decode_access_token(create_access_token({"email": "user@example.com"}))
+        minutes = os.environ["ACCESS_TOKEN_EXPIRE_MINUTES"]
+        try:
+            with patch.dict(os.environ, {"ACCESS_TOKEN_EXPIRE_MINUTES": "7"}):
+                assert reload_auth_settings().access_token_expire_minutes == 7
+                assert token_cache.stats()["size"] == 0
+        finally:
+            reload_auth_settings()
+        assert get_auth_settings().access_token_expire_minutes == int(minutes)
+
+    def test_decode_without_expiry_setting(self):
+        """
+        Test that tokens are decoded without ACCESS_TOKEN_EXPIRE_MINUTES,
+        which only token creation needs.
+        """
+        valid_token = create_access_token({"email": "user@example.com"})
+        environ = {
+            key: value
+            for key, value in os.environ.items()
+            if key != "ACCESS_TOKEN_EXPIRE_MINUTES"
+        }
+        try:
+            with patch.dict(os.environ, environ, clear=True):
+                assert reload_auth_settings().access_token_expire_minutes is None
+                assert decode_access_token(valid_token)["email"] == "user@example.com"
+                with pytest.raises(KeyError, match="ACCESS_TOKEN_EXPIRE_MINUTES"):
+                    create_access_token({"email": "user@example.com"})
+        finally:
+            reload_auth_settings()
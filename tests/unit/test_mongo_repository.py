@@ -1,11 +1,16 @@
 from datetime import datetime, timezone
+from unittest.mock import patch
 
 import pytest
 from bson import ObjectId
 from mongomock import MongoClient
+from pymongo import ASCENDING, IndexModel
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 from pydantic import BaseModel
 
+from app.repositories.base_repository import In, Range, Sort
 from app.repositories.mongo_repository import MongoDBRepository
+from app.utils.cursor import InvalidCursorError
 
 
 class ExampleSchema(BaseModel):
@@ -94,6 +99,156 @@ class TestMongoDBRepository:
         filtered_objects = self.repository.get_objects_by_filters({"value": 98})
         assert len(filtered_objects) == 2
 
+    def test_get_objects_by_filters_with_fields(self):
+        """
+        Test to verify that only the given fields and the _id are read.
+        """
+        documents = self.repository.get_objects_by_filters({}, fields=["id", "name"])
+
+        assert documents == [
+            {"_id": ObjectId(self.document["id"]), "name": self.sample_data["name"]}
+        ]
+
+    def test_get_objects_by_filters_with_range_and_in(self):
+        """
+        Test to verify Range and In filters.
+        """
+        self.repository.create_object({"name": "Low", "value": 10})
+        self.repository.create_object({"name": "High", "value": 90})
+
+        in_range = self.repository.get_objects_by_filters(
+            {"value": Range(gte=40, lte=95)}
+        )
+        in_names = self.repository.get_objects_by_filters({"name": In(("Low", "High"))})
+
+        assert [doc["value"] for doc in in_range] == [42, 90]
+        assert [doc["name"] for doc in in_names] == ["Low", "High"]
+
+    def test_get_objects_by_filters_sorted_with_keyset_pagination(self):
+        """
+        Test that a sorted listing breaks ties by _id in the sort direction
+        and resumes after the last (value, id) seen.
+        """
+        first = self.repository.create_object({"name": "A", "value": 50})
+        second = self.repository.create_object({"name": "B", "value": 50})
+        sort = Sort("value", descending=True)
+
+        page = self.repository.get_objects_by_filters({}, limit=2, sort=sort)
+        rest = self.repository.get_objects_by_filters(
+            {}, sort=sort, after=(page[-1]["value"], str(page[-1]["_id"]))
+        )
+
+        assert [str(doc["_id"]) for doc in page] == [second["id"], first["id"]]
+        assert [doc["value"] for doc in rest] == [42]
+
+    def test_is_valid_id(self):
+        """
+        Test that only ObjectId strings are ids of the MongoDB backend.
+        """
+        assert self.repository.is_valid_id(self.document["id"])
+        for object_id in ("abc", 1, [self.document["id"]], None):
+            assert not self.repository.is_valid_id(object_id)
+
+    def test_get_objects_by_filters_sorted_across_nulls(self):
+        """
+        Test that sorted pages continue past null values, which sort first
+        in ascending order and last in descending order.
+        """
+        nulls = [
+            self.repository.create_object({"name": name, "value": None})["id"]
+            for name in ("Null 1", "Null 2")
+        ]
+        for sort, expected in (
+            (Sort("value"), nulls + [self.document["id"]]),
+            (Sort("value", descending=True), [self.document["id"]] + nulls[::-1]),
+        ):
+            seen, after = [], None
+            while True:
+                page = self.repository.get_objects_by_filters(
+                    {}, limit=1, sort=sort, after=after
+                )
+                if not page:
+                    break
+                seen.append(str(page[0]["_id"]))
+                after = (page[0]["value"], str(page[0]["_id"]))
+
+            assert seen == expected
+
+    def test_get_objects_by_filters_with_keyset_pagination(self):
+        """
+        Test to verify objects retrieved after a given id.
+        """
+        second = self.repository.create_object({"name": "Second", "value": 1})
+        third = self.repository.create_object({"name": "Third", "value": 1})
+
+        filtered_objects = self.repository.get_objects_by_filters(
+            {}, limit=1, after=self.document["id"]
+        )
+        assert len(filtered_objects) == 1
+        assert str(filtered_objects[0]["_id"]) == second["id"]
+
+        filtered_objects = self.repository.get_objects_by_filters(
+            {}, after=second["id"]
+        )
+        assert [str(doc["_id"]) for doc in filtered_objects] == [third["id"]]
+
+    def test_get_objects_by_filters_with_invalid_after(self):
+        """
+        Test to verify an invalid keyset position is rejected.
+        """
+        with pytest.raises(InvalidCursorError):
+            self.repository.get_objects_by_filters({}, after="invalid")
+
+    def test_search_pipeline(self):
+        """
+        Test that the search ranks by text score and resumes after the last result.
+        """
+        last_id = str(ObjectId())
+        pipeline = self.repository.search_pipeline(
+            'dark "night',
+            any_filters=[{"is_public": True}, {"user_id": "1"}],
+            limit=5,
+            after={"score": 1.5, "id": last_id},
+        )
+
+        assert pipeline[0] == {
+            "$match": {
+                "$text": {"$search": '"dark" "night"'},
+                "$or": [{"is_public": True}, {"user_id": "1"}],
+            }
+        }
+        assert pipeline[2]["$match"]["$or"] == [
+            {"_score": {"$lt": 1.5}},
+            {"_score": 1.5, "_id": {"$gt": ObjectId(last_id)}},
+        ]
+        assert pipeline[-2:] == [{"$sort": {"_score": -1, "_id": 1}}, {"$limit": 5}]
+
+    def test_search_pipeline_with_invalid_after(self):
+        """
+        Test to verify an invalid search position is rejected.
+        """
+        with pytest.raises(InvalidCursorError):
+            self.repository.search_pipeline("dark", after={"score": 1, "id": "x"})
+
+    def test_get_object_batches(self):
+        """
+        Test that every matching document is yielded in _id order, in batches.
+        """
+        for value in range(4):
+            self.repository.create_object({"name": "Batch", "value": value})
+
+        batches = list(
+            self.repository.get_object_batches({"name": "Batch"}, batch_size=3)
+        )
+
+        assert [len(batch) for batch in batches] == [3, 1]
+        assert [document["value"] for batch in batches for document in batch] == [
+            0,
+            1,
+            2,
+            3,
+        ]
+
     def test_update_object(self):
         """
         Test to verify object updates correctly.
@@ -129,6 +284,175 @@ class TestMongoDBRepository:
         assert deleted_object["name"] == self.sample_data["name"]
         assert len(remaining_objects) == 0
 
+    def test_create_objects(self):
+        """
+        Test to create several objects, reporting the rows that fail.
+        """
+        self.repository.collection.create_index("name", unique=True)
+        result = self.repository.create_objects(
+            [{"name": "Bulk 1", "value": 1}, self.sample_data, {"name": "Bulk 2"}]
+        )
+
+        assert [document["name"] for document in result.objects] == [
+            "Bulk 1",
+            "Bulk 2",
+        ]
+        assert all("id" in document for document in result.objects)
+        assert [(error.index, error.code) for error in result.errors] == [
+            (1, "INVALID_DATA")
+        ]
+
+    def test_update_objects(self):
+        """
+        Test to update several objects, reporting the ones not found.
+        """
+        result = self.repository.update_objects(
+            [
+                {"id": self.document["id"], "value": 84},
+                {"id": "67844c2a7c100711fc7f89ef", "value": 1},
+                {"id": "invalid", "value": 1},
+            ]
+        )
+
+        assert [document["value"] for document in result.objects] == [84]
+        assert [error.index for error in result.errors] == [1, 2]
+        assert [document["value"] for document in result.previous] == [42]
+
+    def test_update_objects_with_filters(self):
+        """
+        Test that objects not matching the filters are not updated.
+        """
+        result = self.repository.update_objects(
+            [{"id": self.document["id"], "value": 84}], filters={"name": "Other"}
+        )
+
+        assert result.objects == []
+        assert self.repository.get_object(self.document["id"])["value"] == 42
+
+    def test_update_matching_object(self):
+        """
+        Test that a document matching one of the filters is updated, and
+        returned along with the document as it was before.
+        """
+        result = self.repository.update_matching_object(
+            self.document["id"],
+            {"value": 84},
+            any_filters=[{"name": "Other"}, {"name": "Test Object"}],
+        )
+
+        assert [document["value"] for document in result.objects] == [84]
+        assert [document["value"] for document in result.previous] == [42]
+        assert result.objects[0] == self.repository.get_object(self.document["id"])
+
+    def test_update_matching_object_not_matching(self):
+        """
+        Test that a document matching none of the filters is not updated.
+        """
+        result = self.repository.update_matching_object(
+            self.document["id"], {"value": 84}, any_filters=[{"name": "Other"}]
+        )
+
+        assert result.objects == []
+        assert result.previous == []
+        assert self.repository.get_object(self.document["id"])["value"] == 42
+
+    def test_delete_matching_object(self):
+        """
+        Test that only a document matching one of the filters is deleted.
+        """
+        not_matched = self.repository.delete_matching_object(
+            self.document["id"], any_filters=[{"name": "Other"}]
+        )
+        deleted = self.repository.delete_matching_object(
+            self.document["id"], any_filters=[{"name": "Other"}, {"value": 42}]
+        )
+
+        assert not_matched is None
+        assert deleted["name"] == "Test Object"
+        assert self.repository.get_all_objects() == []
+
+    def test_delete_objects(self):
+        """
+        Test to delete several objects, reporting the ones not found.
+        """
+        result = self.repository.delete_objects(
+            [self.document["id"], "67844c2a7c100711fc7f89ef"]
+        )
+
+        assert [document["name"] for document in result.objects] == ["Test Object"]
+        assert [error.index for error in result.errors] == [1]
+        assert self.repository.get_all_objects() == []
+
+    def test_delete_objects_returns_each_document_once(self):
+        """
+        Test that a repeated id deletes and returns its document once, and that
+        documents outside the filters are kept.
+        """
+        other = self.repository.create_object({"name": "Other", "value": 7})
+
+        result = self.repository.delete_objects(
+            [self.document["id"], self.document["id"], other["id"]],
+            filters={"value": 42},
+        )
+
+        assert [document["value"] for document in result.objects] == [42]
+        assert [error.index for error in result.errors] == [2]
+        assert [
+            document["value"] for document in self.repository.get_all_objects()
+        ] == [7]
+
+    def test_delete_objects_uses_one_bulk_write(self):
+        """
+        Test that several documents are deleted with a single bulk_write.
+        """
+        other = self.repository.create_object({"name": "Other", "value": 7})
+        collection = self.repository.collection
+
+        with patch.object(
+            collection, "bulk_write", wraps=collection.bulk_write
+        ) as bulk_write:
+            result = self.repository.delete_objects([self.document["id"], other["id"]])
+
+        assert bulk_write.call_count == 1
+        assert len(result.objects) == 2
+        assert self.repository.get_all_objects() == []
+
+    def test_delete_objects_skips_failed_deletes(self):
+        """
+        Test that a document whose delete fails is reported as not found.
+        """
+        other = self.repository.create_object({"name": "Other", "value": 7})
+        error = BulkWriteError(
+            {"writeErrors": [{"index": 0, "code": 1, "errmsg": "failed"}]}
+        )
+
+        with patch.object(self.repository.collection, "bulk_write", side_effect=error):
+            result = self.repository.delete_objects([self.document["id"], other["id"]])
+
+        assert [document["name"] for document in result.objects] == ["Other"]
+        assert [error.index for error in result.errors] == [0]
+
+    def test_ensure_indexes(self):
+        """
+        Test to verify declared indexes are created and reported.
+        """
+        repository = MongoDBRepository(
+            self.db_name,
+            "indexed_collection",
+            self.repository.db.client,
+            indexes=[
+                IndexModel([("email", ASCENDING)], name="email_unique", unique=True)
+            ],
+        )
+        assert repository.missing_indexes() == ["email_unique"]
+
+        repository.ensure_indexes()
+
+        assert repository.missing_indexes() == []
+        repository.create_object({"email": "unique@example.com"})
+        with pytest.raises(DuplicateKeyError):
+            repository.create_object({"email": "unique@example.com"})
+
     def test_to_schema_single_document(self):
         """
         Test to verify single document transformation to schema.
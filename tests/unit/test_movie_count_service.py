@@ -0,0 +1,261 @@
+from unittest.mock import MagicMock
+
+import pytest
+from mongomock import MongoClient
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.models.movie import Movie
+from app.models.movie_count import MovieCount, count_trigger_name
+from app.repositories.async_mongo_repository import AsyncMongoDBRepository
+from app.repositories.mongo_repository import MongoDBRepository
+from app.repositories.sql_repository import SQLRepository
+from app.services.movie_count_service import (
+    PUBLIC_COUNT_SCOPE,
+    MovieCountService,
+    count_deltas,
+    scope_totals,
+    user_count_scope,
+)
+from app.services.movie_service import MovieService
+from app.services.user_service import UserService
+from tests.testing_helper import AsyncMongoMock, SetupHelper
+
+
+def test_count_deltas():
+    """
+    Test that creations, visibility changes and deletions add up per scope.
+    """
+    deltas = count_deltas(
+        [
+            (1, None, True),
+            (1, None, False),
+            (1, False, True),
+            (2, True, None),
+            (2, True, True),
+        ]
+    )
+
+    assert deltas == {
+        PUBLIC_COUNT_SCOPE: 1,
+        "user:1": 2,
+        "user:1:public": 2,
+        "user:2": -1,
+        "user:2:public": -1,
+    }
+
+
+def test_scope_totals():
+    """
+    Test that the totals of every scope are derived from the grouped counts.
+    """
+    totals = scope_totals([(1, True, 3), (1, False, 2), (2, True, 1), (None, True, 4)])
+
+    assert totals == {
+        PUBLIC_COUNT_SCOPE: 8,
+        "user:1": 5,
+        "user:1:public": 3,
+        "user:1:private": 2,
+        "user:2": 1,
+        "user:2:public": 1,
+    }
+
+
+class TestSQLMovieCounts:
+    """
+    Tests for the trigger-maintained movie counts on SQLite.
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self, test_db: Session):
+        """
+        Initial configuration for every test. The movies are deleted
+        afterwards, since other tests count the public movies.
+        """
+        self.db = test_db
+        self.user = SetupHelper.create_test_user(
+            UserService(test_db), email="counts@example.com"
+        )
+        self.movie_service = MovieService(test_db)
+        self.count_service = MovieCountService(test_db)
+        self.public_total = self.total(PUBLIC_COUNT_SCOPE)
+        self.movie_ids = []
+        yield
+        for movie_id in self.movie_ids:
+            self.movie_service.repository.delete_object(movie_id)
+
+    def total(self, scope: str) -> int:
+        self.db.rollback()
+        return self.count_service.get_totals().get(scope, 0)
+
+    def create_movie(self, is_public: bool) -> Movie:
+        movie = self.movie_service.repository.create_object(
+            {
+                "title": "Counted",
+                "description": "Description",
+                "publication_year": 2001,
+                "genre": "DRAMA",
+                "is_public": is_public,
+                "user_id": self.user.id,
+            }
+        )
+        self.movie_ids.append(movie.id)
+        return movie
+
+    def test_writes_update_counts(self):
+        """
+        Test that inserts, visibility changes and deletes keep the counts exact.
+        """
+        public_movie = self.create_movie(True)
+        private_movie = self.create_movie(False)
+
+        assert self.total(PUBLIC_COUNT_SCOPE) == self.public_total + 1
+        assert self.total(user_count_scope(self.user.id)) == 2
+        assert self.total(user_count_scope(self.user.id, True)) == 1
+        assert self.total(user_count_scope(self.user.id, False)) == 1
+
+        self.movie_service.repository.update_object(
+            private_movie.id, {"is_public": True}
+        )
+        assert self.total(PUBLIC_COUNT_SCOPE) == self.public_total + 2
+        assert self.total(user_count_scope(self.user.id, False)) == 0
+
+        self.movie_service.repository.delete_object(public_movie.id)
+        self.movie_ids.remove(public_movie.id)
+        assert self.total(PUBLIC_COUNT_SCOPE) == self.public_total + 1
+        assert self.total(user_count_scope(self.user.id)) == 1
+        assert self.count_service.reconcile() == {}
+
+    def test_reconcile_repairs_drift(self):
+        """
+        Test that drifted counts are reported, and only repaired when asked.
+        """
+        self.create_movie(True)
+        scope = user_count_scope(self.user.id)
+        self.db.execute(
+            text("UPDATE movie_count SET total = 7 WHERE scope = :scope"),
+            {"scope": scope},
+        )
+        self.db.commit()
+
+        assert self.count_service.reconcile(repair=False) == {scope: (7, 1)}
+        assert self.total(scope) == 7
+        assert self.count_service.reconcile() == {scope: (7, 1)}
+        assert self.total(scope) == 1
+
+    @pytest.mark.anyio
+    async def test_other_dialects_keep_no_counts(self, anyio_backend):
+        """
+        Test that SQL databases without the SQLite triggers start without
+        counts, and report no total instead of totals that never change.
+        """
+        db = MagicMock(spec=Session)
+        db.get_bind.return_value.dialect.name = "postgresql"
+        count_service = MovieCountService(db)
+
+        assert count_service.ensure() is False
+        assert count_service.reconcile() == {}
+        assert await count_service.get_total_async(PUBLIC_COUNT_SCOPE) is None
+        await count_service.record_async([(self.user.id, None, True)])
+        db.get_bind.return_value.begin.assert_not_called()
+        db.execute.assert_not_called()
+        db.scalar.assert_not_called()
+
+    def test_ensure_creates_missing_triggers(self):
+        """
+        Test that a database without the triggers gets them, and its counts
+        are rebuilt.
+        """
+        assert self.count_service.ensure() is False
+
+        for action in ("insert", "delete", "update"):
+            trigger = count_trigger_name(Movie.__table__, action)
+            self.db.execute(text(f"DROP TRIGGER {trigger}"))
+        self.db.commit()
+        self.create_movie(True)
+        assert self.total(user_count_scope(self.user.id)) == 0
+
+        assert self.count_service.ensure() is True
+        assert self.total(user_count_scope(self.user.id)) == 1
+        assert self.total(PUBLIC_COUNT_SCOPE) == self.public_total + 1
+
+
+class TestMongoMovieCounts:
+    """
+    Tests for the application-maintained movie counts on MongoDB.
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self, test_db: Session):
+        """
+        Initial configuration for every test, with repositories on mongomock.
+        """
+        self.client = MongoClient()
+        self.count_service = MovieCountService(test_db)
+        self.count_service.repository = MongoDBRepository(
+            "test_db", "movie_count", self.client
+        )
+        self.count_service.movies = MongoDBRepository("test_db", "movie", self.client)
+        self.count_service.uses_triggers = False
+        self.movies = self.count_service.movies.collection
+        self.movies.insert_many(
+            [
+                {"user_id": "a", "is_public": True},
+                {"user_id": "a", "is_public": False},
+                {"user_id": "b", "is_public": True},
+            ]
+        )
+        yield
+        self.client.drop_database("test_db")
+
+    def async_service(self) -> MovieCountService:
+        service = MovieCountService.__new__(MovieCountService)
+        client = AsyncMongoMock(self.client)
+        service.repository = AsyncMongoDBRepository("test_db", "movie_count", client)
+        service.movies = AsyncMongoDBRepository("test_db", "movie", client)
+        service.uses_triggers = False
+        service.keeps_counts = True
+        return service
+
+    def test_ensure_fills_empty_counts(self):
+        """
+        Test that empty counts are rebuilt from the movies, only once.
+        """
+        assert self.count_service.ensure() is True
+        assert self.count_service.ensure() is False
+        assert self.count_service.get_totals() == {
+            PUBLIC_COUNT_SCOPE: 2,
+            "user:a": 2,
+            "user:a:public": 1,
+            "user:a:private": 1,
+            "user:b": 1,
+            "user:b:public": 1,
+        }
+
+    @pytest.mark.anyio
+    async def test_record_applies_deltas(self, anyio_backend):
+        """
+        Test that recorded writes are added to the counts with $inc.
+        """
+        self.count_service.reconcile()
+        service = self.async_service()
+
+        await service.record_async([("a", None, True), ("b", True, None)])
+
+        assert await service.get_total_async(PUBLIC_COUNT_SCOPE) == 2
+        assert await service.get_total_async("user:a") == 3
+        assert await service.get_total_async("user:b") == 0
+        assert await service.get_total_async("user:c") == 0
+
+    def test_reconcile_repairs_drift(self):
+        """
+        Test that drifted and missing counts are repaired.
+        """
+        self.count_service.reconcile()
+        self.count_service.repository.collection.update_one(
+            {"_id": "user:b"}, {"$set": {"total": 5}}
+        )
+        self.count_service.repository.collection.delete_one({"_id": "user:a"})
+
+        assert self.count_service.reconcile() == {"user:b": (5, 1), "user:a": (0, 2)}
+        assert self.count_service.reconcile() == {}
@@ -0,0 +1,105 @@
+from datetime import datetime
+
+import orjson
+import pytest
+from bson import ObjectId
+from mongomock import MongoClient
+from sqlalchemy.orm import Session
+
+from app.models.movie import GenreEnum, Movie
+from app.repositories.base_repository import Sort
+from app.repositories.mongo_repository import MongoDBRepository
+from app.repositories.sql_repository import SQLRepository
+from app.routers.movie import (
+    movie_list_adapter,
+    serialize_movie_page,
+    to_movie_responses,
+)
+from app.utils.cursor import decode_cursor
+
+
+def validated_json(repository, objects: list) -> bytes:
+    """
+    Serializes the objects the way the listings did before, through MovieResponse.
+    """
+    return movie_list_adapter.dump_json(to_movie_responses(repository, objects))
+
+
+class TestMovieSerialization:
+    """
+    Tests that the row encoding of movie pages matches the MovieResponse one.
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self, test_db: Session):
+        """
+        Initial configuration for every test: unsaved SQL movies and MongoDB
+        documents, as the repositories return them.
+        """
+        self.sql_repository = SQLRepository(db=test_db, model=Movie)
+        self.mongo_repository = MongoDBRepository("test_db", "movie", MongoClient())
+        created_at = datetime(2025, 1, 13, 1, 0, 0, 123456)
+        self.movies = [
+            {
+                "title": f"Movie {i}",
+                "description": "Café “noir”",
+                "publication_year": 1990 + i,
+                "genre": GenreEnum.SCIFI,
+                "rating": 7.0 + i / 4,
+                "is_public": i % 2 == 0,
+                "user_id": i,
+                "created_at": created_at.replace(second=i),
+            }
+            for i in range(3)
+        ]
+
+    def sql_movies(self) -> list:
+        return [Movie(id=i + 1, **movie) for i, movie in enumerate(self.movies)]
+
+    def mongo_documents(self) -> list:
+        return [
+            {
+                **movie,
+                "_id": ObjectId(),
+                "genre": movie["genre"].value,
+                "user_id": str(movie["user_id"]),
+            }
+            for movie in self.movies
+        ]
+
+    def test_sql_page_matches_validated_json(self):
+        """
+        Test that SQL movies are encoded as through MovieResponse.
+        """
+        body, next_cursor = serialize_movie_page(
+            self.sql_repository, self.sql_movies(), 10, None, None
+        )
+
+        assert body == validated_json(self.sql_repository, self.sql_movies())
+        assert next_cursor is None
+
+    def test_mongo_page_matches_validated_json(self):
+        """
+        Test that MongoDB documents are encoded as through MovieResponse.
+        """
+        documents = self.mongo_documents()
+
+        body, _ = serialize_movie_page(self.mongo_repository, documents, 10, None, None)
+
+        assert orjson.loads(body) == orjson.loads(
+            validated_json(self.mongo_repository, documents)
+        )
+
+    def test_sparse_page_keeps_cursor_of_sort_field(self):
+        """
+        Test that the sort field feeds the next cursor but is left out of a
+        sparse page.
+        """
+        movies = self.sql_movies()
+
+        body, next_cursor = serialize_movie_page(
+            self.sql_repository, movies, 3, Sort("rating", True), ("id", "title")
+        )
+
+        assert orjson.loads(body)[-1] == {"id": 3, "title": "Movie 2"}
+        assert decode_cursor(next_cursor) == {"id": 3, "value": 7.5}
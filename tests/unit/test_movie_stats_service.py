@@ -0,0 +1,345 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from mongomock import MongoClient
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.database_settings import TestingAsyncSessionLocal
+from app.models.movie import Movie
+from app.models.movie_stat import MovieStat, stat_trigger_name
+from app.repositories.async_mongo_repository import AsyncMongoDBRepository
+from app.repositories.mongo_repository import MongoDBRepository
+from app.repositories.sql_repository import SQLRepository
+from app.services.movie_service import MovieService
+from app.services.movie_stats_service import (
+    MovieStatsService,
+    fold_stat_groups,
+    stat_deltas,
+    stats_response,
+)
+from app.services.user_service import UserService
+from tests.testing_helper import AsyncMongoMock, SetupHelper
+
+
+def movie(is_public=True, genre="Drama", publication_year=1994, rating=7.5):
+    return SimpleNamespace(
+        is_public=is_public,
+        genre=genre,
+        publication_year=publication_year,
+        rating=rating,
+    )
+
+
+def test_stat_deltas():
+    """
+    Test that creations, updates and deletions move public movies between
+    buckets, and private movies are left out.
+    """
+    deltas = stat_deltas(
+        [
+            (None, movie()),
+            (movie(), movie(rating=8.2, publication_year=2001)),
+            (movie(is_public=False), None),
+            (movie(rating=None), None),
+        ]
+    )
+
+    assert deltas[("all", "")] == (0, 1, 8.2)
+    assert deltas[("genre", "Drama")] == (0, 1, 8.2)
+    assert deltas[("decade", "1990")] == (-1, 0, 0.0)
+    assert deltas[("decade", "2000")] == (1, 1, 8.2)
+    assert deltas[("rating", "8")] == (1, 1, 8.2)
+    assert ("rating", "7") not in deltas
+
+
+def test_fold_stat_groups():
+    """
+    Test that the MongoDB groups are added up into every bucket.
+    """
+    totals = fold_stat_groups(
+        [
+            {
+                "_id": {"genre": "Drama", "decade": 1990.0, "rating": 7.0},
+                "movies": 2,
+                "rated": 2,
+                "rating_sum": 15.0,
+            },
+            {
+                "_id": {"genre": "Action", "decade": 1990.0, "rating": None},
+                "movies": 1,
+                "rated": 0,
+                "rating_sum": 0,
+            },
+        ]
+    )
+
+    assert totals[("all", "")] == (3, 2, 15.0)
+    assert totals[("decade", "1990")] == (3, 2, 15.0)
+    assert totals[("genre", "Action")] == (1, 0, 0.0)
+    assert totals[("rating", "7")] == (2, 2, 15.0)
+
+
+def test_stats_response():
+    """
+    Test that every genre is listed, empty buckets are dropped and the
+    buckets are sorted numerically.
+    """
+    stats = stats_response(
+        [
+            ("all", "", 3, 2, 15.5),
+            ("genre", "Drama", 3, 2, 15.5),
+            ("decade", "2000", 1, 1, 8.0),
+            ("decade", "990", 2, 1, 7.5),
+            ("rating", "8", 1, 1, 8.0),
+            ("rating", "10", 0, 0, 0.0),
+            ("rating", "7", 1, 1, 7.5),
+        ]
+    )
+
+    assert stats.movies == 3
+    assert stats.genres["Drama"] == 3
+    assert stats.genres["Action"] == 0
+    assert stats.rating.average == 7.75
+    assert stats.rating.rated == 2
+    assert list(stats.rating.histogram) == ["7", "8"]
+    assert list(stats.decades) == ["990", "2000"]
+
+    assert stats_response([]).rating.average is None
+
+
+class TestSQLMovieStats:
+    """
+    Tests for the trigger-maintained movie statistics on SQLite.
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self, test_db: Session):
+        """
+        Initial configuration for every test. The movies are deleted
+        afterwards, since other tests count the public movies.
+        """
+        self.db = test_db
+        self.user = SetupHelper.create_test_user(
+            UserService(test_db), email="stats@example.com"
+        )
+        self.movie_service = MovieService(test_db)
+        self.stats_service = MovieStatsService(test_db)
+        self.movie_ids = []
+        yield
+        for movie_id in self.movie_ids:
+            self.movie_service.repository.delete_object(movie_id)
+
+    def stats(self) -> dict:
+        self.db.rollback()
+        return {
+            (stat.dimension, stat.bucket): (
+                stat.movies,
+                stat.rated,
+                round(stat.rating_sum, 6),
+            )
+            for stat in self.db.query(MovieStat)
+            if stat.movies
+        }
+
+    def create_movie(self, is_public: bool, rating: float | None) -> Movie:
+        movie = self.movie_service.repository.create_object(
+            {
+                "title": "Aggregated",
+                "description": "Description",
+                "publication_year": 1987,
+                "genre": "HORROR",
+                "rating": rating,
+                "is_public": is_public,
+                "user_id": self.user.id,
+            }
+        )
+        self.movie_ids.append(movie.id)
+        return movie
+
+    def test_triggers_match_rebuild(self):
+        """
+        Test that inserts, updates and deletes keep the statistics equal to
+        a full rebuild.
+        """
+        before = self.stats()
+        public_movie = self.create_movie(True, 6.5)
+        private_movie = self.create_movie(False, None)
+        self.create_movie(True, None)
+
+        stats = self.stats()
+        horror = stats[("genre", "Horror")]
+        assert horror[0] == before.get(("genre", "Horror"), (0,))[0] + 2
+        assert stats[("rating", "6")][0] == before.get(("rating", "6"), (0,))[0] + 1
+
+        self.movie_service.repository.update_object(
+            private_movie.id, {"is_public": True, "rating": 9.0}
+        )
+        self.movie_service.repository.update_object(
+            public_movie.id, {"publication_year": 2011}
+        )
+        self.movie_service.repository.delete_object(public_movie.id)
+        self.movie_ids.remove(public_movie.id)
+
+        stats = self.stats()
+        self.stats_service.rebuild()
+        assert self.stats() == stats
+
+    def test_other_dialects_store_no_stats(self):
+        """
+        Test that SQL databases without the SQLite triggers start without
+        stored statistics and ignore recorded writes.
+        """
+        db = MagicMock(spec=Session)
+        db.get_bind.return_value.dialect.name = "postgresql"
+        stats_service = MovieStatsService(db)
+
+        assert stats_service.aggregates_live is True
+        assert stats_service.ensure() is False
+        assert stats_service.rebuild() == 0
+        db.get_bind.return_value.begin.assert_not_called()
+        db.execute.assert_not_called()
+
+    @pytest.mark.anyio
+    async def test_live_aggregate_matches_triggers(self, anyio_backend):
+        """
+        Test that the statistics aggregated from the movies, as served on SQL
+        dialects without triggers, equal the trigger-maintained ones.
+        """
+        self.create_movie(True, 6.5)
+        self.create_movie(True, None)
+        self.create_movie(False, 8.0)
+
+        async with TestingAsyncSessionLocal() as session:
+            stored = await MovieStatsService(session).get_stats_async()
+            live_service = MovieStatsService(session)
+            live_service.uses_triggers = False
+            live_service.aggregates_live = True
+            await live_service.record_async([(None, movie(rating=5.0))])
+            live = await live_service.get_stats_async()
+
+        assert live.model_dump() == stored.model_dump()
+
+    def test_ensure_creates_missing_triggers(self):
+        """
+        Test that a database without the triggers gets them, and its
+        statistics are rebuilt.
+        """
+        assert self.stats_service.ensure() is False
+
+        for action in ("insert", "delete", "update"):
+            trigger = stat_trigger_name(Movie.__table__, action)
+            self.db.execute(text(f"DROP TRIGGER {trigger}"))
+        self.db.commit()
+        before = self.stats()
+        self.create_movie(True, 5.0)
+        assert self.stats() == before
+
+        assert self.stats_service.ensure() is True
+        assert self.stats()[("all", "")][0] == before.get(("all", ""), (0,))[0] + 1
+        self.create_movie(True, 5.0)
+        assert self.stats()[("all", "")][0] == before.get(("all", ""), (0,))[0] + 2
+
+
+class TestMongoMovieStats:
+    """
+    Tests for the application-maintained movie statistics on MongoDB.
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self, test_db: Session):
+        """
+        Initial configuration for every test, with repositories on mongomock.
+        """
+        self.client = MongoClient()
+        self.stats_service = MovieStatsService(test_db)
+        self.stats_service.repository = MongoDBRepository(
+            "test_db", "movie_stat", self.client
+        )
+        self.stats_service.movies = MongoDBRepository("test_db", "movie", self.client)
+        self.stats_service.uses_triggers = False
+        self.stats_service.movies.collection.insert_many(
+            [
+                {
+                    "genre": "Drama",
+                    "publication_year": 1994,
+                    "rating": 7.5,
+                    "is_public": True,
+                },
+                {
+                    "genre": "Drama",
+                    "publication_year": 2003,
+                    "rating": None,
+                    "is_public": True,
+                },
+                {
+                    "genre": "Action",
+                    "publication_year": 1999,
+                    "rating": 9.0,
+                    "is_public": False,
+                },
+            ]
+        )
+        yield
+        self.client.drop_database("test_db")
+
+    def async_service(self) -> MovieStatsService:
+        service = MovieStatsService.__new__(MovieStatsService)
+        client = AsyncMongoMock(self.client)
+        service.repository = AsyncMongoDBRepository("test_db", "movie_stat", client)
+        service.movies = AsyncMongoDBRepository("test_db", "movie", client)
+        service.uses_triggers = False
+        service.aggregates_live = False
+        return service
+
+    @pytest.mark.anyio
+    async def test_ensure_fills_empty_stats(self, anyio_backend):
+        """
+        Test that empty statistics are rebuilt from the public movies, only once.
+        """
+        assert self.stats_service.ensure() is True
+        assert self.stats_service.ensure() is False
+
+        stats = await self.async_service().get_stats_async()
+        assert stats.movies == 2
+        assert stats.genres["Drama"] == 2
+        assert stats.genres["Action"] == 0
+        assert stats.rating.average == 7.5
+        assert stats.rating.histogram == {"7": 1}
+        assert stats.decades == {"1990": 1, "2000": 1}
+
+    @pytest.mark.anyio
+    async def test_record_applies_deltas(self, anyio_backend):
+        """
+        Test that recorded writes are added to the statistics with $inc.
+        """
+        self.stats_service.rebuild()
+        service = self.async_service()
+
+        await service.record_async(
+            [
+                (None, movie(genre="Action", publication_year=2010, rating=8.0)),
+                (movie(publication_year=1994, rating=7.5), None),
+            ]
+        )
+
+        stats = await service.get_stats_async()
+        assert stats.movies == 2
+        assert stats.genres == {**stats.genres, "Action": 1, "Drama": 1}
+        assert stats.rating.average == 8.0
+        assert stats.decades == {"2000": 1, "2010": 1}
+
+    def test_rebuild_removes_stale_buckets(self):
+        """
+        Test that a rebuild drops the buckets no movie is in anymore.
+        """
+        self.stats_service.repository.collection.insert_one(
+            {"_id": "decade:1950", "dimension": "decade", "bucket": "1950", "movies": 4}
+        )
+
+        assert self.stats_service.rebuild() == 5
+        assert (
+            self.stats_service.repository.collection.find_one({"_id": "decade:1950"})
+            is None
+        )
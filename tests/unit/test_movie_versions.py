@@ -0,0 +1,73 @@
+import time
+from unittest.mock import patch
+
+from app.utils.movie_versions import (
+    PUBLIC_SCOPE,
+    VersionCounters,
+    etag_matches,
+    user_scope,
+)
+
+
+class TestVersionCounters:
+    """
+    Tests for VersionCounters class.
+    """
+
+    def test_bump_changes_etag(self):
+        """
+        Test that bumping a scope changes its ETags and no other scope's.
+        """
+        versions = VersionCounters(ttl=300)
+        public_etag = versions.etag(PUBLIC_SCOPE, 1, 10)
+        user_etag = versions.etag(user_scope(1), 1, 10)
+
+        versions.bump(user_scope(1))
+
+        assert versions.etag(PUBLIC_SCOPE, 1, 10) == public_etag
+        assert versions.etag(user_scope(1), 1, 10) != user_etag
+
+    def test_etag_depends_on_parts(self):
+        """
+        Test that different pages of the same scope get different ETags.
+        """
+        versions = VersionCounters(ttl=300)
+
+        assert versions.etag(PUBLIC_SCOPE, 1, 10) != versions.etag(PUBLIC_SCOPE, 2, 10)
+
+    def test_etag_expires_with_epoch(self):
+        """
+        Test that ETags change once the ttl epoch is over.
+        """
+        versions = VersionCounters(ttl=300)
+        etag = versions.etag(PUBLIC_SCOPE, 1, 10)
+
+        with patch(
+            "app.utils.movie_versions.time.time", return_value=time.time() + 301
+        ):
+            assert versions.etag(PUBLIC_SCOPE, 1, 10) != etag
+
+    def test_etag_differs_between_processes(self):
+        """
+        Test that counters of another process never produce the same ETag.
+        """
+        assert VersionCounters(ttl=300).etag(PUBLIC_SCOPE) != VersionCounters(
+            ttl=300
+        ).etag(PUBLIC_SCOPE)
+
+
+class TestEtagMatches:
+    """
+    Tests for etag_matches function.
+    """
+
+    def test_etag_matches(self):
+        """
+        Test the If-None-Match forms accepted for an ETag.
+        """
+        assert etag_matches('"a"', '"a"')
+        assert etag_matches('"b", "a"', '"a"')
+        assert etag_matches('W/"a"', '"a"')
+        assert etag_matches("*", '"a"')
+        assert not etag_matches('"b"', '"a"')
+        assert not etag_matches(None, '"a"')
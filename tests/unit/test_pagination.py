@@ -0,0 +1,69 @@
+from starlette.datastructures import URL
+
+from app.utils.pagination import last_page, pagination_headers, pagination_links
+
+LISTING_URL = URL("http://testserver/movie/public?page=2&page_size=10&sort=-rating")
+
+
+def test_last_page():
+    """
+    Test that the last page rounds up, and is 1 for an empty listing.
+    """
+    assert last_page(0, 10) == 1
+    assert last_page(10, 10) == 1
+    assert last_page(11, 10) == 2
+
+
+def test_pagination_links_with_total():
+    """
+    Test that a numbered page links to the first, previous, next and last
+    pages, keeping the other query parameters.
+    """
+    links = pagination_links(LISTING_URL, 2, 10, total=35, next_cursor="abc")
+
+    assert links == {
+        "first": "http://testserver/movie/public?page=1&page_size=10&sort=-rating",
+        "prev": "http://testserver/movie/public?page=1&page_size=10&sort=-rating",
+        "next": "http://testserver/movie/public?page_size=10&sort=-rating&cursor=abc",
+        "last": "http://testserver/movie/public?page=4&page_size=10&sort=-rating",
+    }
+
+
+def test_pagination_links_on_last_page():
+    """
+    Test that a full last page does not link to an empty next page, and a
+    page past the end links back to the last one.
+    """
+    assert "next" not in pagination_links(LISTING_URL, 2, 10, 20, "abc")
+
+    links = pagination_links(LISTING_URL, 9, 10, total=20)
+    assert links["prev"].endswith("page=2&page_size=10&sort=-rating")
+
+
+def test_pagination_links_without_total():
+    """
+    Test that a cursor page without total only links to the first and next pages.
+    """
+    url = URL("http://testserver/movie/user?cursor=abc&min_year=2000")
+
+    links = pagination_links(url, None, 10, next_cursor="def")
+
+    assert links == {
+        "first": "http://testserver/movie/user?min_year=2000&page=1",
+        "next": "http://testserver/movie/user?cursor=def&min_year=2000",
+    }
+
+
+def test_pagination_headers():
+    """
+    Test that the total and the next cursor are only sent when known.
+    """
+    headers = pagination_headers(LISTING_URL, 2, 10, total=35, next_cursor="abc")
+
+    assert headers["X-Total-Count"] == "35"
+    assert headers["X-Next-Cursor"] == "abc"
+    assert '; rel="last"' in headers["Link"]
+
+    headers = pagination_headers(LISTING_URL, 2, 10)
+    assert "X-Total-Count" not in headers
+    assert "X-Next-Cursor" not in headers
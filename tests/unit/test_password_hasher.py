@@ -1,4 +1,12 @@
-from app.utils.password_hasher import BcryptPasswordHasher
+import time
+
+import pytest
+
+from app.utils.password_hasher import (
+    BcryptPasswordHasher,
+    PasswordHashingPool,
+    PasswordHashingPoolFullError,
+)
 
 
 class TestBcryptPasswordHasher:
@@ -48,3 +56,48 @@ class TestBcryptPasswordHasher:
         hash2 = BcryptPasswordHasher.hash_password(password)
 
         assert hash1 != hash2
+
+
+@pytest.mark.anyio
+class TestPasswordHashingPool:
+    """
+    Tests for PasswordHashingPool class.
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self, anyio_backend):
+        """
+        Initial configuration for every test.
+        """
+        self.pool = PasswordHashingPool(workers=1, queue_limit=0)
+        yield
+        self.pool.shutdown()
+
+    async def test_run_in_pool(self):
+        """
+        Test that hashing in the pool returns a verifiable hash and records stats.
+        """
+        hashed_password = await self.pool.run(
+            BcryptPasswordHasher.hash_password, "my_secure_password"
+        )
+
+        assert BcryptPasswordHasher.verify_password(
+            "my_secure_password", hashed_password
+        )
+        stats = self.pool.stats()
+        assert stats["completed"] == 1
+        assert stats["pending"] == 0
+        assert stats["max_wait_ms"] >= stats["average_wait_ms"] >= 0
+
+    async def test_run_rejects_when_queue_is_full(self):
+        """
+        Test that calls beyond workers + queue_limit fail fast with a retry hint.
+        """
+        self.pool.pending = 1
+
+        with pytest.raises(PasswordHashingPoolFullError) as exception_info:
+            await self.pool.run(time.sleep, 0)
+
+        assert exception_info.value.retry_after >= 1
+        assert self.pool.stats()["rejected"] == 1
+        assert self.pool.stats()["queue_depth"] == 0
@@ -0,0 +1,94 @@
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.utils.pool_statistics import PoolStatistics, get_pool_options
+
+
+class TestGetPoolOptions:
+    """
+    Tests for get_pool_options function.
+    """
+
+    def test_file_database_uses_timed_queue_pool(self, monkeypatch):
+        """
+        Test that file databases get a queue pool configured from the environment.
+        """
+        monkeypatch.setenv("SQL_POOL_SIZE", "3")
+        monkeypatch.setenv("SQL_MAX_OVERFLOW", "1")
+        monkeypatch.setenv("SQL_POOL_TIMEOUT", "2.5")
+        monkeypatch.setenv("SQL_POOL_PRE_PING", "true")
+        statistics = PoolStatistics()
+
+        options = get_pool_options("sqlite:///./pool.db", statistics)
+
+        assert issubclass(options["poolclass"], QueuePool)
+        assert options["poolclass"].statistics is statistics
+        assert options["pool_size"] == 3
+        assert options["max_overflow"] == 1
+        assert options["pool_timeout"] == 2.5
+        assert options["pool_pre_ping"] is True
+
+    def test_async_database_uses_async_queue_pool(self):
+        """
+        Test that the asyncio engine gets the asyncio queue pool.
+        """
+        options = get_pool_options(
+            "sqlite+aiosqlite:///./pool.db", PoolStatistics(), is_async=True
+        )
+
+        assert issubclass(options["poolclass"], AsyncAdaptedQueuePool)
+
+    def test_memory_database_keeps_default_pool(self):
+        """
+        Test that in-memory SQLite keeps its single connection pool.
+        """
+        assert get_pool_options("sqlite://", PoolStatistics()) == {}
+
+
+class TestPoolStatistics:
+    """
+    Tests for PoolStatistics class.
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch, tmp_path):
+        """
+        Creates an engine with a one connection pool and attached statistics.
+        """
+        monkeypatch.setenv("SQL_POOL_SIZE", "1")
+        monkeypatch.setenv("SQL_MAX_OVERFLOW", "0")
+        monkeypatch.setenv("SQL_POOL_TIMEOUT", "0.1")
+        url = f"sqlite:///{tmp_path / 'pool.db'}"
+        self.statistics = PoolStatistics()
+        self.engine = create_engine(url, **get_pool_options(url, self.statistics))
+        self.statistics.attach(self.engine)
+        yield
+        self.engine.dispose()
+
+    def test_records_checkouts_and_holds(self):
+        """
+        Test that each checkout and checkin is counted.
+        """
+        with self.engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            assert self.statistics.snapshot()["checked_out"] == 1
+
+        stats = self.statistics.snapshot()
+        assert stats["checkouts"] == 1
+        assert stats["checkins"] == 1
+        assert stats["checked_out"] == 0
+        assert stats["pool_size"] == 1
+
+    def test_records_timeouts(self):
+        """
+        Test that a checkout failing on an exhausted pool is counted as a timeout.
+        """
+        with self.engine.connect():
+            with pytest.raises(PoolTimeoutError):
+                self.engine.connect()
+
+        stats = self.statistics.snapshot()
+        assert stats["timeouts"] == 1
+        assert stats["max_wait_ms"] >= 100
@@ -0,0 +1,41 @@
+from app.utils.public_movie_cache import ResponseCache
+
+
+class TestResponseCache:
+    """
+    Tests for ResponseCache class.
+    """
+
+    def test_set_and_get(self):
+        """
+        Test that a response stored in the current generation is returned.
+        """
+        cache = ResponseCache(maxsize=2, ttl=60)
+        cache.set("key", b"[]", cache.generation)
+
+        assert cache.get("key") == b"[]"
+
+    def test_invalidate(self):
+        """
+        Test that invalidating drops every response and starts a new generation.
+        """
+        cache = ResponseCache(maxsize=2, ttl=60)
+        cache.set("key", b"[]", cache.generation)
+
+        cache.invalidate()
+
+        assert cache.get("key") is None
+        assert cache.stats()["generation"] == 1
+        assert cache.stats()["invalidations"] == 1
+
+    def test_stale_response_is_not_stored(self):
+        """
+        Test that a response computed before an invalidation is discarded.
+        """
+        cache = ResponseCache(maxsize=2, ttl=60)
+        generation = cache.generation
+        cache.invalidate()
+
+        cache.set("key", b"[]", generation)
+
+        assert cache.get("key") is None
@@ -1,10 +1,13 @@
 import pytest
+from sqlalchemy import inspect, text
 from sqlalchemy.orm import Session
 
+from app.models.movie import Movie
 from app.models.user import User
+from app.repositories.base_repository import In, Range, Related, Sort
 from app.repositories.sql_repository import SQLRepository
 from app.services.user_service import UserService
-from tests.testing_helper import SetupHelper
+from tests.testing_helper import SetupHelper, capture_statements
 
 
 class TestCRUDService:
@@ -117,6 +120,151 @@ class TestCRUDService:
 
         assert deleted_object is None
 
+    def test_create_objects(self):
+        """
+        Test to create several objects in one batch.
+        """
+        users_data = [
+            {
+                "first_name": f"Bulk {i}",
+                "last_name": "Doe",
+                "email": f"bulk_sql_{i}@example.com",
+                "password": self.password,
+            }
+            for i in range(3)
+        ]
+        result = self.repository.create_objects(users_data)
+
+        assert result.errors == []
+        assert [user.first_name for user in result.objects] == [
+            "Bulk 0",
+            "Bulk 1",
+            "Bulk 2",
+        ]
+        assert all(user.id for user in result.objects)
+
+    def test_create_objects_reports_failed_rows(self):
+        """
+        Test that rows refused by the database are reported and the others kept.
+        """
+        users_data = [
+            {
+                "first_name": "Valid",
+                "last_name": "Doe",
+                "email": "bulk_sql_valid@example.com",
+                "password": self.password,
+            },
+            {
+                "first_name": "Duplicated",
+                "last_name": "Doe",
+                "email": self.user_email,
+                "password": self.password,
+            },
+        ]
+        result = self.repository.create_objects(users_data)
+
+        assert [user.email for user in result.objects] == ["bulk_sql_valid@example.com"]
+        assert [(error.index, error.code) for error in result.errors] == [
+            (1, "INVALID_DATA")
+        ]
+
+    def test_update_objects(self):
+        """
+        Test to update several objects, reporting the ones not found.
+        """
+        result = self.repository.update_objects(
+            [
+                {"id": self.created_object.id, "first_name": "Bulk Updated"},
+                {"id": 0, "first_name": "Missing"},
+            ]
+        )
+
+        assert [user.first_name for user in result.objects] == ["Bulk Updated"]
+        assert [(error.index, error.code) for error in result.errors] == [
+            (1, "NOT_FOUND")
+        ]
+
+    def test_update_objects_with_filters(self):
+        """
+        Test that objects not matching the filters are not updated.
+        """
+        result = self.repository.update_objects(
+            [{"id": self.created_object.id, "first_name": "Filtered"}],
+            filters={"email": "other@example.com"},
+        )
+
+        assert result.objects == []
+        assert result.errors[0].code == "NOT_FOUND"
+
+    def test_update_matching_object(self):
+        """
+        Test that an object matching one of the filters is updated with a
+        single UPDATE ... RETURNING.
+        """
+        with capture_statements(self.db.get_bind()) as statements:
+            result = self.repository.update_matching_object(
+                self.created_object.id,
+                {"first_name": "Matched"},
+                any_filters=[
+                    {"email": "other@example.com"},
+                    {"email": self.user_email},
+                ],
+            )
+
+        assert [user.first_name for user in result.objects] == ["Matched"]
+        assert len(statements) == 1
+        assert statements[0].startswith("UPDATE user SET")
+        assert "RETURNING" in statements[0]
+
+    def test_update_matching_object_not_matching(self):
+        """
+        Test that an object matching none of the filters is not updated.
+        """
+        result = self.repository.update_matching_object(
+            self.created_object.id,
+            {"first_name": "Not Matched"},
+            any_filters=[{"email": "other@example.com"}],
+        )
+
+        assert result.objects == []
+        self.db.expire_all()
+        assert self.repository.get_object(self.created_object.id).first_name != (
+            "Not Matched"
+        )
+
+    def test_delete_matching_object(self):
+        """
+        Test that only an object matching one of the filters is deleted, with
+        a single DELETE ... RETURNING.
+        """
+        user_id = self.created_object.id
+        not_matched = self.repository.delete_matching_object(
+            user_id, any_filters=[{"email": "other@example.com"}]
+        )
+        with capture_statements(self.db.get_bind()) as statements:
+            deleted = self.repository.delete_matching_object(
+                user_id, any_filters=[{"email": self.user_email}]
+            )
+
+        assert not_matched is None
+        assert deleted.email == self.user_email
+        assert len(statements) == 1
+        assert statements[0].startswith("DELETE FROM user")
+        assert self.repository.get_object(user_id) is None
+
+    def test_delete_objects(self):
+        """
+        Test to delete several objects, reporting the ones not found.
+        """
+        user_id = self.created_object.id
+        result = self.repository.delete_objects([user_id, 0])
+
+        assert [user.id for user in result.objects] == [user_id]
+        assert [(error.index, error.code) for error in result.errors] == [
+            (1, "NOT_FOUND")
+        ]
+        assert self.repository.get_object(user_id) is None
+
     def test_get_objects_by_filters_no_filters(self):
         """
         Test to retrieve objects without any filters (all objects returned).
@@ -135,6 +283,21 @@ class TestCRUDService:
         assert len(filtered_objects) == 1
         assert filtered_objects[0].email == self.user_email
 
+    def test_get_objects_by_filters_with_fields(self):
+        """
+        Test to load only the given columns of the matching objects.
+        """
+        self.db.expunge_all()
+        filters = {"email": self.user_email}
+        filtered_objects = self.repository.get_objects_by_filters(
+            filters, fields=["email"]
+        )
+
+        state = inspect(filtered_objects[0])
+        assert filtered_objects[0].id == self.created_object.id
+        assert "email" not in state.unloaded
+        assert {"password", "first_name", "movies"} <= state.unloaded
+
     def test_get_objects_by_filters_with_pagination(self):
         """
         Test to retrieve objects with pagination (offset and limit).
@@ -155,6 +318,136 @@ class TestCRUDService:
         )
         assert len(paginated_objects) == 3
 
+    def test_get_objects_by_filters_with_keyset_pagination(self):
+        """
+        Test to retrieve objects after a given id (keyset pagination).
+        """
+        for i in range(1, 4):
+            self.repository.create_object(
+                {
+                    "first_name": f"Keyset{i}",
+                    "last_name": f"Test{i}",
+                    "email": f"keyset_{i}@example.com",
+                    "password": "password123",
+                }
+            )
+
+        first_page = self.repository.get_objects_by_filters({}, limit=2)
+        next_page = self.repository.get_objects_by_filters(
+            {}, limit=2, after=first_page[-1].id
+        )
+
+        assert [obj.id for obj in first_page] == sorted(obj.id for obj in first_page)
+        assert len(next_page) == 2
+        assert all(obj.id > first_page[-1].id for obj in next_page)
+
+    def test_get_objects_by_filters_sorted_with_keyset_pagination(self):
+        """
+        Test that a sorted listing with In filters resumes after the last
+        (sort value, id) seen, ties in the sort direction.
+        """
+        emails = [f"sorted_{i}@example.com" for i in range(3)]
+        for email, last_name in zip(emails, ["Same", "Same", "Other"]):
+            self.repository.create_object(
+                {
+                    "first_name": "Sorted",
+                    "last_name": last_name,
+                    "email": email,
+                    "password": "password123",
+                }
+            )
+        filters = {"email": In(tuple(emails))}
+        sort = Sort("last_name", descending=True)
+
+        first_page = self.repository.get_objects_by_filters(filters, limit=2, sort=sort)
+        last = first_page[-1]
+        next_page = self.repository.get_objects_by_filters(
+            filters, sort=sort, after=(last.last_name, last.id)
+        )
+
+        assert [obj.email for obj in first_page] == [emails[1], emails[0]]
+        assert [obj.email for obj in next_page] == [emails[2]]
+
+    def test_get_objects_by_filters_with_range(self):
+        """
+        Test that a Range filter bounds the values on both sides.
+        """
+        users = self.repository.get_objects_by_filters(
+            {"id": Range(gte=self.created_object.id, lte=self.created_object.id)}
+        )
+
+        assert [obj.id for obj in users] == [self.created_object.id]
+
+    def test_is_valid_id(self):
+        """
+        Test that only integers are ids of the SQL backend.
+        """
+        assert self.repository.is_valid_id(self.created_object.id)
+        for object_id in ("1", True, [1], None):
+            assert not self.repository.is_valid_id(object_id)
+
+    def test_get_objects_by_filters_sorted_across_nulls(self):
+        """
+        Test that sorted pages continue past NULL values, which sort first
+        in ascending order and last in descending order.
+        """
+        movie_repository = SQLRepository[Movie](db=self.db, model=Movie)
+        ids = [
+            movie_repository.create_object(
+                {
+                    "title": f"Nullable {rating}",
+                    "description": "Description",
+                    "publication_year": 1111,
+                    "genre": "DRAMA",
+                    "rating": rating,
+                    "is_public": False,
+                    "user_id": self.created_object.id,
+                }
+            ).id
+            for rating in (None, 5.0, None, 7.0)
+        ]
+        filters = {"publication_year": 1111}
+
+        try:
+            for sort, expected in (
+                (Sort("rating"), [ids[0], ids[2], ids[1], ids[3]]),
+                (Sort("rating", descending=True), [ids[3], ids[1], ids[2], ids[0]]),
+            ):
+                seen, after = [], None
+                while True:
+                    page = movie_repository.get_objects_by_filters(
+                        filters, limit=1, sort=sort, after=after
+                    )
+                    if not page:
+                        break
+                    seen.append(page[0].id)
+                    after = (page[0].rating, page[0].id)
+
+                assert seen == expected
+        finally:
+            movie_repository.delete_objects(ids)
+
+    def test_get_object_batches(self):
+        """
+        Test that every matching object is yielded in id order, in batches.
+        """
+        all_ids = [user.id for user in self.repository.get_objects_by_filters({})]
+
+        batches = list(self.repository.get_object_batches({}, batch_size=2))
+
+        assert all(len(batch) <= 2 for batch in batches)
+        assert [user.id for batch in batches for user in batch] == all_ids
+
+    def test_get_object_batches_after(self):
+        """
+        Test that batches start after the given id.
+        """
+        batches = self.repository.get_object_batches({}, after=self.created_object.id)
+
+        assert all(
+            user.id > self.created_object.id for batch in batches for user in batch
+        )
+
     def test_get_objects_by_filters_empty_result(self):
         """
         Test to retrieve objects that match filters but return no results.
@@ -163,3 +456,92 @@ class TestCRUDService:
         filtered_objects = self.repository.get_objects_by_filters(filters)
 
         assert len(filtered_objects) == 0
+
+    def test_missing_indexes_after_ensure(self):
+        """
+        Test that all declared indexes exist once they are ensured.
+        """
+        movie_repository = SQLRepository[Movie](db=self.db, model=Movie)
+        movie_repository.ensure_indexes()
+        self.repository.ensure_indexes()
+
+        assert movie_repository.missing_indexes() == []
+        assert self.repository.missing_indexes() == []
+
+    def test_missing_indexes_reports_dropped_index(self):
+        """
+        Test that a dropped index is reported as missing and created again.
+        """
+        movie_repository = SQLRepository[Movie](db=self.db, model=Movie)
+        self.db.execute(text("DROP INDEX IF EXISTS ix_movie_public_id"))
+        self.db.commit()
+
+        assert movie_repository.missing_indexes() == ["ix_movie_public_id"]
+
+        movie_repository.ensure_indexes()
+        assert movie_repository.missing_indexes() == []
+
+    def test_missing_full_text_search_is_rebuilt(self):
+        """
+        Test that a missing search table is reported, then created with the
+        movies that already exist.
+        """
+        movie_repository = SQLRepository[Movie](db=self.db, model=Movie)
+        movie = movie_repository.create_object(
+            {
+                "title": "Rebuiltsearchword",
+                "description": "Indexed before the search table existed",
+                "publication_year": 2000,
+                "genre": "DRAMA",
+                "rating": 5.0,
+                "is_public": True,
+            }
+        )
+        self.db.execute(text("DROP TABLE movie_fts"))
+        self.db.commit()
+
+        assert movie_repository.missing_indexes() == ["movie_fts"]
+
+        movie_repository.ensure_indexes()
+        results = movie_repository.search_objects("rebuiltsearchword")
+        assert movie_repository.missing_indexes() == []
+        assert [obj.id for obj, _ in results] == [movie.id]
+
+    def test_movie_owner_loaded_on_request(self):
+        """
+        Test that listings do not load the owner of the movies unless asked,
+        with one more query (selectin) or a join (joined).
+        """
+        movie_repository = SQLRepository[Movie](db=self.db, model=Movie)
+        movie = movie_repository.create_object(
+            {
+                "title": "Owned",
+                "description": "Description",
+                "publication_year": 2000,
+                "genre": "DRAMA",
+                "rating": 5.0,
+                "is_public": False,
+                "user_id": self.created_object.id,
+            }
+        )
+        filters = {"user_id": self.created_object.id}
+        engine = self.db.get_bind()
+
+        try:
+            for related, queries, joined in (
+                ((), 1, False),
+                ((Related("user"),), 2, False),
+                ((Related("user", "joined"),), 1, True),
+            ):
+                self.db.expunge_all()
+                with capture_statements(engine) as statements:
+                    movies = movie_repository.get_objects_by_filters(
+                        filters, related=related
+                    )
+                    owner = movies[0].user
+
+                assert len(statements) == queries
+                assert ("JOIN" in statements[0]) is joined
+                assert (owner is not None) is bool(related)
+        finally:
+            movie_repository.delete_object(movie.id)
@@ -0,0 +1,95 @@
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.services.time_service import (
+    UnknownTimeZoneError,
+    build_time_data,
+    fetch_zone_offset,
+    format_utc_offset,
+    get_local_time_data,
+    parse_utc_offset,
+    time_zone_cache,
+)
+
+
+class TestTimeService:
+    """
+    Tests for the time service functions.
+    """
+
+    def test_parse_and_format_utc_offset(self):
+        """
+        Test the conversion between "+HH:MM" offsets and timedeltas.
+        """
+        assert parse_utc_offset("-04:30") == -timedelta(hours=4, minutes=30)
+        assert parse_utc_offset("+05:45") == timedelta(hours=5, minutes=45)
+        assert format_utc_offset(-timedelta(hours=4, minutes=30)) == "-04:30"
+        assert format_utc_offset(timedelta(0)) == "+00:00"
+
+    def test_build_time_data(self):
+        """
+        Test that the local datetime is computed from the offset.
+        """
+        now = datetime(2025, 1, 13, 5, 40, 51, 245747, tzinfo=timezone.utc)
+
+        assert build_time_data(timedelta(hours=-4), now) == {
+            "datetime": "2025-01-13T01:40:51.245747-04:00",
+            "utc_datetime": "2025-01-13T05:40:51.245747+00:00",
+            "utc_offset": "-04:00",
+        }
+
+    @pytest.mark.anyio
+    async def test_offset_cached_until_dst_transition(self):
+        """
+        Test that a zone offset is not cached past its next DST transition.
+        """
+        dst_until = datetime.fromtimestamp(time.time() + 10, timezone.utc)
+        time_data = {"utc_offset": "-04:00", "dst_until": dst_until.isoformat()}
+        with patch(
+            "app.services.time_service.get_with_retry_async",
+            new=AsyncMock(return_value=time_data),
+        ):
+            assert await fetch_zone_offset("America/New_York") == timedelta(hours=-4)
+
+        with patch(
+            "app.utils.ttl_cache.time.time", return_value=dst_until.timestamp() + 1
+        ):
+            assert time_zone_cache.get("America/New_York") is None
+
+    @pytest.mark.anyio
+    async def test_offset_cached_until_transition_without_dst_until(self):
+        """
+        Test that in standard time, when the API sends no dst_until, the
+        offset still expires at the next transition of the tz database.
+        """
+        transition = datetime(2025, 3, 9, 7, tzinfo=timezone.utc).timestamp()
+        time_data = {"utc_offset": "-05:00", "dst_until": None}
+        with patch("time.time", return_value=transition - 100), patch(
+            "app.services.time_service.get_with_retry_async",
+            new=AsyncMock(return_value=time_data),
+        ):
+            assert await fetch_zone_offset("America/New_York") == timedelta(hours=-5)
+            assert time_zone_cache.get("America/New_York") == timedelta(hours=-5)
+
+        with patch("time.time", return_value=transition + 1):
+            assert time_zone_cache.get("America/New_York") is None
+
+    def test_local_time_data_follows_dst(self):
+        """
+        Test that the local engine applies the DST rules of the zone.
+        """
+        winter = datetime(2025, 1, 13, 12, tzinfo=timezone.utc)
+        summer = datetime(2025, 7, 13, 12, tzinfo=timezone.utc)
+
+        assert get_local_time_data("America/New_York", winter)["utc_offset"] == "-05:00"
+        assert get_local_time_data("America/New_York", summer)["utc_offset"] == "-04:00"
+
+    def test_local_time_data_unknown_zone(self):
+        """
+        Test that zones missing from the tz database raise UnknownTimeZoneError.
+        """
+        with pytest.raises(UnknownTimeZoneError):
+            get_local_time_data("../../etc/passwd")
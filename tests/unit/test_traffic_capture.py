@@ -0,0 +1,129 @@
+import json
+
+from app.utils.traffic_capture import (
+    REDACTED,
+    TrafficCapture,
+    sanitize_body,
+    sanitize_headers,
+)
+
+
+class TestTrafficCapture:
+    """
+    Tests for the traffic capture helpers and writer.
+    """
+
+    def test_sanitize_headers(self):
+        """
+        Test that credentials are redacted and the auth scheme is kept.
+        """
+        headers = sanitize_headers(
+            [
+                (b"Authorization", b"Bearer token"),
+                (b"Cookie", b"session=1"),
+                (b"Accept", b"application/json"),
+            ]
+        )
+
+        assert headers == {
+            "authorization": f"Bearer {REDACTED}",
+            "cookie": REDACTED,
+            "accept": "application/json",
+        }
+
+    def test_sanitize_json_body(self):
+        """
+        Test that sensitive fields of JSON bodies are redacted at any depth.
+        """
+        body = json.dumps({"email": "a@b.com", "user": {"password": "secret"}})
+
+        text, encoding = sanitize_body(body.encode(), "application/json")
+
+        assert encoding == "utf-8"
+        assert json.loads(text) == {"email": "a@b.com", "user": {"password": REDACTED}}
+
+    def test_sanitize_form_body(self):
+        """
+        Test that sensitive fields of form bodies are redacted.
+        """
+        text, _ = sanitize_body(
+            b"username=a%40b.com&password=secret",
+            "application/x-www-form-urlencoded",
+        )
+
+        assert "secret" not in text
+        assert "username=a%40b.com" in text
+
+    def test_sanitize_binary_body(self):
+        """
+        Test that bodies that are not text are kept as base64.
+        """
+        _, encoding = sanitize_body(b"\xff\xfe", "application/octet-stream")
+
+        assert encoding == "base64"
+
+    def test_records_are_written(self, tmp_path):
+        """
+        Test that queued records are written as JSON lines on close.
+        """
+        path = tmp_path / "capture.jsonl"
+        capture = TrafficCapture(str(path))
+
+        capture.record({"path": "/movie/public"})
+        capture.record({"path": "/movie/user"})
+        capture.close()
+
+        lines = path.read_text().splitlines()
+        assert [json.loads(line)["path"] for line in lines] == [
+            "/movie/public",
+            "/movie/user",
+        ]
+        assert capture.stats()["captured"] == 2
+
+    def test_disabled_without_path(self):
+        """
+        Test that no request is sampled when there is no capture path.
+        """
+        capture = TrafficCapture(None)
+
+        assert not capture.should_capture()
+
+    def test_sample_rate(self, tmp_path):
+        """
+        Test that a zero sample rate disables the capture.
+        """
+        capture = TrafficCapture(str(tmp_path / "capture.jsonl"), sample_rate=0)
+
+        assert not capture.should_capture()
+
+    def test_full_queue_drops_records(self, tmp_path):
+        """
+        Test that records arriving while the queue is full are dropped.
+        """
+        capture = TrafficCapture(str(tmp_path / "capture.jsonl"), queue_size=1)
+        capture._start = lambda: None
+
+        capture.record({"path": "/a"})
+        capture.record({"path": "/b"})
+
+        assert capture.stats()["captured"] == 1
+        assert capture.stats()["dropped"] == 1
+
+    def test_unwritable_path_disables_capture(self, tmp_path):
+        """
+        Test that a capture file that cannot be opened is counted as a write
+        error and stops the sampling, instead of filling the queue.
+        """
+        capture = TrafficCapture(str(tmp_path / "missing" / "capture.jsonl"))
+
+        capture.record({"path": "/a"})
+        capture._thread.join()
+        capture.record({"path": "/b"})
+        capture.close()
+
+        stats = capture.stats()
+        assert stats["write_errors"] == 1
+        assert stats["dropped"] == 2
+        assert stats["queue_depth"] == 0
+        assert not stats["enabled"]
+        assert not capture.should_capture()
@@ -0,0 +1,81 @@
+import time
+from unittest.mock import patch
+
+from app.utils.ttl_cache import TTLCache
+
+
+class TestTTLCache:
+    """
+    Tests for TTLCache class.
+    """
+
+    def test_get_and_set(self):
+        """
+        Test that a stored value is returned and counted as a hit.
+        """
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("key", "value")
+
+        assert cache.get("key") == "value"
+        assert cache.get("missing") is None
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+        assert cache.stats()["hit_ratio"] == 0.5
+
+    def test_entry_expires_after_ttl(self):
+        """
+        Test that entries are not returned after the ttl.
+        """
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("key", "value")
+
+        with patch("app.utils.ttl_cache.time.time", return_value=time.time() + 61):
+            assert cache.get("key") is None
+        assert cache.stats()["size"] == 0
+
+    def test_entry_expires_at_given_time(self):
+        """
+        Test that an explicit expiration earlier than the ttl wins.
+        """
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("key", "value", expires_at=time.time() - 1)
+
+        assert cache.get("key") is None
+
+    def test_least_recently_used_is_evicted(self):
+        """
+        Test that the least recently used entry is evicted when the cache is full.
+        """
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("first", 1)
+        cache.set("second", 2)
+        cache.get("first")
+        cache.set("third", 3)
+
+        assert cache.get("first") == 1
+        assert cache.get("second") is None
+        assert cache.get("third") == 3
+
+    def test_invalidate_and_clear(self):
+        """
+        Test that invalidated and cleared entries are removed.
+        """
+        cache = TTLCache(maxsize=3, ttl=60)
+        cache.set("first", 1)
+        cache.set("second", 2)
+
+        cache.invalidate("first")
+        assert cache.get("first") is None
+        assert cache.get("second") == 2
+
+        cache.clear()
+        assert cache.stats()["size"] == 0
+
+    def test_disabled_cache(self):
+        """
+        Test that a cache with maxsize 0 stores nothing.
+        """
+        cache = TTLCache(maxsize=0, ttl=60)
+        cache.set("key", "value")
+
+        assert cache.get("key") is None
@@ -1,6 +1,7 @@
 import pytest
 from sqlalchemy.orm import Session
 
+from app.schemas.user import UserIdentity
 from app.services.user_service import UserService
 from tests.testing_helper import SetupHelper
 
@@ -36,3 +37,15 @@ class TestUserService:
         """
         result = self.user_service.get_user_by_email("nonexistent@example.com")
         assert result is None
+
+    def test_get_user_identity(self):
+        """
+        Test to verify that the identity of a user is returned without its password.
+        """
+        result = self.user_service.get_user_identity(self.user_email)
+
+        assert isinstance(result, UserIdentity)
+        assert result.id == self.created_user.id
+        assert result.email == self.user_email
+        assert "password" not in result.model_dump()
+        assert self.user_service.get_user_identity("nonexistent@example.com") is None